@@ -0,0 +1,46 @@
+"""add_subscription_usage_events
+
+Revision ID: 2e6a9c4f8b15
+Revises: 6b1e8d3f5a27
+Create Date: 2026-03-13 10:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2e6a9c4f8b15"
+down_revision: Union[str, None] = "6b1e8d3f5a27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "subscription_usage_events",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("subscription_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("used_at", sa.DateTime(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["subscription_id"], ["subscriptions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_subscription_usage_events_user_used_at",
+        "subscription_usage_events",
+        ["user_id", "used_at", "subscription_id"],
+        unique=False,
+    )
+    # No backfill: existing counters have no dates, and events stamped at
+    # migration time would count as recent use in every window. usage_count
+    # keeps those earlier uses; the log starts empty.
+
+
+def downgrade() -> None:
+    op.drop_index("ix_subscription_usage_events_user_used_at", table_name="subscription_usage_events")
+    op.drop_table("subscription_usage_events")
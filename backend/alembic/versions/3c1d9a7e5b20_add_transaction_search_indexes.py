@@ -0,0 +1,68 @@
+"""add_transaction_search_indexes
+
+Revision ID: 3c1d9a7e5b20
+Revises: 1f2b6f8c0e11
+Create Date: 2026-03-02 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1d9a7e5b20"
+down_revision: Union[str, None] = "1f2b6f8c0e11"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_FTS_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.rowid, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+    "VALUES ('delete', old.rowid, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_au AFTER UPDATE OF description ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+    "VALUES ('delete', old.rowid, old.description); "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.rowid, new.description); END",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # CONCURRENTLY cannot run inside a transaction and keeps the table
+        # writable while the indexes build.
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_description_trgm "
+                "ON transactions USING gin (description gin_trgm_ops)"
+            )
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_description_tsv "
+                "ON transactions USING gin (to_tsvector('simple', coalesce(description, '')))"
+            )
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts "
+            "USING fts5(description, content='transactions', tokenize='trigram')"
+        )
+        for statement in SQLITE_FTS_TRIGGERS:
+            op.execute(statement)
+        op.execute("INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_description_tsv")
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_description_trgm")
+    elif dialect == "sqlite":
+        for trigger in ("transactions_fts_au", "transactions_fts_ad", "transactions_fts_ai"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS transactions_fts")
@@ -0,0 +1,74 @@
+"""add_timeline_event_index
+
+Revision ID: 4d7f9a2c6e13
+Revises: 9b3e5d7f1a24
+Create Date: 2026-03-11 10:15:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d7f9a2c6e13"
+down_revision: Union[str, None] = "9b3e5d7f1a24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "timeline_events",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("event_date", sa.Date(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("sort_at", sa.DateTime(), nullable=False),
+        sa.Column("source_type", sa.String(), nullable=False),
+        sa.Column("source_id", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("amount", sa.Numeric(14, 2), nullable=False),
+        sa.Column("is_automatic", sa.Boolean(), nullable=False),
+        sa.Column("category_id", sa.String(), nullable=True),
+        sa.Column("transaction_type", sa.String(), nullable=True),
+        sa.Column("details", sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_timeline_events_user_window",
+        "timeline_events",
+        ["user_id", "event_date", "event_type", "sort_at", "id"],
+        unique=False,
+    )
+    op.create_table(
+        "timeline_index_state",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("recurring_from", sa.Date(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    # Backfill the transaction rows; recurring rows are expanded on first read.
+    op.execute(
+        """
+        INSERT INTO timeline_events
+            (id, user_id, event_date, event_type, sort_at, source_type, source_id,
+             title, amount, is_automatic, category_id, transaction_type)
+        SELECT 'TRANSACTION:' || id, user_id, date(occurred_at), 'TRANSACTION', occurred_at,
+               'TRANSACTION', id,
+               CASE WHEN COALESCE(description, '') = '' THEN 'Transaction' ELSE description END,
+               CASE WHEN type = 'EXPENSE' THEN -amount ELSE amount END,
+               false, category_id, type
+        FROM transactions
+        WHERE user_id IS NOT NULL AND occurred_at IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("timeline_index_state")
+    op.drop_index("ix_timeline_events_user_window", table_name="timeline_events")
+    op.drop_table("timeline_events")
@@ -0,0 +1,49 @@
+"""add_categorization_rules_table
+
+Revision ID: 5e8b2f4a7c31
+Revises: 3c1d9a7e5b20
+Create Date: 2026-03-04 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8b2f4a7c31"
+down_revision: Union[str, None] = "3c1d9a7e5b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "categorization_rules",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("category_id", sa.String(), nullable=False),
+        sa.Column("match_type", sa.String(), nullable=False),
+        sa.Column("pattern", sa.String(), nullable=True),
+        sa.Column("min_amount", sa.Numeric(precision=14, scale=2), nullable=True),
+        sa.Column("max_amount", sa.Numeric(precision=14, scale=2), nullable=True),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["category_id"], ["budget_categories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_categorization_rules_user_id"),
+        "categorization_rules",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_categorization_rules_user_id"), table_name="categorization_rules")
+    op.drop_table("categorization_rules")
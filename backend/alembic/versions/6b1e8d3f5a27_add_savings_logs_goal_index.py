@@ -0,0 +1,31 @@
+"""add_savings_logs_goal_index
+
+Revision ID: 6b1e8d3f5a27
+Revises: 4d7f9a2c6e13
+Create Date: 2026-03-12 14:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6b1e8d3f5a27"
+down_revision: Union[str, None] = "4d7f9a2c6e13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_savings_logs_goal_id_created_at",
+        "savings_logs",
+        ["goal_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_savings_logs_goal_id_created_at", table_name="savings_logs")
@@ -0,0 +1,30 @@
+"""add_user_data_version
+
+Revision ID: 7a4c6e1d9f02
+Revises: 5e8b2f4a7c31
+Create Date: 2026-03-06 10:15:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a4c6e1d9f02"
+down_revision: Union[str, None] = "5e8b2f4a7c31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("data_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "data_version")
@@ -0,0 +1,62 @@
+"""add_materialized_ledger_tables
+
+Revision ID: 9b3e5d7f1a24
+Revises: 7a4c6e1d9f02
+Create Date: 2026-03-09 09:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3e5d7f1a24"
+down_revision: Union[str, None] = "7a4c6e1d9f02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SIGNED_AMOUNT = "CASE type WHEN 'INCOME' THEN amount WHEN 'EXPENSE' THEN -amount ELSE 0 END"
+LEDGER_DAY = "date(COALESCE(occurred_at, created_at))"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_balances",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("balance", sa.Numeric(14, 2), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_table(
+        "ledger_daily_net",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("net", sa.Numeric(14, 2), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "day"),
+    )
+
+    # Backfill from the existing transactions.
+    op.execute(
+        f"""
+        INSERT INTO ledger_daily_net (user_id, day, net)
+        SELECT user_id, {LEDGER_DAY}, SUM({SIGNED_AMOUNT})
+        FROM transactions
+        GROUP BY user_id, {LEDGER_DAY}
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO user_balances (user_id, balance, updated_at)
+        SELECT user_id, SUM({SIGNED_AMOUNT}), CURRENT_TIMESTAMP
+        FROM transactions
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ledger_daily_net")
+    op.drop_table("user_balances")
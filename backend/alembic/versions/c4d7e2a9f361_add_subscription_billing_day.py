@@ -0,0 +1,28 @@
+"""add_subscription_billing_day
+
+Revision ID: c4d7e2a9f361
+Revises: 8f3a6c1d2b47
+Create Date: 2026-03-16 10:15:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d7e2a9f361"
+down_revision: Union[str, None] = "8f3a6c1d2b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Left NULL for existing rows: their schedule keeps next_billing_date's day.
+    op.add_column("subscriptions", sa.Column("billing_day", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("subscriptions", "billing_day")
@@ -1,37 +1,149 @@
-from typing import Generator, Annotated
-from fastapi import Depends, HTTPException, status
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated, Optional
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from jose import JWTError
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.core import security
+from app.core.cache import CachedResponse, ConditionalGet, get_response_cache
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.revocation import get_revocation_list
 from app.models.user import User
 from app.schemas.auth import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)]
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """The caller, as asserted by a verified, unrevoked access token."""
+
+    id: str
+    email: Optional[str]
+    session_id: Optional[str]
+    token_id: str
+    issued_at: float
+    expires_at: int
+
+
+async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> AuthenticatedUser:
+    """
+    Verify the access token and check it against the revocation list; no
+    database access. Use ``get_current_user_record`` when the row is needed.
+    """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[security.ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-        token_data = TokenPayload(sub=user_id)
-    except JWTError:
+        payload = security.decode_access_token(token)
+        token_data = TokenPayload(**payload)
+    except (JWTError, ValidationError):
+        raise credentials_exception
+    if await get_revocation_list().is_revoked(token_data.jti, token_data.sub, token_data.iat):
         raise credentials_exception
-    
-    result = await db.execute(select(User).filter(User.id == token_data.sub))
+    return AuthenticatedUser(
+        id=token_data.sub,
+        email=token_data.email,
+        session_id=token_data.sid,
+        token_id=token_data.jti,
+        issued_at=token_data.iat,
+        expires_at=token_data.exp,
+    )
+
+
+async def get_current_user_record(
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """The caller's ``User`` row, for endpoints that read or change the profile."""
+    result = await db.execute(select(User).filter(User.id == current_user.id))
     user = result.scalars().first()
-    if user is None:
+    if user is None or not user.is_active:
         raise credentials_exception
     return user
+
+
+async def get_data_version(
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> int:
+    """The caller's ``data_version`` (one primary-key lookup of one column)."""
+    data_version = await db.scalar(select(User.data_version).where(User.id == current_user.id))
+    if data_version is None:
+        raise credentials_exception
+    return data_version
+
+
+async def get_read_data_version(
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> Optional[int]:
+    """
+    The caller's ``data_version`` as seen by the read session, or None when a
+    lagging replica does not have the user's row yet.
+    """
+    return await db.scalar(select(User.data_version).where(User.id == current_user.id))
+
+
+def _query_key(request: Request) -> str:
+    return "&".join(f"{name}={value}" for name, value in sorted(request.query_params.multi_items()))
+
+
+def cached_response(namespace: str, *, read_replica: bool = False):
+    """
+    Dependency factory for the per-user response cache.
+
+    The key covers the endpoint, user, data version, UTC date (for "today"
+    dependent figures) and query string. Endpoints that compute the body from
+    ``get_read_db`` pass ``read_replica=True`` so the version comes from the
+    same session as the body: a lagging replica then keys its (older) body
+    under its own older version, never under the primary's newer one.
+    """
+    version_dependency = get_read_data_version if read_replica else get_data_version
+
+    async def dependency(
+        request: Request,
+        current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+        data_version: Annotated[Optional[int], Depends(version_dependency)],
+    ) -> CachedResponse:
+        key = (
+            f"{namespace}:{current_user.id}:{data_version}:"
+            f"{datetime.utcnow().date().isoformat()}:{_query_key(request)}"
+        )
+        return CachedResponse(get_response_cache() if data_version is not None else None, key)
+
+    return dependency
+
+
+def conditional_get(namespace: str):
+    """
+    Dependency factory for ETag-validated list reads.
+
+    Sets ``ETag``/``Cache-Control`` on the endpoint's response; the endpoint
+    returns ``not_modified()`` early when ``matches`` is true.
+    """
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+        data_version: Annotated[int, Depends(get_data_version)],
+    ) -> ConditionalGet:
+        conditional = ConditionalGet(
+            namespace,
+            current_user.id,
+            data_version,
+            _query_key(request),
+            request.headers.get("if-none-match"),
+        )
+        response.headers.update(conditional.headers)
+        return conditional
+
+    return dependency
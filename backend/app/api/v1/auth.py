@@ -1,5 +1,4 @@
 from typing import Any, Annotated
-from datetime import timedelta
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
@@ -12,7 +11,8 @@ from app.core.config import settings
 from app.core.middleware import limiter
 from app.core.database import get_db
 from app.models.user import User
-from app.schemas.auth import UserCreate, UserResponse, Token
+from app.schemas.auth import RefreshRequest, UserCreate, UserResponse, Token
+from app.services.auth_tokens import InvalidRefreshToken, TokenService
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -43,17 +43,11 @@ async def create_user(
             is_active=True
         )
         db.add(user)
+        await db.flush()
+        tokens = await TokenService.issue(db, user)
         await db.commit()
-        await db.refresh(user)
         logger.info("User created successfully")
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        return {
-            "access_token": security.create_access_token(
-                user.id,
-                expires_delta=access_token_expires
-            ),
-            "token_type": "bearer",
-        }
+        return tokens
     except Exception as e:
         logger.exception("Error creating user")
         await db.rollback()
@@ -81,18 +75,44 @@ async def login_access_token(
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
         
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return {
-        "access_token": security.create_access_token(
-            user.id,
-            expires_delta=access_token_expires
-        ),
-        "token_type": "bearer",
-    }
+    tokens = await TokenService.issue(db, user)
+    await db.commit()
+    return tokens
+
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(
+    refresh_in: RefreshRequest,
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Any:
+    """
+    Exchange a refresh token for a new access/refresh pair. Each refresh
+    token works once; replaying a used one ends its session.
+    """
+    try:
+        return await TokenService.rotate(db, refresh_in.refresh_token)
+    except InvalidRefreshToken:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+@router.post("/logout")
+async def logout(
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Any:
+    """
+    End this session: revoke its refresh tokens and the presented access token.
+    """
+    await TokenService.logout(
+        db, current_user.id, current_user.session_id, current_user.token_id, current_user.expires_at
+    )
+    return {"message": "Logged out"}
 
 @router.get("/me", response_model=UserResponse)
 async def read_users_me(
-    current_user: Annotated[User, Depends(deps.get_current_user)]
+    current_user: Annotated[User, Depends(deps.get_current_user_record)]
 ) -> Any:
     """
     Get current user.
@@ -1,14 +1,18 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.cache import CachedResponse
 from app.core.config import settings
-from app.core.database import get_db
-from app.models.user import User
+from app.core.database import get_db, get_read_db
+from app.core.responses import ORJSONResponse, validated_json_response
 from app.services.autopilot import AutopilotService
+from app.services.forecast import ForecastService
+from app.services.timeline import TimelineService
 
 router = APIRouter()
 
@@ -31,6 +35,24 @@ class TimelineEventResponse(BaseModel):
     events: list[dict]
     today: str
     summary: dict
+    next_cursor: Optional[str] = None
+
+
+class CashFlowForecastResponse(BaseModel):
+    """Daily balance percentile bands from the Monte Carlo forecast"""
+
+    generated_at: datetime
+    start_date: str
+    horizon_days: int
+    scenarios: int
+    current_balance: float
+    dates: list[str]
+    scheduled_net: list[float]
+    bands: dict[str, list[float]]
+    end_balance: dict[str, float]
+    probability_below_zero: float
+    median_min_balance: float
+    model: dict
 
 
 class SalaryRuleEngineResponse(BaseModel):
@@ -45,6 +67,10 @@ class SalaryRuleEngineResponse(BaseModel):
     warnings: list[str]
 
 
+safe_to_spend_daily_adapter = TypeAdapter(DailySafeToSpendResponse)
+salary_rule_engine_adapter = TypeAdapter(SalaryRuleEngineResponse)
+
+
 class PaymentOrderListResponse(BaseModel):
     items: list[dict]
 
@@ -65,18 +91,25 @@ class PaymentCancelRequest(BaseModel):
 @router.get("/safe-to-spend-daily", response_model=DailySafeToSpendResponse)
 async def get_daily_safe_to_spend(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    cache: Annotated[CachedResponse, Depends(deps.cached_response("autopilot.safe_to_spend_daily"))],
 ):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
     data = await AutopilotService.calculate_daily_safe_spend(db, current_user.id)
-    return data
+    return await cache.store(validated_json_response(safe_to_spend_daily_adapter, data))
 
 
 @router.get("/timeline", response_model=TimelineEventResponse)
 async def get_timeline(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    read_db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     days_past: int = Query(default=7, ge=0, le=90),
     days_future: int = Query(default=30, ge=1, le=365),
+    cursor: Optional[str] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=500),
 ):
     """
     Get financial timeline - past transactions and future projections.
@@ -91,17 +124,55 @@ async def get_timeline(
     Query Parameters:
     - days_past: Number of days of history to show (default: 7)
     - days_future: Number of days ahead to project (default: 30)
+    - limit: Page size; without it the whole window is returned
+    - cursor: ``next_cursor`` from the previous page
     """
-    data = await AutopilotService.get_timeline_events(
-        db, current_user.id, days_past, days_future
+    # Payment orders and the recurring timeline rows are written on the
+    # primary; the timeline itself is a read.
+    await AutopilotService.prepare_payment_orders(
+        db,
+        current_user.id,
+        days_ahead=days_future,
+        commit=True,
     )
-    return data
+    await TimelineService.ensure_recurring(db, current_user.id)
+    try:
+        data = await TimelineService.get_window(
+            read_db, current_user.id, days_past=days_past, days_future=days_future, cursor=cursor, limit=limit
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return ORJSONResponse(data)
+
+
+@router.get("/forecast", response_model=CashFlowForecastResponse)
+async def get_forecast(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    cache: Annotated[CachedResponse, Depends(deps.cached_response("autopilot.forecast", read_replica=True))],
+    horizon_days: int = Query(default=90, ge=1, le=365),
+    scenarios: int = Query(default=5000, ge=100, le=10000),
+):
+    """
+    Project the daily balance over ``horizon_days``.
+
+    Scheduled salary, bills, subscriptions and goal contributions are combined
+    with ``scenarios`` simulated paths of discretionary spend, resampled from
+    the last 90 days. ``bands`` holds the p5/p25/p50/p75/p95 balance per day in
+    ``dates``; ``probability_below_zero`` is the share of paths that dip below
+    zero at some point.
+    """
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+    data = await ForecastService.get_forecast(db, current_user.id, horizon_days=horizon_days, scenarios=scenarios)
+    return await cache.store(ORJSONResponse(data))
 
 
 @router.get("/payments", response_model=PaymentOrderListResponse)
 async def list_payment_orders(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     status: str | None = Query(default=None),
     limit: int = Query(default=100, ge=1, le=200),
 ):
@@ -117,7 +188,7 @@ async def list_payment_orders(
 @router.post("/payments/prepare", response_model=PaymentPrepareResponse)
 async def prepare_payment_orders(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     days_ahead: int = Query(default=settings.AUTOPILOT_PAYMENT_PREPARE_DAYS, ge=0, le=90),
 ):
     items = await AutopilotService.prepare_payment_orders(
@@ -133,7 +204,7 @@ async def approve_payment_order(
     payment_id: str,
     payload: PaymentApproveRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
 ):
     order = await AutopilotService.approve_payment_order(
         db,
@@ -150,7 +221,7 @@ async def approve_payment_order(
 async def execute_payment_order(
     payment_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
 ):
     order = await AutopilotService.execute_payment_order(
         db,
@@ -167,7 +238,7 @@ async def cancel_payment_order(
     payment_id: str,
     payload: PaymentCancelRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
 ):
     order = await AutopilotService.cancel_payment_order(
         db,
@@ -183,7 +254,7 @@ async def cancel_payment_order(
 @router.post("/payments/execute-due", response_model=dict)
 async def execute_due_payments(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
 ):
     # Executes only current user's already-approved due payments.
     orders = await AutopilotService.list_payment_orders(db, current_user.id, status="approved", limit=200)
@@ -207,7 +278,8 @@ async def execute_due_payments(
 @router.get("/salary-rule-engine", response_model=SalaryRuleEngineResponse)
 async def get_salary_rule_engine(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    cache: Annotated[CachedResponse, Depends(deps.cached_response("autopilot.salary_rule_engine"))],
     salary_override: float | None = Query(default=None, ge=0),
     free_money_min_percent: float = Query(default=20.0, ge=0, le=80),
 ):
@@ -217,9 +289,13 @@ async def get_salary_rule_engine(
     2. Goals by priority
     3. Reserve free-money floor
     """
-    return await AutopilotService.calculate_salary_rule_split(
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+    split = await AutopilotService.calculate_salary_rule_split(
         db,
         current_user.id,
         salary_override=salary_override,
         free_money_min_percent=free_money_min_percent,
     )
+    return await cache.store(validated_json_response(salary_rule_engine_adapter, split))
@@ -7,8 +7,8 @@ from uuid import uuid4
 from datetime import datetime
 
 from app.api import deps
+from app.core.cache import ConditionalGet
 from app.core.database import get_db
-from app.models.user import User
 from app.models.bill import Bill
 from app.schemas.bill import BillCreate, BillUpdate, BillResponse
 
@@ -17,7 +17,7 @@ router = APIRouter()
 @router.post("/", response_model=BillResponse, status_code=status.HTTP_201_CREATED)
 async def create_bill(
     bill_in: BillCreate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -41,12 +41,15 @@ async def create_bill(
 
 @router.get("/", response_model=List[BillResponse])
 async def read_bills(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    etag: Annotated[ConditionalGet, Depends(deps.conditional_get("bills"))]
 ) -> Any:
     """
     Retrieve all bills.
     """
+    if etag.matches:
+        return etag.not_modified()
     result = await db.execute(
         select(Bill).options(selectinload(Bill.category)).filter(Bill.user_id == current_user.id)
     )
@@ -57,7 +60,7 @@ async def read_bills(
 async def update_bill(
     bill_id: str,
     bill_in: BillUpdate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -88,7 +91,7 @@ async def update_bill(
 @router.delete("/{bill_id}", response_model=BillResponse)
 async def delete_bill(
     bill_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -108,7 +111,7 @@ async def delete_bill(
 @router.post("/{bill_id}/mark-paid", response_model=BillResponse)
 async def mark_bill_paid(
     bill_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -131,7 +134,7 @@ async def mark_bill_paid(
 @router.post("/{bill_id}/mark-unpaid", response_model=BillResponse)
 async def mark_bill_unpaid(
     bill_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
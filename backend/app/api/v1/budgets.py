@@ -1,29 +1,38 @@
 from datetime import datetime
-from typing import Any, Annotated
+from typing import Any, Annotated, List, Tuple
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
 from app.api import deps
+from app.core.cache import CachedResponse
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
 from app.models.budget import BudgetCategory, BudgetRule
 from app.models.income import IncomeSource
 from app.models.transaction import Transaction
-from app.models.user import User
 from app.schemas.budget import BudgetRuleCreate, BudgetRuleResponse, BudgetRuleUpdate
 from app.services.budget_engine import BudgetEngine
 
 router = APIRouter()
 
+MAX_RANGE_MONTHS = 24
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+def _month_start(year: int, month: int) -> datetime:
+    return datetime(year + (month - 1) // 12, (month - 1) % 12 + 1, 1)
+
 # ... (Keep existing CRUD operations for Rules) ...
 
 @router.post("/rules", response_model=BudgetRuleResponse, status_code=status.HTTP_201_CREATED)
 async def create_budget_rule(
     rule_in: BudgetRuleCreate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     # Check if category exists and belongs to user
@@ -49,7 +58,7 @@ async def create_budget_rule(
 
 @router.get("/rules", response_model=list[BudgetRuleResponse])
 async def read_budget_rules(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     result = await db.execute(
@@ -63,7 +72,7 @@ async def read_budget_rules(
 async def update_budget_rule(
     rule_id: str,
     rule_in: BudgetRuleUpdate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     result = await db.execute(select(BudgetRule).filter(BudgetRule.id == rule_id, BudgetRule.user_id == current_user.id))
@@ -88,7 +97,7 @@ async def update_budget_rule(
 @router.delete("/rules/{rule_id}", response_model=BudgetRuleResponse)
 async def delete_budget_rule(
     rule_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     # Need to load before deleting if we want to return it with relation, 
@@ -113,14 +122,18 @@ async def delete_budget_rule(
 
 @router.get("/summary")
 async def get_budget_summary(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    cache: Annotated[CachedResponse, Depends(deps.cached_response("budgets.summary"))],
     month: int | None = Query(default=None, ge=1, le=12),
     year: int | None = Query(default=None, ge=1970, le=2100),
 ) -> Any:
     """
     Calculate and return the budget summary dashboard data using Budget Engine.
     """
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
     now = datetime.utcnow()
     target_month = month or now.month
     target_year = year or now.year
@@ -134,16 +147,16 @@ async def get_budget_summary(
     rules_res = await db.execute(select(BudgetRule).filter(BudgetRule.user_id == current_user.id))
     rules = rules_res.scalars().all()
     
-    # 3. Transactions (for the specific month)
-    # Note: Logic to filter by month should ideally happen in DB query for performance, 
-    # but for MVP filtering in python or fetching all and filtering is acceptable if volume is low.
-    # Let's simple filter in DB:
-    # This requires start/end date calculation
-    # For now, let's fetch all (simple) or improve query.
-    
-    transactions_res = await db.execute(select(Transaction).filter(Transaction.user_id == current_user.id))
+    # 3. Transactions (for the specific month only)
+    transactions_res = await db.execute(
+        select(Transaction).filter(
+            Transaction.user_id == current_user.id,
+            Transaction.occurred_at >= _month_start(target_year, target_month),
+            Transaction.occurred_at < _month_start(target_year, target_month + 1),
+        )
+    )
     transactions = transactions_res.scalars().all()
-    
+
     # Calculate
     summary = BudgetEngine.calculate_monthly_overview(
         incomes=incomes,
@@ -152,5 +165,59 @@ async def get_budget_summary(
         year=target_year,
         month=target_month
     )
-    
-    return summary
+
+    return await cache.store(ORJSONResponse(summary))
+
+
+@router.get("/summary/range")
+async def get_budget_summary_range(
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    from_month: str = Query(alias="from", pattern=MONTH_PATTERN, description="First month, YYYY-MM"),
+    to_month: str = Query(alias="to", pattern=MONTH_PATTERN, description="Last month (inclusive), YYYY-MM"),
+) -> Any:
+    """
+    Allocations vs. spend per month and category for up to 24 months, as a
+    month x category matrix for charts.
+    """
+    start_year, start_month = (int(part) for part in from_month.split("-"))
+    end_year, end_month = (int(part) for part in to_month.split("-"))
+    month_count = (end_year - start_year) * 12 + end_month - start_month + 1
+    if month_count < 1:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    if month_count > MAX_RANGE_MONTHS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {MAX_RANGE_MONTHS} months")
+
+    months: List[Tuple[int, int]] = []
+    for offset in range(month_count):
+        first_day = _month_start(start_year, start_month + offset)
+        months.append((first_day.year, first_day.month))
+
+    incomes_res = await db.execute(select(IncomeSource).filter(IncomeSource.user_id == current_user.id))
+    rules_res = await db.execute(select(BudgetRule).filter(BudgetRule.user_id == current_user.id))
+    categories_res = await db.execute(
+        select(BudgetCategory).filter(BudgetCategory.user_id == current_user.id).order_by(BudgetCategory.name)
+    )
+
+    year_col = func.extract("year", Transaction.occurred_at)
+    month_col = func.extract("month", Transaction.occurred_at)
+    spend_res = await db.execute(
+        select(year_col, month_col, Transaction.category_id, func.sum(Transaction.amount))
+        .filter(
+            Transaction.user_id == current_user.id,
+            Transaction.type == "EXPENSE",
+            Transaction.occurred_at >= _month_start(start_year, start_month),
+            Transaction.occurred_at < _month_start(start_year, start_month + month_count),
+        )
+        .group_by(year_col, month_col, Transaction.category_id)
+    )
+
+    return ORJSONResponse(
+        BudgetEngine.calculate_range_overview(
+            incomes=incomes_res.scalars().all(),
+            rules=rules_res.scalars().all(),
+            categories=categories_res.scalars().all(),
+            monthly_spend=spend_res.all(),
+            months=months,
+        )
+    )
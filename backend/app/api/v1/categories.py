@@ -5,8 +5,8 @@ from sqlalchemy.future import select
 from uuid import uuid4
 
 from app.api import deps
+from app.core.cache import ConditionalGet
 from app.core.database import get_db
-from app.models.user import User
 from app.models.budget import BudgetCategory
 from app.schemas.budget import CategoryCreate, CategoryUpdate, CategoryResponse
 
@@ -15,7 +15,7 @@ router = APIRouter()
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_in: CategoryCreate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -34,12 +34,15 @@ async def create_category(
 
 @router.get("/", response_model=List[CategoryResponse])
 async def read_categories(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    etag: Annotated[ConditionalGet, Depends(deps.conditional_get("categories"))]
 ) -> Any:
     """
     Retrieve all categories for the current user.
     """
+    if etag.matches:
+        return etag.not_modified()
     result = await db.execute(select(BudgetCategory).filter(BudgetCategory.user_id == current_user.id))
     categories = result.scalars().all()
     return categories
@@ -48,7 +51,7 @@ async def read_categories(
 async def update_category(
     category_id: str,
     category_in: CategoryUpdate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -73,7 +76,7 @@ async def update_category(
 @router.delete("/{category_id}", response_model=CategoryResponse)
 async def delete_category(
     category_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -0,0 +1,121 @@
+from typing import Any, Annotated, List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
+from uuid import uuid4
+
+from app.api import deps
+from app.core.database import get_db
+from app.models.budget import BudgetCategory
+from app.models.categorization_rule import CategorizationRule
+from app.schemas.categorization_rule import (
+    CategorizationRuleCreate,
+    CategorizationRuleUpdate,
+    CategorizationRuleResponse,
+)
+from app.services.categorization import CategorizationService, regex_problem
+
+router = APIRouter()
+
+
+async def _validate_rule(db: AsyncSession, user_id: str, rule: CategorizationRule) -> None:
+    category = await db.execute(
+        select(BudgetCategory.id).filter(BudgetCategory.id == rule.category_id, BudgetCategory.user_id == user_id)
+    )
+    if category.first() is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+    if rule.match_type in ("CONTAINS", "REGEX") and not rule.pattern:
+        raise HTTPException(status_code=400, detail="Pattern is required for CONTAINS and REGEX rules")
+    if rule.match_type == "REGEX":
+        problem = regex_problem(rule.pattern)
+        if problem:
+            raise HTTPException(status_code=400, detail=problem)
+    if rule.match_type == "AMOUNT" and rule.min_amount is None and rule.max_amount is None:
+        raise HTTPException(status_code=400, detail="AMOUNT rules need min_amount or max_amount")
+    if rule.min_amount is not None and rule.max_amount is not None and rule.min_amount > rule.max_amount:
+        raise HTTPException(status_code=400, detail="min_amount must not exceed max_amount")
+
+
+async def _get_rule(db: AsyncSession, user_id: str, rule_id: str) -> CategorizationRule:
+    result = await db.execute(
+        select(CategorizationRule)
+        .options(selectinload(CategorizationRule.category))
+        .filter(CategorizationRule.id == rule_id, CategorizationRule.user_id == user_id)
+    )
+    rule = result.scalars().first()
+    if not rule:
+        raise HTTPException(status_code=404, detail="Rule not found")
+    return rule
+
+
+@router.post("/", response_model=CategorizationRuleResponse, status_code=status.HTTP_201_CREATED)
+async def create_rule(
+    rule_in: CategorizationRuleCreate,
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Any:
+    """
+    Create an auto-categorization rule.
+    """
+    rule = CategorizationRule(id=str(uuid4()), user_id=current_user.id, **rule_in.model_dump())
+    await _validate_rule(db, current_user.id, rule)
+    db.add(rule)
+    await db.commit()
+    CategorizationService.invalidate(current_user.id)
+    return await _get_rule(db, current_user.id, rule.id)
+
+
+@router.get("/", response_model=List[CategorizationRuleResponse])
+async def read_rules(
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Any:
+    """
+    Retrieve the current user's rules, highest priority first.
+    """
+    result = await db.execute(
+        select(CategorizationRule)
+        .options(selectinload(CategorizationRule.category))
+        .filter(CategorizationRule.user_id == current_user.id)
+        .order_by(CategorizationRule.priority.desc(), CategorizationRule.created_at)
+    )
+    return result.scalars().all()
+
+
+@router.put("/{rule_id}", response_model=CategorizationRuleResponse)
+async def update_rule(
+    rule_id: str,
+    rule_in: CategorizationRuleUpdate,
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Any:
+    """
+    Update a rule.
+    """
+    rule = await _get_rule(db, current_user.id, rule_id)
+    for field, value in rule_in.model_dump(exclude_unset=True).items():
+        setattr(rule, field, value)
+    await _validate_rule(db, current_user.id, rule)
+
+    db.add(rule)
+    await db.commit()
+    CategorizationService.invalidate(current_user.id)
+    return await _get_rule(db, current_user.id, rule.id)
+
+
+@router.delete("/{rule_id}", response_model=CategorizationRuleResponse)
+async def delete_rule(
+    rule_id: str,
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Any:
+    """
+    Delete a rule.
+    """
+    rule = await _get_rule(db, current_user.id, rule_id)
+    await db.delete(rule)
+    await db.commit()
+    CategorizationService.invalidate(current_user.id)
+    return rule
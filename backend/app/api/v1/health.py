@@ -1,18 +1,26 @@
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.api.deps import get_current_user
-from app.core.database import get_db
-from app.models.user import User
+from app.api.deps import AuthenticatedUser, cached_response, get_current_user
+from app.core.cache import CachedResponse
+from app.core.database import get_read_db
+from app.core.responses import validated_json_response
 from app.schemas.health_score import HealthScoreResponse
 from app.services.health_score_calculator import HealthScoreCalculator
 
 router = APIRouter()
 
+health_score_adapter = TypeAdapter(HealthScoreResponse)
+
 @router.get("/score", response_model=HealthScoreResponse)
 async def get_health_score(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cached_response("health.score", read_replica=True)),
 ):
     """Get the current financial health score for the authenticated user"""
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
     score_data = await HealthScoreCalculator.calculate_overall_score(db, current_user.id)
-    return HealthScoreResponse(**score_data)
+    return await cache.store(validated_json_response(health_score_adapter, score_data))
@@ -5,15 +5,14 @@ from sqlalchemy.future import select
 from uuid import uuid4
 
 from app.api import deps
+from app.core.cache import ConditionalGet
 from app.core.database import get_db
-from app.models.user import User
 from app.models.income import IncomeSource
 from app.schemas.income import IncomeSourceCreate, IncomeSourceUpdate, IncomeSourceResponse
+from app.services.recurrence import SUPPORTED_FREQUENCIES
 
 router = APIRouter()
 
-SUPPORTED_FREQUENCIES = {"monthly", "weekly", "biweekly", "yearly", "daily"}
-
 
 def _normalize_frequency(value: str | None) -> str:
     normalized = (value or "").strip().lower()
@@ -64,7 +63,7 @@ def _validate_income_payload(
 @router.post("/", response_model=IncomeSourceResponse, status_code=status.HTTP_201_CREATED)
 async def create_income(
     income_in: IncomeSourceCreate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -91,12 +90,15 @@ async def create_income(
 
 @router.get("/", response_model=List[IncomeSourceResponse])
 async def read_incomes(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    etag: Annotated[ConditionalGet, Depends(deps.conditional_get("income"))]
 ) -> Any:
     """
     Retrieve all income sources for the current user.
     """
+    if etag.matches:
+        return etag.not_modified()
     result = await db.execute(select(IncomeSource).filter(IncomeSource.user_id == current_user.id))
     incomes = result.scalars().all()
     return incomes
@@ -105,7 +107,7 @@ async def read_incomes(
 async def update_income(
     income_id: str,
     income_in: IncomeSourceUpdate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -145,7 +147,7 @@ async def update_income(
 @router.delete("/{income_id}", response_model=IncomeSourceResponse)
 async def delete_income(
     income_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -5,22 +5,26 @@ from sqlalchemy.future import select
 from sqlalchemy import desc
 
 from app.api import deps
+from app.core.cache import ConditionalGet
 from app.core.database import get_db
-from app.models.user import User
 from app.models.notification import Notification
+from app.models.user import bump_data_version
 from app.schemas.notification import NotificationResponse
 
 router = APIRouter()
 
 @router.get("/", response_model=List[NotificationResponse])
 async def get_notifications(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    etag: Annotated[ConditionalGet, Depends(deps.conditional_get("notifications"))],
     unread_only: bool = False
 ) -> Any:
     """
     Get user notifications.
     """
+    if etag.matches:
+        return etag.not_modified()
     query = select(Notification).filter(Notification.user_id == current_user.id)
     if unread_only:
         query = query.filter(Notification.read == False)
@@ -32,7 +36,7 @@ async def get_notifications(
 @router.put("/{notification_id}/mark-read", response_model=NotificationResponse)
 async def mark_notification_read(
     notification_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -57,7 +61,7 @@ async def mark_notification_read(
 @router.delete("/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_notification(
     notification_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> None:
     """
@@ -79,17 +83,20 @@ async def delete_notification(
 
 @router.post("/mark-all-read", status_code=status.HTTP_200_OK)
 async def mark_all_read(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
     Mark all notifications as read.
     """
     from sqlalchemy import update
-    await db.execute(
+    result = await db.execute(
         update(Notification)
         .filter(Notification.user_id == current_user.id, Notification.read == False)
         .values(read=True)
     )
+    if result.rowcount:
+        # Core UPDATE skips the flush hook; without this, old ETags stay valid.
+        await bump_data_version(db, current_user.id)
     await db.commit()
     return {"message": "All notifications marked as read"}
@@ -1,21 +1,22 @@
 from typing import Any, List, Annotated
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from uuid import uuid4
 
 from app.api import deps
+from app.core.cache import ConditionalGet
 from app.core.database import get_db
-from app.models.user import User
 from app.models.savings import SavingsGoal, SavingsLog
-from app.schemas.savings import SavingsGoalCreate, SavingsGoalUpdate, SavingsGoalResponse, SavingsContribution, SavingsLogResponse
+from app.schemas.savings import SavingsGoalCreate, SavingsGoalUpdate, SavingsGoalResponse, SavingsContribution, SavingsLogResponse, SavingsGoalProgressResponse
+from app.services.savings import SavingsService
 
 router = APIRouter()
 
 @router.post("/", response_model=SavingsGoalResponse, status_code=status.HTTP_201_CREATED)
 async def create_goal(
     goal_in: SavingsGoalCreate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     goal_data = goal_in.model_dump()
@@ -34,9 +35,12 @@ async def create_goal(
 
 @router.get("/", response_model=List[SavingsGoalResponse])
 async def read_goals(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    etag: Annotated[ConditionalGet, Depends(deps.conditional_get("goals"))]
 ) -> Any:
+    if etag.matches:
+        return etag.not_modified()
     result = await db.execute(select(SavingsGoal).filter(SavingsGoal.user_id == current_user.id))
     return result.scalars().all()
 
@@ -44,7 +48,7 @@ async def read_goals(
 async def update_goal(
     goal_id: str,
     goal_in: SavingsGoalUpdate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     result = await db.execute(select(SavingsGoal).filter(SavingsGoal.id == goal_id, SavingsGoal.user_id == current_user.id))
@@ -63,7 +67,7 @@ async def update_goal(
 @router.delete("/{goal_id}", response_model=SavingsGoalResponse)
 async def delete_goal(
     goal_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     result = await db.execute(select(SavingsGoal).filter(SavingsGoal.id == goal_id, SavingsGoal.user_id == current_user.id))
@@ -79,46 +83,54 @@ async def delete_goal(
 async def contribute_to_goal(
     goal_id: str,
     contribution: SavingsContribution,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
-    # 1. Fetch Goal
-    result = await db.execute(select(SavingsGoal).filter(SavingsGoal.id == goal_id, SavingsGoal.user_id == current_user.id))
-    goal = result.scalars().first()
+    # One atomic UPDATE ... RETURNING: safe under concurrent contributions.
+    goal = await SavingsService.contribute_one(
+        db, current_user.id, goal_id, contribution.amount, contribution.note
+    )
     if not goal:
         raise HTTPException(status_code=404, detail="Savings Goal not found")
-
-    # 2. Add Log
-    log = SavingsLog(
-        id=str(uuid4()),
-        goal_id=goal_id,
-        amount=contribution.amount,
-        note=contribution.note
-    )
-    db.add(log)
-
-    # 3. Update Goal Total
-    goal.current_amount += contribution.amount
-    
-    # Check completion
-    if goal.current_amount >= goal.target_amount:
-        goal.is_completed = True
-
     await db.commit()
-    await db.refresh(goal)
     return goal
 
+@router.get("/{goal_id}/progress", response_model=SavingsGoalProgressResponse)
+async def get_goal_progress(
+    goal_id: str,
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    months: int = Query(default=12, ge=1, le=60),
+) -> Any:
+    """
+    Contribution totals, per-month sums for the last ``months`` months, the
+    average monthly contribution and an estimated completion date.
+    """
+    result = await db.execute(select(SavingsGoal).filter(SavingsGoal.id == goal_id, SavingsGoal.user_id == current_user.id))
+    goal = result.scalars().first()
+    if not goal:
+        raise HTTPException(status_code=404, detail="Savings Goal not found")
+    return await SavingsService.get_progress(db, goal, months=months)
+
 @router.get("/{goal_id}/logs", response_model=List[SavingsLogResponse])
 async def get_goal_logs(
     goal_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=500),
 ) -> Any:
     # Verify ownership
     result = await db.execute(select(SavingsGoal).filter(SavingsGoal.id == goal_id, SavingsGoal.user_id == current_user.id))
     if not result.scalars().first():
          raise HTTPException(status_code=404, detail="Savings Goal not found")
 
-    # Fetch logs
-    logs_res = await db.execute(select(SavingsLog).filter(SavingsLog.goal_id == goal_id).order_by(SavingsLog.created_at.desc()))
+    # Fetch logs, newest first
+    logs_res = await db.execute(
+        select(SavingsLog)
+        .filter(SavingsLog.goal_id == goal_id)
+        .order_by(SavingsLog.created_at.desc(), SavingsLog.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
     return logs_res.scalars().all()
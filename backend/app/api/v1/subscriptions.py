@@ -1,22 +1,32 @@
 from typing import Any, List, Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from uuid import uuid4
 
 from app.api import deps
-from app.core.database import get_db
-from app.models.user import User
-from app.models.subscription import Subscription
-from app.schemas.subscription import SubscriptionCreate, SubscriptionUpdate, SubscriptionResponse
+from app.core.cache import CachedResponse, ConditionalGet
+from app.core.database import get_db, get_read_db
+from app.core.responses import ORJSONResponse
+from app.models.subscription import Subscription, SubscriptionUsageEvent
+from app.schemas.subscription import (
+    SubscriptionAnalyticsResponse,
+    SubscriptionCreate,
+    SubscriptionResponse,
+    SubscriptionUpdate,
+    SubscriptionUsageBatch,
+    SubscriptionUsageBatchResult,
+)
+from app.services.subscription_usage import SubscriptionUsageService
 
 router = APIRouter()
 
 @router.post("/", response_model=SubscriptionResponse, status_code=status.HTTP_201_CREATED)
 async def create_subscription(
     sub_in: SubscriptionCreate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     sub = Subscription(
@@ -24,6 +34,7 @@ async def create_subscription(
         user_id=current_user.id,
         **sub_in.model_dump()
     )
+    sub.billing_day = sub.next_billing_date.day if sub.next_billing_date else None
     db.add(sub)
     await db.commit()
     await db.refresh(sub)
@@ -37,9 +48,12 @@ async def create_subscription(
 
 @router.get("/", response_model=List[SubscriptionResponse])
 async def read_subscriptions(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    etag: Annotated[ConditionalGet, Depends(deps.conditional_get("subscriptions"))]
 ) -> Any:
+    if etag.matches:
+        return etag.not_modified()
     result = await db.execute(
         select(Subscription).options(selectinload(Subscription.category)).filter(Subscription.user_id == current_user.id)
     )
@@ -49,7 +63,7 @@ async def read_subscriptions(
 async def update_subscription(
     sub_id: str,
     sub_in: SubscriptionUpdate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     result = await db.execute(select(Subscription).filter(Subscription.id == sub_id, Subscription.user_id == current_user.id))
@@ -59,6 +73,8 @@ async def update_subscription(
     
     for k, v in sub_in.model_dump(exclude_unset=True).items():
         setattr(sub, k, v)
+        if k == "next_billing_date":
+            sub.billing_day = v.day if v else None
         
     db.add(sub)
     await db.commit()
@@ -74,7 +90,7 @@ async def update_subscription(
 @router.delete("/{sub_id}", response_model=SubscriptionResponse)
 async def delete_subscription(
     sub_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     result = await db.execute(
@@ -84,6 +100,8 @@ async def delete_subscription(
     if not sub:
         raise HTTPException(status_code=404, detail="Subscription not found")
     
+    # SQLite does not enforce the ON DELETE CASCADE, so drop the history here.
+    await db.execute(delete(SubscriptionUsageEvent).where(SubscriptionUsageEvent.subscription_id == sub.id))
     await db.delete(sub)
     await db.commit()
     return sub
@@ -91,24 +109,47 @@ async def delete_subscription(
 @router.post("/{sub_id}/log-usage", response_model=SubscriptionResponse)
 async def log_usage(
     sub_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
-    result = await db.execute(
-        select(Subscription).options(selectinload(Subscription.category)).filter(Subscription.id == sub_id, Subscription.user_id == current_user.id)
-    )
-    sub = result.scalars().first()
-    if not sub:
+    # Atomic counter bump plus one usage event; no read-modify-write.
+    updated = await SubscriptionUsageService.record(db, current_user.id, [(sub_id, None, 1)])
+    if sub_id not in updated:
         raise HTTPException(status_code=404, detail="Subscription not found")
-    
-    sub.usage_count += 1
-    db.add(sub)
     await db.commit()
-    await db.refresh(sub)
+    return updated[sub_id]
 
-    # Reload with category relationship
-    result = await db.execute(
-        select(Subscription).options(selectinload(Subscription.category)).where(Subscription.id == sub.id)
-    )
-    sub = result.scalar_one()
-    return sub
+@router.post("/usage", response_model=SubscriptionUsageBatchResult)
+async def log_usage_batch(
+    batch: SubscriptionUsageBatch,
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Any:
+    """
+    Record several usage events at once (e.g. buffered client check-ins).
+    Events for unknown subscriptions are skipped and not counted.
+    """
+    events = [(event.subscription_id, event.used_at, event.quantity) for event in batch.events]
+    updated = await SubscriptionUsageService.record(db, current_user.id, events)
+    await db.commit()
+    return {
+        "recorded": sum(1 for subscription_id, _, _ in events if subscription_id in updated),
+        "subscriptions": list(updated.values()),
+    }
+
+@router.get("/analytics", response_model=SubscriptionAnalyticsResponse)
+async def get_subscription_analytics(
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    cache: Annotated[CachedResponse, Depends(deps.cached_response("subscriptions.analytics", read_replica=True))],
+) -> Any:
+    """
+    Cost per use over the last 30 and 90 days for every subscription, and
+    whether usage in the last 30 days is rising or falling against the 30
+    days before.
+    """
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+    data = await SubscriptionUsageService.analytics(db, current_user.id)
+    return await cache.store(ORJSONResponse(data))
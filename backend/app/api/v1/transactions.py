@@ -3,22 +3,38 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
+from pydantic import TypeAdapter
 from uuid import uuid4
 from datetime import datetime
 
 from app.api import deps
-from app.core.database import get_db
-from app.models.user import User
+from app.core.database import get_db, get_read_db
+from app.core.responses import validated_json_response
 from app.models.transaction import Transaction
 from app.models.bill import Bill
-from app.schemas.transaction import TransactionCreate, TransactionUpdate, TransactionResponse
+from app.models.budget import BudgetCategory
+from app.schemas.transaction import (
+    TransactionCreate,
+    TransactionUpdate,
+    TransactionResponse,
+    TransactionBulkUpdate,
+    TransactionBulkDelete,
+    TransactionBulkResult,
+)
+from app.schemas.categorization_rule import RecategorizeRequest, RecategorizeResult
+from app.services.categorization import CategorizationService
+from app.services.transaction_bulk import TransactionBulkService
+from app.services.recurrence import add_interval
+from app.services.transaction_search import TransactionSearchService
 
 router = APIRouter()
 
+transaction_list_adapter = TypeAdapter(List[TransactionResponse])
+
 @router.post("/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     transaction_in: TransactionCreate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -36,7 +52,8 @@ async def create_transaction(
     # Ensure occurred_at is set if not provided
     if not transaction.occurred_at:
         transaction.occurred_at = datetime.utcnow()
-        
+    await CategorizationService.categorize(db, transaction)
+
     db.add(transaction)
     await db.commit()
     await db.refresh(transaction, ['category'])
@@ -44,16 +61,21 @@ async def create_transaction(
 
 @router.get("/", response_model=List[TransactionResponse])
 async def read_transactions(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     skip: int = 0,
     limit: int = 100,
     type: Optional[str] = None,
     status: Optional[str] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    search_mode: str = Query(default="contains", pattern="^(contains|prefix|fuzzy)$"),
 ) -> Any:
     """
     Retrieve transactions with optional filtering.
+
+    ``search_mode`` selects substring (``contains``), word-prefix (``prefix``)
+    or typo-tolerant (``fuzzy``) description matching; the latter two are
+    ordered by relevance before date.
     """
     query = select(Transaction).options(selectinload(Transaction.category)).filter(Transaction.user_id == current_user.id)
     
@@ -64,19 +86,70 @@ async def read_transactions(
         query = query.filter(Transaction.status == status)
         
     if search:
-        query = query.filter(Transaction.description.ilike(f"%{search}%"))
+        query = TransactionSearchService.apply(query, search, search_mode, db.get_bind().dialect.name)
     
     query = query.offset(skip).limit(limit).order_by(Transaction.occurred_at.desc())
     
     result = await db.execute(query)
     transactions = result.scalars().all()
-    return transactions
+    return validated_json_response(transaction_list_adapter, transactions)
+
+@router.post("/recategorize", response_model=RecategorizeResult)
+async def recategorize_transactions(
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Optional[RecategorizeRequest] = None,
+) -> Any:
+    """
+    Re-apply the user's categorization rules to existing transactions.
+    """
+    request = request or RecategorizeRequest()
+    return await CategorizationService.recategorize(
+        db, current_user.id, only_uncategorized=request.only_uncategorized
+    )
+
+@router.patch("/bulk", response_model=TransactionBulkResult)
+async def bulk_update_transactions(
+    bulk_in: TransactionBulkUpdate,
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Any:
+    """
+    Recategorize and/or change the status of many transactions at once.
+    """
+    changes = bulk_in.model_dump(exclude_unset=True, exclude={"ids"})
+    if not changes:
+        raise HTTPException(status_code=400, detail="Nothing to update")
+    if changes.get("category_id"):
+        category = await db.execute(
+            select(BudgetCategory.id).filter(
+                BudgetCategory.id == changes["category_id"],
+                BudgetCategory.user_id == current_user.id
+            )
+        )
+        if category.first() is None:
+            raise HTTPException(status_code=404, detail="Category not found")
+    if "status" in changes and changes["status"] is None:
+        raise HTTPException(status_code=400, detail="Status cannot be null")
+
+    return await TransactionBulkService.update(db, current_user.id, bulk_in.ids, changes)
+
+@router.post("/bulk-delete", response_model=TransactionBulkResult)
+async def bulk_delete_transactions(
+    bulk_in: TransactionBulkDelete,
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Any:
+    """
+    Delete many transactions at once.
+    """
+    return await TransactionBulkService.delete(db, current_user.id, bulk_in.ids)
 
 @router.put("/{transaction_id}", response_model=TransactionResponse)
 async def update_transaction(
     transaction_id: str,
     transaction_in: TransactionUpdate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -104,7 +177,7 @@ async def update_transaction(
 @router.delete("/{transaction_id}", response_model=TransactionResponse)
 async def delete_transaction(
     transaction_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -124,7 +197,7 @@ async def delete_transaction(
 @router.post("/{transaction_id}/complete", response_model=TransactionResponse)
 async def complete_transaction(
     transaction_id: str,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[deps.AuthenticatedUser, Depends(deps.get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> Any:
     """
@@ -162,12 +235,10 @@ async def complete_transaction(
         sub_result = await db.execute(select(Subscription).filter(Subscription.id == transaction.subscription_id))
         sub = sub_result.scalars().first()
         if sub:
-            from dateutil.relativedelta import relativedelta
             # Update next billing date based on cycle
-            if sub.billing_cycle == "monthly":
-                sub.next_billing_date = datetime.utcnow() + relativedelta(months=1)
-            elif sub.billing_cycle == "yearly":
-                sub.next_billing_date = datetime.utcnow() + relativedelta(years=1)
+            now = datetime.utcnow()
+            sub.next_billing_date = add_interval(now, sub.billing_cycle)
+            sub.billing_day = now.day
             db.add(sub)
             await db.commit()
     
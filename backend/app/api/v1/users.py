@@ -4,16 +4,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.api import deps
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.security import get_password_hash, verify_password
 from app.models.user import User
 from app.schemas.user import UserUpdate, PasswordChange, UserResponse
+from app.services.auth_tokens import TokenService
+from app.services.avatars import AvatarError, AvatarService, AvatarTooLarge, avatar_url
 
 router = APIRouter()
 
 @router.get("/me", response_model=UserResponse)
 async def read_user_me(
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[User, Depends(deps.get_current_user_record)],
 ) -> Any:
     """
     Get current user.
@@ -23,7 +26,7 @@ async def read_user_me(
 @router.put("/me", response_model=UserResponse)
 async def update_user_me(
     user_in: UserUpdate,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[User, Depends(deps.get_current_user_record)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> Any:
     """
@@ -51,40 +54,22 @@ async def update_user_me(
 @router.post("/me/avatar", response_model=UserResponse)
 async def upload_avatar(
     file: UploadFile,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[User, Depends(deps.get_current_user_record)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> Any:
     """
-    Upload user avatar.
+    Upload user avatar. Stored as square WebP renditions (see
+    ``app.services.avatars``); ``avatar_url`` points at the largest one.
     """
-    # Validate file type
-    allowed_types = ["image/jpeg", "image/jpg", "image/png", "image/gif", "image/webp"]
-    if file.content_type not in allowed_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file type. Only JPEG, PNG, GIF, and WebP images are allowed.",
-        )
-    
-    # Validate file size (max 5MB)
-    contents = await file.read()
-    if len(contents) > 5 * 1024 * 1024:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File too large. Maximum size is 5MB.",
-        )
-    
-    # Generate filename and save
-    import os
-    ext = file.filename.split(".")[-1] if "." in file.filename else "jpg"
-    filename = f"{current_user.id}.{ext}"
-    filepath = f"app/static/avatars/{filename}"
-    
-    # Save file
-    with open(filepath, "wb") as f:
-        f.write(contents)
-    
+    try:
+        key = await AvatarService.store(file, max_bytes=settings.AVATAR_MAX_BYTES)
+    except AvatarTooLarge as exc:
+        raise HTTPException(status_code=413, detail=str(exc))
+    except AvatarError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
     # Update user avatar_url
-    current_user.avatar_url = f"/static/avatars/{filename}"
+    current_user.avatar_url = avatar_url(key)
     db.add(current_user)
     await db.commit()
     await db.refresh(current_user)
@@ -93,7 +78,7 @@ async def upload_avatar(
 @router.post("/me/password", status_code=status.HTTP_200_OK)
 async def change_password(
     password_in: PasswordChange,
-    current_user: Annotated[User, Depends(deps.get_current_user)],
+    current_user: Annotated[User, Depends(deps.get_current_user_record)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> Any:
     """
@@ -107,5 +92,8 @@ async def change_password(
     
     current_user.password_hash = get_password_hash(password_in.new_password)
     db.add(current_user)
+    # Sign out every session, then hand this client a fresh one.
+    await TokenService.revoke_all(db, current_user.id)
+    tokens = await TokenService.issue(db, current_user)
     await db.commit()
-    return {"message": "Password updated successfully"}
+    return {"message": "Password updated successfully", **tokens}
@@ -0,0 +1,139 @@
+"""
+Per-user response cache for expensive read endpoints, plus ETag handling for
+conditional GETs on list endpoints.
+
+Entries hold the serialized JSON body. Keys include the user's
+``data_version`` (bumped by every write, see ``app.models.user``), so any
+write makes the user's old entries unreachable; the TTL only bounds
+time-dependent values such as "days left in month" and memory use.
+
+Backends (``RESPONSE_CACHE_BACKEND``):
+  * ``memory`` – per-process LRU (default)
+  * ``redis``  – shared across workers via ``REDIS_URL``; errors fall back to a miss
+  * ``none``   – disabled
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from fastapi.responses import Response
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryResponseCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return body
+
+    async def set(self, key: str, body: bytes, ttl_seconds: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisResponseCache:
+    def __init__(self, url: str, prefix: str = "response-cache:"):
+        import redis.asyncio as redis  # only needed for this backend
+
+        self._client = redis.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self._client.get(self._prefix + key)
+        except Exception:
+            logger.warning("Response cache read failed", exc_info=True)
+            return None
+
+    async def set(self, key: str, body: bytes, ttl_seconds: int) -> None:
+        try:
+            await self._client.set(self._prefix + key, body, ex=ttl_seconds)
+        except Exception:
+            logger.warning("Response cache write failed", exc_info=True)
+
+
+@lru_cache
+def get_response_cache():
+    """The configured backend, or None when caching is disabled."""
+    backend = settings.RESPONSE_CACHE_BACKEND.lower()
+    if backend == "redis":
+        return RedisResponseCache(settings.REDIS_URL)
+    if backend == "memory":
+        return MemoryResponseCache(settings.RESPONSE_CACHE_MAX_ENTRIES)
+    return None
+
+
+class CachedResponse:
+    """Request-scoped handle: ``await lookup()`` first, ``await store(response)`` on a miss."""
+
+    def __init__(self, backend, key: str):
+        self.backend = backend
+        self.key = key
+
+    async def lookup(self) -> Optional[Response]:
+        if self.backend is None:
+            return None
+        body = await self.backend.get(self.key)
+        if body is None:
+            return None
+        return Response(body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+    async def store(self, response: Response) -> Response:
+        if self.backend is not None and response.status_code == 200:
+            await self.backend.set(self.key, bytes(response.body), settings.RESPONSE_CACHE_TTL_SECONDS)
+            response.headers["X-Cache"] = "MISS"
+        return response
+
+
+# Browsers may keep a copy but must revalidate it (cheap with ETags) before use.
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+class ConditionalGet:
+    """
+    ETag/``If-None-Match`` support for a per-user read.
+
+    The ETag is derived from the user's ``data_version``, so it is known before
+    the endpoint queries or serializes anything.
+    """
+
+    def __init__(self, namespace: str, user_id: str, data_version: int, query: str, if_none_match: Optional[str]):
+        digest = hashlib.sha256(f"{namespace}|{user_id}|{data_version}|{query}".encode()).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self._if_none_match = if_none_match
+
+    @property
+    def matches(self) -> bool:
+        if not self._if_none_match:
+            return False
+        candidates = {tag.strip().removeprefix("W/") for tag in self._if_none_match.split(",")}
+        return "*" in candidates or self.etag in candidates
+
+    @property
+    def headers(self) -> dict:
+        return {"ETag": self.etag, "Cache-Control": PRIVATE_CACHE_CONTROL}
+
+    def not_modified(self) -> Response:
+        return Response(status_code=304, headers=self.headers)
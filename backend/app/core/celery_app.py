@@ -22,6 +22,10 @@ celery.conf.beat_schedule = {
         'task': 'app.tasks.bill_automation.check_and_create_pending_bills',
         'schedule': crontab(hour=6, minute=0),  # Run daily at 6 AM UTC
     },
+    'verify-ledger-nightly': {
+        'task': 'app.tasks.ledger.verify_ledger_balances',
+        'schedule': crontab(hour=3, minute=30),  # Run daily at 3:30 AM UTC
+    },
 }
 
 celery.conf.task_routes = {
@@ -0,0 +1,179 @@
+"""
+Response compression as a pure ASGI middleware.
+
+* Negotiates ``br`` (when the optional ``brotli`` package is installed) or
+  ``gzip`` from ``Accept-Encoding``, honouring ``q=0``.
+* Only compresses compressible content types, skips responses that already
+  carry a ``Content-Encoding``, ask for ``no-transform``, or have no body.
+* Bodies with a ``Content-Length`` (which upstream middlewares may still
+  deliver in several chunks) are compressed whole, keeping an exact length;
+  below ``minimum_size`` they are sent as-is.
+* Streamed bodies are buffered only until ``minimum_size`` bytes have arrived,
+  then compressed chunk by chunk with a sync flush, so they still reach the
+  client incrementally.
+* Adds ``Vary: Accept-Encoding`` and downgrades strong ETags to weak ones, since
+  the compressed bytes differ from the identity representation.
+"""
+
+import zlib
+from typing import Callable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/problem+json",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def _accepted_encodings(accept_encoding: str) -> dict:
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def choose_encoding(accept_encoding: str, brotli_enabled: bool = True) -> Optional[str]:
+    accepted = _accepted_encodings(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli_enabled and brotli is not None else []) + ["gzip"]
+    best, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._gzip.compress(data)
+        return out + self._gzip.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        brotli_enabled: bool = True,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.brotli_enabled = brotli_enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.brotli_enabled)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    def __init__(self, config: CompressionMiddleware, encoding: str, send: Send):
+        self.config = config
+        self.encoding = encoding
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.buffer = b""
+        self.sized = False
+        self.passthrough = False
+
+    def _eligible(self, headers: Headers) -> bool:
+        content_type = headers.get("content-type", "").lower()
+        return (
+            "content-encoding" not in headers
+            and "no-transform" not in headers.get("cache-control", "").lower()
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+        )
+
+    async def __call__(self, message: Message) -> None:
+        send: Callable = self.send
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.sized = "content-length" in headers
+            if not self._eligible(headers):
+                self.passthrough = True
+                await send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            self.buffer += body
+            if more_body and (self.sized or len(self.buffer) < self.config.minimum_size):
+                return
+            body, self.buffer = self.buffer, b""
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < self.config.minimum_size:
+                self.passthrough = True
+                await send(self.start_message)
+                await send({"type": "http.response.body", "body": body, "more_body": False})
+                return
+            self.compressor = _Compressor(self.encoding, self.config.gzip_level, self.config.brotli_quality)
+            headers["Content-Encoding"] = self.encoding
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            compressed = self.compressor.compress(body, final=not more_body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(compressed))
+            await send(self.start_message)
+            await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+            return
+
+        await send(
+            {
+                "type": "http.response.body",
+                "body": self.compressor.compress(body, final=not more_body),
+                "more_body": more_body,
+            }
+        )
@@ -4,6 +4,26 @@ from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from pydantic import PostgresDsn, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
+
+def normalize_async_database_url(v: str) -> str:
+    v = v.strip()
+    if v.startswith("postgres://"):
+        v = v.replace("postgres://", "postgresql+asyncpg://", 1)
+    if v.startswith("postgresql://") and "+asyncpg" not in v:
+        v = v.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    # SQLAlchemy asyncpg passes query params as kwargs to asyncpg.connect().
+    # asyncpg accepts `ssl=...`, not `sslmode=...`.
+    parts = urlsplit(v)
+    query_params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    if "sslmode" in query_params and "ssl" not in query_params:
+        query_params["ssl"] = query_params["sslmode"]
+    if "sslmode" in query_params:
+        del query_params["sslmode"]
+    normalized_query = urlencode(query_params)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, normalized_query, parts.fragment))
+
+
 class Settings(BaseSettings):
     PROJECT_NAME: str = "WealthSync"
     API_V1_STR: str = "/api/v1"
@@ -56,10 +76,26 @@ class Settings(BaseSettings):
 
     # Security
     SECRET_KEY: str
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    # Access tokens are short-lived and checked without a user lookup; the
+    # rotated refresh token keeps the session going.
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # Revoked access tokens (logout, password change): memory | redis
+    TOKEN_REVOCATION_BACKEND: str = "memory"
     PASSWORD_MIN_LENGTH: int = 8
     RATE_LIMIT_LOGIN: str = "5/minute"
     RATE_LIMIT_SIGNUP: str = "3/minute"
+    # Budget for every API request: per user, or per client address when
+    # anonymous. Empty disables it.
+    RATE_LIMIT_DEFAULT: str = "600/minute"
+    # Counters: memory (per process) | redis (shared via REDIS_URL; falls
+    # back to memory while Redis is unreachable)
+    RATE_LIMIT_STORAGE: str = "memory"
+    RATE_LIMIT_STRATEGY: str = "sliding-window-counter"
+    RATE_LIMIT_REDIS_TIMEOUT_SECONDS: float = 0.25
+    # Proxies in front of the app that append to X-Forwarded-For; 0 uses the
+    # connection's address.
+    RATE_LIMIT_TRUSTED_PROXY_HOPS: int = 0
 
     # Database
     POSTGRES_SERVER: str = "db"
@@ -67,15 +103,41 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "wealth_sync"
     DATABASE_URL: PostgresDsn | None = None
+    # Optional read replica for analytics-heavy endpoints. When unset, reads
+    # share the primary session.
+    DATABASE_READ_URL: str | None = None
     
     # Database Pool
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    # asyncpg prepared-statement cache (per connection). Set to 0 behind
+    # PgBouncer in transaction pooling mode.
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    HEALTH_READY_TIMEOUT_SECONDS: float = 2.0
+    # /health/db (pool internals) answers only requests carrying this value in
+    # X-Health-Token; unset hides the endpoint.
+    HEALTH_METRICS_TOKEN: str | None = None
+
+    # Avatar uploads (streamed; rejected once this many bytes have arrived)
+    AVATAR_MAX_BYTES: int = 5 * 1024 * 1024
 
     # Monitoring
     SENTRY_DSN: str | None = None
     REDIS_URL: str = "redis://redis:6379/0"
 
+    # Per-user response cache for read-heavy endpoints: memory | redis | none
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+
+    # Response compression (gzip, or brotli when installed); 0 bytes = always
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
     # Payments / Autopilot
     PAYMENTS_PROVIDER: str = "internal_ledger"
     PAYMENTS_PROVIDER_BASE_URL: str | None = None
@@ -88,23 +150,7 @@ class Settings(BaseSettings):
     @classmethod
     def assemble_db_connection(cls, v: str | None, info: ValidationInfo) -> str | PostgresDsn:
         if isinstance(v, str) and v:
-            v = v.strip()
-            if v.startswith("postgres://"):
-                v = v.replace("postgres://", "postgresql+asyncpg://", 1)
-            if v.startswith("postgresql://") and "+asyncpg" not in v:
-                v = v.replace("postgresql://", "postgresql+asyncpg://", 1)
-
-            # SQLAlchemy asyncpg passes query params as kwargs to asyncpg.connect().
-            # asyncpg accepts `ssl=...`, not `sslmode=...`.
-            parts = urlsplit(v)
-            query_params = dict(parse_qsl(parts.query, keep_blank_values=True))
-            if "sslmode" in query_params and "ssl" not in query_params:
-                query_params["ssl"] = query_params["sslmode"]
-            if "sslmode" in query_params:
-                del query_params["sslmode"]
-            normalized_query = urlencode(query_params)
-            v = urlunsplit((parts.scheme, parts.netloc, parts.path, normalized_query, parts.fragment))
-            return v
+            return normalize_async_database_url(v)
 
         data = info.data
         return PostgresDsn.build(
@@ -115,6 +161,13 @@ class Settings(BaseSettings):
             path=f"{data.get('POSTGRES_DB') or ''}",
         )
 
+    @field_validator("DATABASE_READ_URL", mode="before")
+    @classmethod
+    def assemble_read_db_connection(cls, v: str | None) -> str | None:
+        if isinstance(v, str) and v.strip():
+            return normalize_async_database_url(v)
+        return None
+
     class Config:
         case_sensitive = True
         env_file = ".env"
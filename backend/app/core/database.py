@@ -1,20 +1,91 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from typing import Any, Dict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
 
-engine = create_async_engine(
-    str(settings.DATABASE_URL),
-    echo=settings.DEBUG,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_pre_ping=True
-)
+
+def _with_query_param(url: str, key: str, value: Any) -> str:
+    parts = urlsplit(url)
+    query_params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query_params.setdefault(key, str(value))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query_params), parts.fragment))
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """Engine keyword arguments for ``url``, tuned per driver."""
+    options: Dict[str, Any] = {"echo": settings.DEBUG, "pool_pre_ping": True}
+    if url.startswith("sqlite"):
+        # SQLite picks its own pool class; QueuePool sizing does not apply.
+        options["connect_args"] = {"check_same_thread": False}
+        return options
+
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    )
+    if "+asyncpg" in url:
+        # asyncpg keeps its own statement cache per connection, and SQLAlchemy's
+        # asyncpg dialect keeps a second one for prepared statements.
+        options["connect_args"] = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    return options
+
+
+def build_engine(url: str) -> AsyncEngine:
+    if "+asyncpg" in url:
+        url = _with_query_param(url, "prepared_statement_cache_size", settings.DB_STATEMENT_CACHE_SIZE)
+    return create_async_engine(url, **engine_options(url))
+
+
+engine = build_engine(str(settings.DATABASE_URL))
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+read_engine = build_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else None
+ReadSessionLocal = (
+    sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
 Base = declarative_base()
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_db(db: AsyncSession = Depends(get_db)):
+    """
+    Session for read-only analytics queries.
+
+    Uses the replica when ``DATABASE_READ_URL`` is set; otherwise reuses the
+    request's primary session so no extra connection is checked out.
+    """
+    if ReadSessionLocal is None:
+        yield db
+        return
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+def _pool_status(target: AsyncEngine) -> Dict[str, Any]:
+    pool = target.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    for metric in ("size", "checkedin", "checkedout", "overflow"):
+        reader = getattr(pool, metric, None)
+        if callable(reader):
+            status[metric] = reader()
+    return status
+
+
+def pool_metrics() -> Dict[str, Any]:
+    return {
+        "primary": _pool_status(engine),
+        "replica": _pool_status(read_engine) if read_engine is not None else None,
+    }
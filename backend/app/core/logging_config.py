@@ -1,6 +1,5 @@
 import logging
 import sys
-from pythonjsonlogger import jsonlogger
 from app.core.config import settings
 
 def setup_logging():
@@ -14,6 +13,8 @@ def setup_logging():
     
     if settings.ENVIRONMENT == "production":
         # JSON logging for production
+        from pythonjsonlogger import jsonlogger
+
         formatter = jsonlogger.JsonFormatter(
             '%(asctime)s %(levelname)s %(name)s %(message)s'
         )
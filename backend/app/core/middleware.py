@@ -1,13 +1,84 @@
 import time
 import uuid
+from typing import Callable, Dict, Optional
 from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from jose import JWTError
+from starlette.exceptions import HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
+from app.core import security
+from app.core.config import settings
+
+
+def client_address(request: Request) -> str:
+    """
+    The caller's IP. Behind ``RATE_LIMIT_TRUSTED_PROXY_HOPS`` proxies it is
+    taken from ``X-Forwarded-For``, counting from the right: entries further
+    left were written by the client and cannot be trusted.
+    """
+    hops = settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    if hops > 0:
+        forwarded = [part.strip() for part in request.headers.get("x-forwarded-for", "").split(",") if part.strip()]
+        if forwarded:
+            return forwarded[-min(hops, len(forwarded))]
+    return get_remote_address(request)
+
+
+def rate_limit_key(request: Request) -> str:
+    """Per user for requests with a valid access token, per client address otherwise."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if token and scheme.lower() == "bearer":
+        try:
+            return f"user:{security.decode_access_token(token)['sub']}"
+        except JWTError:
+            pass
+    return f"ip:{client_address(request)}"
+
+
+def create_limiter(
+    storage: Optional[str] = None, default_limit: Optional[str] = None, redis_url: Optional[str] = None
+) -> Limiter:
+    """
+    Counters live in this process (``memory``) or in Redis (``redis``), where
+    every check is one atomic Lua script in the limits library, so all
+    workers share one budget. When Redis is unreachable the limiter falls
+    back to in-memory counters and probes Redis again periodically.
+    """
+    storage = (storage or settings.RATE_LIMIT_STORAGE).lower()
+    default_limit = settings.RATE_LIMIT_DEFAULT if default_limit is None else default_limit
+    use_redis = storage == "redis"
+    timeout = settings.RATE_LIMIT_REDIS_TIMEOUT_SECONDS
+    return Limiter(
+        key_func=rate_limit_key,
+        application_limits=[default_limit] if default_limit else [],
+        strategy=settings.RATE_LIMIT_STRATEGY,
+        storage_uri=(redis_url or settings.REDIS_URL) if use_redis else "memory://",
+        storage_options={"socket_connect_timeout": timeout, "socket_timeout": timeout} if use_redis else {},
+        in_memory_fallback_enabled=use_redis,
+    )
+
+
 # Rate limiter instance
-limiter = Limiter(key_func=get_remote_address)
+limiter = create_limiter()
+
+
+def enforce_rate_limit(request: Request) -> None:
+    """
+    Router dependency applying ``RATE_LIMIT_DEFAULT`` to every API request.
+
+    Checked here rather than in slowapi's middleware, which would match the
+    request against every route a second time. ``_check_request_limit`` is
+    the same entry point that middleware uses, including the fallback to
+    in-memory counters (tests/test_rate_limit.py guards its signature).
+    A plain ``def``: the storage calls are blocking (a Redis round trip), so
+    FastAPI runs it in the thread pool. Raises ``RateLimitExceeded`` (429).
+    """
+    request.app.state.limiter._check_request_limit(request, None, True)
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
@@ -33,3 +104,46 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
         
         return response
+
+
+class RequestBodyLimitMiddleware:
+    """
+    Caps the request body of selected paths before anything parses it.
+
+    ``limits`` maps a path to a function returning its cap in bytes (read per
+    request, so settings changes apply). A larger ``Content-Length`` is
+    refused up front; otherwise bytes are counted as they arrive and the
+    request fails with 413 as soon as the cap is passed, so an oversized
+    upload is never spooled in full. Must be the innermost middleware so the
+    413 raised from ``receive`` reaches FastAPI's body parsing unwrapped.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Dict[str, Callable[[], int]]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            return await self.app(scope, receive, send)
+        max_bytes = limit()
+        too_large = "Request body too large."
+
+        content_length = Request(scope).headers.get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+            response = JSONResponse({"detail": too_large}, status_code=413, headers={"Connection": "close"})
+            return await response(scope, receive, send)
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    # FastAPI's body parsing re-raises HTTPException as is.
+                    raise HTTPException(status_code=413, detail=too_large)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,33 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+
+def _default(value: Any) -> Any:
+    # orjson handles datetime/date/UUID natively; Decimal and sets are the
+    # only extra types our service payloads carry. Money goes out as a JSON
+    # number, like the services' own `_to_money` conversions.
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, for dict payloads built by services."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def validated_json_response(adapter: TypeAdapter, content: Any, *, status_code: int = 200) -> Response:
+    """
+    Validate ``content`` (ORM objects allowed) once and serialize it in
+    pydantic-core, keeping the exact wire format of the response model.
+    """
+    validated = adapter.validate_python(content, from_attributes=True)
+    return Response(adapter.dump_json(validated), status_code=status_code, media_type="application/json")
@@ -0,0 +1,104 @@
+"""
+Revoked access tokens.
+
+Access tokens are verified from their signature and claims alone, so logging
+out or changing the password has to be able to cut them short. Two kinds of
+entries, each checked in O(1) by ``get_current_user``:
+
+  * a token's ``jti`` (logout), kept until that token would expire anyway;
+  * a per-user cutoff: tokens issued (``iat``) before it are rejected
+    (password change, "log out everywhere"), kept for one access-token
+    lifetime.
+
+Entries never outlive ``ACCESS_TOKEN_EXPIRE_MINUTES``, so the set stays small.
+Refresh tokens are revoked in the database (``app.models.refresh_token``).
+
+Backends (``TOKEN_REVOCATION_BACKEND``):
+  * ``memory`` – per-process dicts (default; single worker or tests)
+  * ``redis``  – shared across workers via ``REDIS_URL``; read errors are
+    logged and treated as "not revoked", bounded by the short token life
+"""
+
+import logging
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Expired entries are swept after this many writes.
+_PURGE_EVERY = 256
+
+
+def _user_cutoff_ttl() -> int:
+    return settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+class MemoryRevocationList:
+    def __init__(self):
+        self._tokens: Dict[str, float] = {}  # jti -> expiry (epoch seconds)
+        self._users: Dict[str, Tuple[float, float]] = {}  # user_id -> (cutoff, expiry)
+        self._writes = 0
+
+    async def revoke_token(self, jti: str, expires_at: float) -> None:
+        self._tokens[jti] = expires_at
+        self._written()
+
+    async def revoke_user(self, user_id: str, issued_before: float) -> None:
+        self._users[user_id] = (issued_before, time.time() + _user_cutoff_ttl())
+        self._written()
+
+    async def is_revoked(self, jti: str, user_id: str, issued_at: float) -> bool:
+        if jti in self._tokens:
+            return True
+        cutoff = self._users.get(user_id)
+        return cutoff is not None and issued_at < cutoff[0]
+
+    def _written(self) -> None:
+        self._writes += 1
+        if self._writes % _PURGE_EVERY:
+            return
+        now = time.time()
+        self._tokens = {jti: expiry for jti, expiry in self._tokens.items() if expiry > now}
+        self._users = {user_id: entry for user_id, entry in self._users.items() if entry[1] > now}
+
+    def clear(self) -> None:
+        self._tokens.clear()
+        self._users.clear()
+
+
+class RedisRevocationList:
+    def __init__(self, url: str, prefix: str = "revoked:", client=None):
+        if client is None:
+            import redis.asyncio as redis  # only needed for this backend
+
+            client = redis.from_url(url)
+        self._client = client
+        self._prefix = prefix
+
+    async def revoke_token(self, jti: str, expires_at: float) -> None:
+        ttl = max(int(expires_at - time.time()) + 1, 1)
+        await self._client.set(f"{self._prefix}token:{jti}", b"1", ex=ttl)
+
+    async def revoke_user(self, user_id: str, issued_before: float) -> None:
+        await self._client.set(f"{self._prefix}user:{user_id}", repr(issued_before), ex=_user_cutoff_ttl())
+
+    async def is_revoked(self, jti: str, user_id: str, issued_at: float) -> bool:
+        try:
+            token, cutoff = await self._client.mget(
+                [f"{self._prefix}token:{jti}", f"{self._prefix}user:{user_id}"]
+            )
+        except Exception:
+            logger.warning("Token revocation lookup failed", exc_info=True)
+            return False
+        return token is not None or (cutoff is not None and issued_at < float(cutoff))
+
+
+@lru_cache
+def get_revocation_list():
+    """The configured backend."""
+    if settings.TOKEN_REVOCATION_BACKEND.lower() == "redis":
+        return RedisRevocationList(settings.REDIS_URL)
+    return MemoryRevocationList()
@@ -0,0 +1,112 @@
+"""
+Startup schema check.
+
+Instead of running ``Base.metadata.create_all`` (which reflects every table)
+on each boot, compare the database's Alembic revision with the head revision
+shipped in ``alembic/versions``. The head is resolved once per process and a
+successful check is remembered per database URL, so reloads and additional
+lifespans in the same process skip the round-trip entirely.
+
+Only an empty database is ever created from the models. One that already has
+tables but no ``alembic_version`` was built by the old create-all-on-boot
+startup; ``create_all`` would skip its existing tables and stamping it would
+hide the missing columns, so it is reported as outdated instead.
+"""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.database import Base
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+# Schema produced by the create-all startup that predates revision tracking.
+BASELINE_REVISION = "1f2b6f8c0e11"
+
+_verified_urls: set[str] = set()
+
+
+@lru_cache(maxsize=1)
+def _script_directory():
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    return ScriptDirectory.from_config(config)
+
+
+@lru_cache(maxsize=1)
+def expected_revision() -> str | None:
+    """Head revision of the migration scripts bundled with this build."""
+    return _script_directory().get_current_head()
+
+
+def _current_revision(connection: Connection) -> str | None:
+    from alembic.runtime.migration import MigrationContext
+
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+def _has_application_tables(connection: Connection) -> bool:
+    return not set(Base.metadata.tables).isdisjoint(inspect(connection).get_table_names())
+
+
+def _create_and_stamp(connection: Connection) -> None:
+    from alembic.runtime.migration import MigrationContext
+
+    Base.metadata.create_all(connection)
+    MigrationContext.configure(connection).stamp(_script_directory(), "head")
+
+
+async def ensure_schema(engine: AsyncEngine, *, auto_create: bool) -> str:
+    """
+    Verify the database is at the expected Alembic revision.
+
+    Returns one of ``"cached"``, ``"current"``, ``"created"`` or ``"outdated"``.
+    With ``auto_create`` an empty database is created from the models and
+    stamped at head so subsequent boots take the fast path. Anything else
+    that is not at head is left untouched for ``alembic upgrade``.
+    """
+    url = engine.url.render_as_string(hide_password=False)
+    if url in _verified_urls:
+        return "cached"
+
+    head = expected_revision()
+    async with engine.begin() as conn:
+        current = await conn.run_sync(_current_revision)
+        if current == head:
+            _verified_urls.add(url)
+            return "current"
+
+        if current is None and await conn.run_sync(_has_application_tables):
+            logger.warning(
+                "Database has tables but no Alembic revision; run `alembic stamp %s` "
+                "and then `alembic upgrade head`.",
+                BASELINE_REVISION,
+            )
+            return "outdated"
+
+        if current is None and auto_create:
+            await conn.run_sync(_create_and_stamp)
+            logger.info("Database tables created and stamped at revision %s", head)
+            _verified_urls.add(url)
+            return "created"
+
+    logger.warning(
+        "Database is at revision %s but the code expects %s; run `alembic upgrade head`.",
+        current,
+        head,
+    )
+    return "outdated"
+
+
+def reset_schema_cache() -> None:
+    _verified_urls.clear()
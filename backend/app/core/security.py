@@ -1,23 +1,60 @@
+import hashlib
+import secrets
+import time
 from datetime import datetime, timedelta
-from typing import Any, Union
-from jose import jwt
+from typing import Any, Dict, Optional, Union
+from uuid import uuid4
+from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
 ALGORITHM = "HS256"
+ACCESS_TOKEN_TYPE = "access"
 
-def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
+def create_access_token(
+    subject: Union[str, Any],
+    expires_delta: timedelta = None,
+    claims: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Signed JWT with ``sub``, ``iat``, ``exp``, a unique ``jti`` (for
+    revocation) and any extra ``claims`` handlers can use without a lookup.
+    """
+    issued_at = time.time()
+    now = datetime.utcfromtimestamp(issued_at)
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
+        expire = now + timedelta(minutes=15)
     
-    to_encode = {"sub": str(subject), "exp": expire}
+    to_encode = {
+        **(claims or {}),
+        "sub": str(subject),
+        "type": ACCESS_TOKEN_TYPE,
+        # Fractional, so revocation cutoffs are exact (see app.core.revocation).
+        "iat": issued_at,
+        "exp": expire,
+        "jti": uuid4().hex,
+    }
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """Verified claims; raises ``jose.JWTError`` for bad, expired or non-access tokens."""
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    if payload.get("type") != ACCESS_TOKEN_TYPE or not payload.get("sub") or not payload.get("jti"):
+        raise JWTError("Not an access token")
+    return payload
+
+def create_refresh_token() -> str:
+    """Opaque random refresh token; only its hash is stored."""
+    return secrets.token_urlsafe(32)
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
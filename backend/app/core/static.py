@@ -0,0 +1,24 @@
+"""
+Static file mounts.
+
+``AvatarStaticFiles`` serves content-addressed avatar renditions (see
+``app.services.avatars``) with a year-long ``immutable`` ``Cache-Control``, so
+browsers and CDNs never revalidate them. Anything else under the mount, such
+as avatars uploaded before renditions existed, keeps the default headers.
+"""
+
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.services.avatars import CONTENT_ADDRESSED_PATH
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class AvatarStaticFiles(StaticFiles):
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304) and CONTENT_ADDRESSED_PATH.match(path.replace("\\", "/")):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -1,30 +1,43 @@
+import asyncio
 import logging
 import os
-from fastapi import FastAPI, Request
+import secrets
+from typing import Annotated
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-import sentry_sdk
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
 from app.core.logging_config import setup_logging
 from app.core.middleware import (
     SecurityHeadersMiddleware, 
     RequestContextMiddleware,
+    RequestBodyLimitMiddleware,
     limiter,
+    enforce_rate_limit,
     RateLimitExceeded,
     _rate_limit_exceeded_handler
 )
-from app.core.database import engine, Base
+from app.core.database import engine, get_db, pool_metrics
+from app.core.schema import ensure_schema
+from app.core.static import AvatarStaticFiles
+from app.services.avatars import AVATAR_DIR, AVATAR_URL_PREFIX, MULTIPART_OVERHEAD_BYTES
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
-# Setup Sentry
+# Setup Sentry (imported only when enabled: it pulls in httpcore/trio)
 if settings.SENTRY_DSN:
+    import sentry_sdk
+
     sentry_sdk.init(dsn=settings.SENTRY_DSN, traces_sample_rate=1.0)
 
 docs_url = "/docs" if settings.ENABLE_DOCS else None
@@ -44,8 +57,21 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 # Middlewares
+# Innermost: its receive() must reach the body parser directly, not through
+# a BaseHTTPMiddleware task group.
+app.add_middleware(
+    RequestBodyLimitMiddleware,
+    limits={f"{settings.API_V1_STR}/users/me/avatar": lambda: settings.AVATAR_MAX_BYTES + MULTIPART_OVERHEAD_BYTES},
+)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RequestContextMiddleware)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
 
 # Trusted hosts (Host header protection)
 if settings.ALLOWED_HOSTS:
@@ -61,31 +87,57 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
-# Static files
-os.makedirs("app/static/avatars", exist_ok=True)
+# Static files (the avatar mount must come first to take precedence)
+os.makedirs(AVATAR_DIR, exist_ok=True)
+app.mount(AVATAR_URL_PREFIX, AvatarStaticFiles(directory=AVATAR_DIR), name="avatars")
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 @app.on_event("startup")
 async def startup():
     logger.info("Starting up application...")
-    # Create tables (dev-only unless explicitly enabled)
-    if settings.AUTO_CREATE_TABLES:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created/verified")
+    # Cheap revision check instead of create_all on every boot; unversioned
+    # databases are created and stamped only when AUTO_CREATE_TABLES is set.
+    try:
+        app.state.schema_status = await ensure_schema(engine, auto_create=settings.AUTO_CREATE_TABLES)
+        logger.info(f"Database schema check: {app.state.schema_status}")
+    except Exception:
+        app.state.schema_status = "unavailable"
+        logger.exception("Database schema check failed; /health/ready will report the outage")
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     logger.error(f"Validation error on {request.url}: {exc.errors()}")
     return JSONResponse(
         status_code=422,
-        content={"detail": exc.errors(), "body": str(exc.body)},
+        content={"detail": jsonable_encoder(exc.errors()), "body": str(exc.body)},
     )
 
 @app.get("/health")
 def health_check():
     return {"status": "ok", "app_name": settings.PROJECT_NAME, "env": settings.ENVIRONMENT}
 
+@app.get("/health/live")
+def liveness():
+    # Process is up and serving; deliberately does no I/O.
+    return {"status": "ok"}
+
+@app.get("/health/ready")
+async def readiness(db: Annotated[AsyncSession, Depends(get_db)]):
+    try:
+        await asyncio.wait_for(db.execute(text("SELECT 1")), timeout=settings.HEALTH_READY_TIMEOUT_SECONDS)
+    except Exception as exc:
+        logger.warning(f"Readiness check failed: {exc!r}")
+        return JSONResponse(status_code=503, content={"status": "unavailable", "database": "unreachable"})
+    return {"status": "ok", "database": "ok"}
+
+@app.get("/health/db", include_in_schema=False)
+def database_pool_health(x_health_token: Annotated[str | None, Header()] = None):
+    # Operational detail: 404 unless the caller presents HEALTH_METRICS_TOKEN.
+    expected = settings.HEALTH_METRICS_TOKEN
+    if not expected or not x_health_token or not secrets.compare_digest(x_health_token, expected):
+        raise HTTPException(status_code=404, detail="Not Found")
+    return pool_metrics()
+
 @app.get("/")
 def root():
     return {"message": "Welcome to WealthSync API"}
@@ -93,19 +145,23 @@ def root():
 # Routes
 from app.api.v1 import (
     auth, income, categories, budgets, transactions, 
-    bills, savings, subscriptions, users, dashboard, notifications, health, autopilot
+    bills, savings, subscriptions, users, dashboard, notifications, health, autopilot,
+    categorization_rules,
 )
 
-app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["auth"])
-app.include_router(income.router, prefix=f"{settings.API_V1_STR}/income", tags=["income"])
-app.include_router(categories.router, prefix=f"{settings.API_V1_STR}/categories", tags=["categories"])
-app.include_router(budgets.router, prefix=f"{settings.API_V1_STR}/budgets", tags=["budgets"])
-app.include_router(transactions.router, prefix=f"{settings.API_V1_STR}/transactions", tags=["transactions"])
-app.include_router(bills.router, prefix=f"{settings.API_V1_STR}/bills", tags=["bills"])
-app.include_router(savings.router, prefix=f"{settings.API_V1_STR}/goals", tags=["savings"])
-app.include_router(subscriptions.router, prefix=f"{settings.API_V1_STR}/subscriptions", tags=["subscriptions"])
-app.include_router(users.router, prefix=f"{settings.API_V1_STR}/users", tags=["users"])
-app.include_router(dashboard.router, prefix=f"{settings.API_V1_STR}/dashboard", tags=["dashboard"])
-app.include_router(notifications.router, prefix=f"{settings.API_V1_STR}/notifications", tags=["notifications"])
-app.include_router(autopilot.router, prefix=f"{settings.API_V1_STR}/autopilot", tags=["autopilot"])
-app.include_router(health.router, prefix=f"{settings.API_V1_STR}/health", tags=["health"])
+rate_limited = [Depends(enforce_rate_limit)]
+
+app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["auth"], dependencies=rate_limited)
+app.include_router(income.router, prefix=f"{settings.API_V1_STR}/income", tags=["income"], dependencies=rate_limited)
+app.include_router(categories.router, prefix=f"{settings.API_V1_STR}/categories", tags=["categories"], dependencies=rate_limited)
+app.include_router(categorization_rules.router, prefix=f"{settings.API_V1_STR}/categorization-rules", tags=["categorization"], dependencies=rate_limited)
+app.include_router(budgets.router, prefix=f"{settings.API_V1_STR}/budgets", tags=["budgets"], dependencies=rate_limited)
+app.include_router(transactions.router, prefix=f"{settings.API_V1_STR}/transactions", tags=["transactions"], dependencies=rate_limited)
+app.include_router(bills.router, prefix=f"{settings.API_V1_STR}/bills", tags=["bills"], dependencies=rate_limited)
+app.include_router(savings.router, prefix=f"{settings.API_V1_STR}/goals", tags=["savings"], dependencies=rate_limited)
+app.include_router(subscriptions.router, prefix=f"{settings.API_V1_STR}/subscriptions", tags=["subscriptions"], dependencies=rate_limited)
+app.include_router(users.router, prefix=f"{settings.API_V1_STR}/users", tags=["users"], dependencies=rate_limited)
+app.include_router(dashboard.router, prefix=f"{settings.API_V1_STR}/dashboard", tags=["dashboard"], dependencies=rate_limited)
+app.include_router(notifications.router, prefix=f"{settings.API_V1_STR}/notifications", tags=["notifications"], dependencies=rate_limited)
+app.include_router(autopilot.router, prefix=f"{settings.API_V1_STR}/autopilot", tags=["autopilot"], dependencies=rate_limited)
+app.include_router(health.router, prefix=f"{settings.API_V1_STR}/health", tags=["health"], dependencies=rate_limited)
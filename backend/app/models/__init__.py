@@ -5,7 +5,11 @@ from app.models.budget import BudgetCategory, BudgetRule
 from app.models.transaction import Transaction
 from app.models.bill import Bill
 from app.models.savings import SavingsGoal
-from app.models.subscription import Subscription
+from app.models.subscription import Subscription, SubscriptionUsageEvent
 from app.models.health_score import FinancialHealthScore
 from app.models.notification import Notification
 from app.models.autopilot_payment import AutopilotPayment
+from app.models.categorization_rule import CategorizationRule
+from app.models.ledger import LedgerDailyNet, UserBalance
+from app.models.timeline import TimelineEvent, TimelineIndexState
+from app.models.refresh_token import RefreshToken
@@ -13,6 +13,7 @@ class BudgetCategory(Base):
     
     rules = relationship("BudgetRule", back_populates="category", cascade="all, delete-orphan")
     transactions = relationship("Transaction", back_populates="category")
+    categorization_rules = relationship("CategorizationRule", back_populates="category", cascade="all, delete-orphan")
 
 class BudgetRule(Base):
     __tablename__ = "budget_rules"
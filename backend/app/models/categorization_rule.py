@@ -0,0 +1,34 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+
+
+class CategorizationRule(Base):
+    __tablename__ = "categorization_rules"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid4()))
+    user_id = Column(String, index=True, nullable=False)
+    category_id = Column(String, ForeignKey("budget_categories.id"), nullable=False)
+
+    # CONTAINS (case-insensitive substring) | REGEX | AMOUNT (amount range only)
+    match_type = Column(String, nullable=False, default="CONTAINS")
+    pattern = Column(String, nullable=True)
+    min_amount = Column(Numeric(14, 2), nullable=True)
+    max_amount = Column(Numeric(14, 2), nullable=True)
+    # Higher priority wins when several rules match.
+    priority = Column(Integer, nullable=False, default=0)
+    is_active = Column(Boolean, nullable=False, default=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
+
+    category = relationship("BudgetCategory", back_populates="categorization_rules")
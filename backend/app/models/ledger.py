@@ -0,0 +1,185 @@
+"""
+Materialized ledger balances.
+
+``user_balances`` holds each user's lifetime balance (INCOME minus EXPENSE
+over every transaction) and ``ledger_daily_net`` the net change per calendar
+day. Both are kept in step with ``transactions`` inside the writing
+transaction: ORM writes through the ``after_flush`` hook below, Core
+``delete()``/``update()`` writes through :func:`record_ledger_changes`.
+``app.services.ledger.LedgerService`` reads, checks and rebuilds them.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import Column, Date, DateTime, Numeric, String, event, inspect, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.models.transaction import Transaction
+
+
+class UserBalance(Base):
+    __tablename__ = "user_balances"
+
+    user_id = Column(String, primary_key=True)
+    balance = Column(Numeric(14, 2), nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class LedgerDailyNet(Base):
+    __tablename__ = "ledger_daily_net"
+
+    # The primary key doubles as the (user_id, day) range index for
+    # balance-at-date lookups.
+    user_id = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)
+    net = Column(Numeric(14, 2), nullable=False, default=0)
+
+
+LEDGER_FIELDS = ("user_id", "amount", "type", "occurred_at", "created_at")
+
+# (user_id, day) -> signed amount
+LedgerDeltas = Dict[Tuple[str, date], Decimal]
+
+
+def signed_amount(amount, transaction_type: Optional[str]) -> Decimal:
+    if amount is None:
+        return Decimal("0")
+    value = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+    if transaction_type == "INCOME":
+        return value
+    if transaction_type == "EXPENSE":
+        return -value
+    return Decimal("0")
+
+
+def ledger_day(occurred_at: Optional[datetime], created_at: Optional[datetime] = None) -> date:
+    moment = occurred_at or created_at or datetime.utcnow()
+    return moment.date() if isinstance(moment, datetime) else moment
+
+
+def _add(deltas: LedgerDeltas, user_id: Optional[str], values: dict, sign: int) -> None:
+    if not user_id:
+        return
+    amount = signed_amount(values["amount"], values["type"])
+    if amount:
+        key = (user_id, ledger_day(values["occurred_at"], values["created_at"]))
+        deltas[key] += amount if sign > 0 else -amount
+
+
+def _previous_values(obj: Transaction) -> dict:
+    state = inspect(obj)
+    values = {}
+    for field in LEDGER_FIELDS:
+        history = state.attrs[field].history
+        if history.deleted:
+            values[field] = history.deleted[0]
+        elif history.unchanged:
+            values[field] = history.unchanged[0]
+        else:
+            values[field] = state.dict.get(field)
+    return values
+
+
+def _upsert(dialect_name: str, table, index_elements, set_):
+    """``INSERT ... ON CONFLICT DO UPDATE``; ``set_(excluded)`` gives the update values."""
+    if dialect_name == "postgresql":
+        statement = postgresql.insert(table)
+    elif dialect_name == "sqlite":
+        statement = sqlite.insert(table)
+    else:
+        return None
+    return statement.on_conflict_do_update(index_elements=index_elements, set_=set_(statement.excluded))
+
+
+def apply_ledger_deltas(connection, deltas: LedgerDeltas) -> None:
+    """Add ``deltas`` to the daily nets and user balances (synchronous connection)."""
+    daily = {key: amount for key, amount in deltas.items() if amount}
+    if not daily:
+        return
+    per_user: Dict[str, Decimal] = defaultdict(Decimal)
+    for (user_id, _), amount in daily.items():
+        per_user[user_id] += amount
+
+    now = datetime.utcnow()
+    daily_rows = [{"user_id": user_id, "day": day, "net": amount} for (user_id, day), amount in sorted(daily.items())]
+    balance_rows = [
+        {"user_id": user_id, "balance": amount, "updated_at": now} for user_id, amount in sorted(per_user.items())
+    ]
+
+    daily_table, balance_table = LedgerDailyNet.__table__, UserBalance.__table__
+    dialect_name = connection.dialect.name
+    daily_upsert = _upsert(
+        dialect_name, daily_table, ["user_id", "day"], lambda excluded: {"net": daily_table.c.net + excluded.net}
+    )
+    balance_upsert = _upsert(
+        dialect_name,
+        balance_table,
+        ["user_id"],
+        lambda excluded: {"balance": balance_table.c.balance + excluded.balance, "updated_at": excluded.updated_at},
+    )
+    if daily_upsert is not None:
+        connection.execute(daily_upsert, daily_rows)
+        connection.execute(balance_upsert, balance_rows)
+        return
+
+    # Other dialects: update, then insert the rows that did not exist yet.
+    for row in daily_rows:
+        result = connection.execute(
+            update(daily_table)
+            .where(daily_table.c.user_id == row["user_id"], daily_table.c.day == row["day"])
+            .values(net=daily_table.c.net + row["net"])
+        )
+        if not result.rowcount:
+            connection.execute(daily_table.insert().values(**row))
+    for row in balance_rows:
+        result = connection.execute(
+            update(balance_table)
+            .where(balance_table.c.user_id == row["user_id"])
+            .values(balance=balance_table.c.balance + row["balance"], updated_at=row["updated_at"])
+        )
+        if not result.rowcount:
+            connection.execute(balance_table.insert().values(**row))
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_ledger_after_flush(session, flush_context):
+    """Fold this flush's transaction inserts, edits and deletes into the ledger."""
+    deltas: LedgerDeltas = defaultdict(Decimal)
+    for obj in session.new:
+        if isinstance(obj, Transaction):
+            _add(deltas, obj.user_id, {field: getattr(obj, field) for field in LEDGER_FIELDS}, +1)
+    for obj in session.deleted:
+        if isinstance(obj, Transaction):
+            previous = _previous_values(obj)
+            _add(deltas, previous["user_id"], previous, -1)
+    for obj in session.dirty:
+        if not isinstance(obj, Transaction):
+            continue
+        state = inspect(obj)
+        if not any(state.attrs[field].history.has_changes() for field in LEDGER_FIELDS):
+            continue
+        previous = _previous_values(obj)
+        _add(deltas, previous["user_id"], previous, -1)
+        _add(deltas, obj.user_id, {field: getattr(obj, field) for field in LEDGER_FIELDS}, +1)
+    if any(deltas.values()):
+        apply_ledger_deltas(session.connection(), deltas)
+
+
+async def record_ledger_changes(db: AsyncSession, removed: Iterable = (), added: Iterable = ()) -> None:
+    """
+    For Core writes, which skip the flush hook. ``removed``/``added`` are rows
+    (e.g. from ``RETURNING``) with the ``LEDGER_FIELDS`` attributes.
+    """
+    deltas: LedgerDeltas = defaultdict(Decimal)
+    for sign, rows in ((-1, removed), (+1, added)):
+        for row in rows:
+            values = {field: getattr(row, field) for field in LEDGER_FIELDS}
+            _add(deltas, values["user_id"], values, sign)
+    if any(deltas.values()):
+        await db.run_sync(lambda session: apply_ledger_deltas(session.connection(), deltas))
@@ -0,0 +1,31 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import Column, DateTime, Index, String
+
+from app.core.database import Base
+
+
+class RefreshToken(Base):
+    """
+    One issued refresh token, stored as a SHA-256 of the opaque value.
+
+    Tokens are single-use: refreshing revokes the presented token and issues
+    a successor in the same ``family_id`` (one login session). Presenting an
+    already-rotated token revokes the whole family.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid4()))
+    user_id = Column(String, nullable=False)
+    family_id = Column(String, nullable=False)
+    token_hash = Column(String, nullable=False, unique=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)
+    replaced_by_id = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index("ix_refresh_tokens_user_id_family_id", "user_id", "family_id"),
+    )
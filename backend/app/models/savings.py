@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Numeric, Integer, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, Numeric, Integer, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from uuid import uuid4
 from datetime import datetime
@@ -30,3 +30,8 @@ class SavingsLog(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     goal = relationship("SavingsGoal", back_populates="logs")
+
+    __table_args__ = (
+        # Per-goal lookups, newest first (log pages, progress aggregates).
+        Index("ix_savings_logs_goal_id_created_at", "goal_id", "created_at"),
+    )
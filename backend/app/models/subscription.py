@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Numeric, Integer, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, Numeric, Integer, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from uuid import uuid4
 from datetime import datetime
@@ -13,9 +13,36 @@ class Subscription(Base):
     amount = Column(Numeric(14,2), nullable=False)
     billing_cycle = Column(String, default="monthly") # monthly, yearly
     next_billing_date = Column(DateTime, nullable=True)
+    # Day of month the schedule is pinned to; next_billing_date may be clamped
+    # (Feb 28 for a bill on the 31st). NULL: use next_billing_date's day.
+    billing_day = Column(Integer, nullable=True)
     usage_count = Column(Integer, default=0) # For "Cost per usage" analysis
     is_active = Column(Boolean, default=True)
     category_id = Column(String, ForeignKey("budget_categories.id"), nullable=True)
     
     # Relationship
     category = relationship("BudgetCategory", foreign_keys=[category_id])
+    usage_events = relationship(
+        "SubscriptionUsageEvent", back_populates="subscription", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+class SubscriptionUsageEvent(Base):
+    """
+    Append-only usage log. ``usage_count`` grows with it and also includes
+    uses counted before the log existed, which have no date.
+    """
+
+    __tablename__ = "subscription_usage_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    subscription_id = Column(String, ForeignKey("subscriptions.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(String, nullable=False)
+    used_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    quantity = Column(Integer, default=1, nullable=False)
+
+    subscription = relationship("Subscription", back_populates="usage_events")
+
+    __table_args__ = (
+        # Windowed per-user aggregates for analytics and triage.
+        Index("ix_subscription_usage_events_user_used_at", "user_id", "used_at", "subscription_id"),
+    )
@@ -0,0 +1,194 @@
+"""
+Persisted timeline event index.
+
+``timeline_events`` holds one row per timeline entry that can be stored ahead
+of the request, keyed by ``(user_id, event_date)``:
+
+* ``TRANSACTION`` rows mirror ``transactions`` and are kept in step inside the
+  writing transaction: ORM writes through the ``after_flush`` hook below, Core
+  ``update()``/``delete()`` writes through :func:`sync_timeline_transactions`.
+* ``BILL_DUE``, ``SUBSCRIPTION`` and ``SALARY`` rows are the recurring
+  occurrences for the next ``RECURRING_HORIZON_DAYS`` days. Their anchors depend
+  on the current date, so ``timeline_index_state.recurring_from`` records the
+  day they were expanded on; any bill, subscription or income change clears it
+  and ``TimelineService.ensure_recurring`` re-expands on the next read.
+
+Values that change without touching these rows (category names, payment
+order status, goal contributions, the month-end projection) are overlaid at
+read time by ``app.services.timeline.TimelineService``.
+"""
+
+from datetime import datetime
+from itertools import chain
+from typing import Iterable, List, Set
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Index,
+    Numeric,
+    String,
+    case,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.models.bill import Bill
+from app.models.income import IncomeSource
+from app.models.subscription import Subscription
+from app.models.transaction import Transaction
+
+RECURRING_HORIZON_DAYS = 365
+TRANSACTION_SOURCE = "TRANSACTION"
+TIMELINE_FIELDS = ("user_id", "amount", "type", "description", "category_id", "occurred_at")
+SYNC_CHUNK_SIZE = 500
+
+
+class TimelineEvent(Base):
+    __tablename__ = "timeline_events"
+
+    # "<source_type>:<source_id>" for transactions and
+    # "<source_type>:<source_id>:<date>" for recurring occurrences.
+    id = Column(String, primary_key=True)
+    user_id = Column(String, nullable=False)
+    event_date = Column(Date, nullable=False)
+    event_type = Column(String, nullable=False)
+    # Tie-break within a (date, type): occurred_at for transactions, midnight otherwise.
+    sort_at = Column(DateTime, nullable=False)
+    source_type = Column(String, nullable=False)  # TRANSACTION | BILL | SUBSCRIPTION | INCOME
+    source_id = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    amount = Column(Numeric(14, 2), nullable=False)
+    is_automatic = Column(Boolean, default=False, nullable=False)
+    category_id = Column(String, nullable=True)
+    transaction_type = Column(String, nullable=True)
+    details = Column(JSON, nullable=True)
+
+    __table_args__ = (
+        # Serves both the window range scan and the keyset pagination order.
+        Index("ix_timeline_events_user_window", "user_id", "event_date", "event_type", "sort_at", "id"),
+    )
+
+
+class TimelineIndexState(Base):
+    __tablename__ = "timeline_index_state"
+
+    user_id = Column(String, primary_key=True)
+    # Day the recurring rows were expanded on; NULL once a source changed.
+    recurring_from = Column(Date, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+def transaction_event_id(transaction_id: str) -> str:
+    return f"{TRANSACTION_SOURCE}:{transaction_id}"
+
+
+def transaction_event_source():
+    """``SELECT`` producing the TRANSACTION rows, in ``TRANSACTION_EVENT_COLUMNS`` order."""
+    return select(
+        literal(f"{TRANSACTION_SOURCE}:") + Transaction.id,
+        Transaction.user_id,
+        func.date(Transaction.occurred_at, type_=Date),
+        literal(TRANSACTION_SOURCE),
+        Transaction.occurred_at,
+        literal(TRANSACTION_SOURCE),
+        Transaction.id,
+        case((func.coalesce(Transaction.description, "") == "", "Transaction"), else_=Transaction.description),
+        case((Transaction.type == "EXPENSE", -Transaction.amount), else_=Transaction.amount),
+        literal(False),
+        Transaction.category_id,
+        Transaction.type,
+    ).where(
+        Transaction.user_id.is_not(None),
+        Transaction.occurred_at.is_not(None),
+    )
+
+
+TRANSACTION_EVENT_COLUMNS = [
+    "id",
+    "user_id",
+    "event_date",
+    "event_type",
+    "sort_at",
+    "source_type",
+    "source_id",
+    "title",
+    "amount",
+    "is_automatic",
+    "category_id",
+    "transaction_type",
+]
+
+
+def _chunks(values: Iterable[str]) -> Iterable[List[str]]:
+    unique = list(dict.fromkeys(values))
+    for start in range(0, len(unique), SYNC_CHUNK_SIZE):
+        yield unique[start:start + SYNC_CHUNK_SIZE]
+
+
+def sync_transaction_events(connection, transaction_ids: Iterable[str]) -> None:
+    """Re-derive the TRANSACTION rows for ``transaction_ids`` (synchronous connection)."""
+    table = TimelineEvent.__table__
+    for chunk in _chunks(transaction_ids):
+        connection.execute(delete(table).where(table.c.id.in_([transaction_event_id(value) for value in chunk])))
+        connection.execute(
+            insert(table).from_select(
+                TRANSACTION_EVENT_COLUMNS, transaction_event_source().where(Transaction.id.in_(chunk))
+            )
+        )
+
+
+def mark_recurring_stale(connection, user_ids: Iterable[str]) -> None:
+    """Make the next read re-expand these users' recurring rows (synchronous connection)."""
+    table = TimelineIndexState.__table__
+    for chunk in _chunks(user_id for user_id in user_ids if user_id):
+        connection.execute(update(table).where(table.c.user_id.in_(chunk)).values(recurring_from=None))
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_timeline_after_flush(session, flush_context):
+    """Mirror this flush's transaction writes and flag recurring-source changes."""
+    transaction_ids: List[str] = []
+    stale_users: Set[str] = set()
+    for obj in chain(session.new, session.deleted):
+        if isinstance(obj, Transaction):
+            transaction_ids.append(obj.id)
+        elif isinstance(obj, (Bill, Subscription, IncomeSource)):
+            stale_users.add(obj.user_id)
+    for obj in session.dirty:
+        if isinstance(obj, Transaction):
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in TIMELINE_FIELDS):
+                transaction_ids.append(obj.id)
+        elif isinstance(obj, (Bill, Subscription, IncomeSource)) and session.is_modified(obj):
+            stale_users.add(obj.user_id)
+    if transaction_ids:
+        sync_transaction_events(session.connection(), transaction_ids)
+    if stale_users:
+        mark_recurring_stale(session.connection(), stale_users)
+
+
+async def sync_timeline_transactions(db: AsyncSession, transaction_ids: Iterable[str]) -> None:
+    """For Core writes to ``transactions``, which skip the flush hook."""
+    ids = list(transaction_ids)
+    if ids:
+        await db.run_sync(lambda session: sync_transaction_events(session.connection(), ids))
+
+
+async def invalidate_recurring_timeline(db: AsyncSession, user_ids: Iterable[str]) -> None:
+    """For Core writes to bills, subscriptions or income sources."""
+    ids = list(user_ids)
+    if ids:
+        await db.run_sync(lambda session: mark_recurring_stale(session.connection(), ids))
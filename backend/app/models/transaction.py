@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey
+from sqlalchemy import DDL, Column, String, Numeric, DateTime, ForeignKey, event
 from sqlalchemy.orm import relationship
 from uuid import uuid4
 from datetime import datetime
@@ -22,3 +22,41 @@ class Transaction(Base):
     subscription_id = Column(String, ForeignKey("subscriptions.id"), nullable=True)
 
     category = relationship("BudgetCategory", back_populates="transactions")
+
+
+# Description search indexes (see app/services/transaction_search.py).
+# Production databases get these from the Alembic migration; the DDL below
+# covers create_all (dev/tests). PostgreSQL uses pg_trgm + a tsvector
+# expression index; SQLite uses an external-content FTS5 trigram table kept in
+# sync by triggers.
+_POSTGRES_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_transactions_description_trgm "
+    "ON transactions USING gin (description gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_transactions_description_tsv "
+    "ON transactions USING gin (to_tsvector('simple', coalesce(description, '')))",
+]
+
+_SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts "
+    "USING fts5(description, content='transactions', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.rowid, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+    "VALUES ('delete', old.rowid, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_au AFTER UPDATE OF description ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+    "VALUES ('delete', old.rowid, old.description); "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.rowid, new.description); END",
+]
+
+for _statement in _POSTGRES_SEARCH_DDL:
+    event.listen(Transaction.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in _SQLITE_SEARCH_DDL:
+    event.listen(Transaction.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Transaction.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS transactions_fts").execute_if(dialect="sqlite"),
+)
@@ -1,5 +1,7 @@
 from uuid import uuid4
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, event, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from datetime import datetime
 from app.core.database import Base
 
@@ -13,3 +15,36 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     full_name = Column(String, nullable=True)
     avatar_url = Column(String, nullable=True)
+    # Bumped by every write to the user's data; part of response cache keys.
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+def _bump_statement(user_ids):
+    return (
+        update(User.__table__)
+        .where(User.__table__.c.id.in_(sorted(user_ids)))
+        .values(data_version=User.__table__.c.data_version + 1)
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_data_version_after_flush(session, flush_context):
+    """Bump ``data_version`` for every user whose rows this flush touched."""
+    user_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, User):
+            # A brand-new user starts at the column default.
+            user_id = None if obj in session.new else obj.id
+        else:
+            user_id = getattr(obj, "user_id", None)
+        if user_id:
+            user_ids.add(user_id)
+    if user_ids:
+        session.connection().execute(_bump_statement(user_ids))
+
+
+async def bump_data_version(db: AsyncSession, user_id: str) -> None:
+    """For Core ``update()``/``delete()`` writes, which skip the flush hook."""
+    await db.execute(_bump_statement({user_id}))
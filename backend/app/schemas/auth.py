@@ -5,9 +5,19 @@ from app.core.config import settings
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None  # access token lifetime, seconds
+
+class RefreshRequest(BaseModel):
+    refresh_token: str = Field(min_length=1, max_length=256)
 
 class TokenPayload(BaseModel):
-    sub: Optional[str] = None
+    sub: str
+    jti: str
+    iat: float
+    exp: int
+    email: Optional[str] = None
+    sid: Optional[str] = None  # refresh-token family (login session)
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -0,0 +1,49 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.budget import CategoryResponse
+
+
+class CategorizationRuleBase(BaseModel):
+    category_id: str
+    match_type: Literal["CONTAINS", "REGEX", "AMOUNT"] = "CONTAINS"
+    pattern: Optional[str] = Field(default=None, max_length=200)
+    min_amount: Optional[Decimal] = None
+    max_amount: Optional[Decimal] = None
+    priority: int = 0
+    is_active: bool = True
+
+
+class CategorizationRuleCreate(CategorizationRuleBase):
+    pass
+
+
+class CategorizationRuleUpdate(CategorizationRuleBase):
+    category_id: Optional[str] = None
+    match_type: Optional[Literal["CONTAINS", "REGEX", "AMOUNT"]] = None
+    priority: Optional[int] = None
+    is_active: Optional[bool] = None
+
+
+class CategorizationRuleResponse(CategorizationRuleBase):
+    id: str
+    user_id: str
+    created_at: Optional[datetime] = None
+    category: Optional[CategoryResponse] = None
+
+    class Config:
+        from_attributes = True
+
+
+class RecategorizeRequest(BaseModel):
+    # False re-applies rules to already categorized transactions as well.
+    only_uncategorized: bool = True
+
+
+class RecategorizeResult(BaseModel):
+    scanned: int
+    updated: int
+    by_category: Dict[str, int]
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
-from datetime import datetime
+from datetime import date, datetime
 from pydantic import BaseModel
 
 class SavingsGoalBase(BaseModel):
@@ -45,3 +45,25 @@ class SavingsLogResponse(BaseModel):
 class SavingsContribution(BaseModel):
     amount: Decimal
     note: Optional[str] = None
+
+class SavingsMonthlyContribution(BaseModel):
+    month: str  # YYYY-MM
+    total: Decimal
+    count: int
+
+class SavingsGoalProgressResponse(BaseModel):
+    goal_id: str
+    target_amount: Decimal
+    current_amount: Decimal
+    remaining: Decimal
+    progress_percent: float
+    is_completed: bool
+    contribution_count: int
+    total_contributed: Decimal
+    average_contribution: Decimal
+    average_monthly_contribution: Decimal
+    first_contribution_at: Optional[datetime] = None
+    last_contribution_at: Optional[datetime] = None
+    estimate_basis: Optional[str] = None  # "history" | "planned"
+    estimated_completion_date: Optional[date] = None
+    monthly: List[SavingsMonthlyContribution]
@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import Dict, List, Optional
 from decimal import Decimal
-from datetime import datetime
-from pydantic import BaseModel
+from datetime import datetime, timedelta, timezone
+from pydantic import BaseModel, Field, field_validator
 from app.schemas.budget import CategoryResponse
 
 class SubscriptionBase(BaseModel):
@@ -31,3 +31,55 @@ class SubscriptionResponse(SubscriptionBase):
 
     class Config:
         from_attributes = True
+
+# Client clocks drift; check-ins a little ahead of the server are accepted.
+USAGE_CLOCK_SKEW = timedelta(minutes=5)
+
+class SubscriptionUsageIn(BaseModel):
+    subscription_id: str
+    used_at: Optional[datetime] = None  # defaults to now
+    quantity: int = Field(default=1, ge=1, le=1000)
+
+    @field_validator("used_at")
+    @classmethod
+    def used_at_in_utc_and_not_in_future(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """Stored as naive UTC; offset-aware values are converted, naive ones taken as UTC."""
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        if value > datetime.utcnow() + USAGE_CLOCK_SKEW:
+            raise ValueError("used_at cannot be in the future")
+        return value
+
+class SubscriptionUsageBatch(BaseModel):
+    events: List[SubscriptionUsageIn] = Field(min_length=1, max_length=500)
+
+class SubscriptionUsageBatchResult(BaseModel):
+    recorded: int
+    subscriptions: List[SubscriptionResponse]
+
+class SubscriptionWindowUsage(BaseModel):
+    uses: int
+    cost: float
+    cost_per_use: Optional[float] = None
+
+class SubscriptionUsageAnalytics(BaseModel):
+    subscription_id: str
+    name: str
+    is_active: bool
+    billing_cycle: Optional[str] = None
+    monthly_cost: float
+    usage_count: int
+    last_used_at: Optional[datetime] = None
+    windows: Dict[str, SubscriptionWindowUsage]
+    trend: str  # rising | falling | flat | unused
+    trend_previous_uses: int
+
+class SubscriptionAnalyticsResponse(BaseModel):
+    generated_at: datetime
+    windows: List[str]
+    trend_window: str
+    total_monthly_cost: float
+    unused_count: int
+    items: List[SubscriptionUsageAnalytics]
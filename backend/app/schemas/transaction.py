@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import List, Literal, Optional
 from decimal import Decimal
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from app.schemas.budget import CategoryResponse
 
 class TransactionBase(BaseModel):
@@ -29,3 +29,22 @@ class TransactionResponse(TransactionBase):
 
     class Config:
         from_attributes = True
+
+# --- Bulk Schemas ---
+MAX_BULK_IDS = 5000
+
+class TransactionBulkUpdate(BaseModel):
+    ids: List[str] = Field(min_length=1, max_length=MAX_BULK_IDS)
+    # Send category_id: null to clear the category.
+    category_id: Optional[str] = None
+    # "completed" applies the same side effects as POST /{id}/complete.
+    status: Optional[Literal["pending", "completed"]] = None
+
+class TransactionBulkDelete(BaseModel):
+    ids: List[str] = Field(min_length=1, max_length=MAX_BULK_IDS)
+
+class TransactionBulkResult(BaseModel):
+    matched: int
+    updated: int
+    bills_updated: int = 0
+    subscriptions_updated: int = 0
@@ -0,0 +1,156 @@
+"""
+Access/refresh token pairs.
+
+A login starts a refresh-token family. ``rotate`` spends the presented
+refresh token with one conditional ``UPDATE ... RETURNING`` (only an unrevoked,
+unexpired token matches), so two concurrent refreshes with the same token
+cannot both succeed; the loser, like any replay of a rotated token, revokes
+the whole family.
+
+Refresh-token rows are written with Core statements: they are session
+bookkeeping, not user data, and must not bump ``data_version``.
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import security
+from app.core.config import settings
+from app.core.revocation import get_revocation_list
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+
+class InvalidRefreshToken(Exception):
+    pass
+
+
+class TokenService:
+    @staticmethod
+    def access_token(user_id: str, email: str, session_id: str) -> str:
+        return security.create_access_token(
+            user_id,
+            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+            claims={"email": email, "sid": session_id},
+        )
+
+    @staticmethod
+    async def _new_refresh_token(
+        db: AsyncSession, user_id: str, family_id: str, now: datetime, token_id: Optional[str] = None
+    ) -> str:
+        token = security.create_refresh_token()
+        await db.execute(
+            insert(RefreshToken).values(
+                id=token_id or str(uuid4()),
+                user_id=user_id,
+                family_id=family_id,
+                token_hash=security.hash_token(token),
+                created_at=now,
+                expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            )
+        )
+        return token
+
+    @staticmethod
+    def _pair(access_token: str, refresh_token: str) -> Dict[str, Any]:
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer",
+            "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        }
+
+    @staticmethod
+    async def issue(db: AsyncSession, user: User) -> Dict[str, Any]:
+        """Start a new session for ``user``. Does not commit."""
+        family_id = str(uuid4())
+        refresh_token = await TokenService._new_refresh_token(db, user.id, family_id, datetime.utcnow())
+        return TokenService._pair(TokenService.access_token(user.id, user.email, family_id), refresh_token)
+
+    @staticmethod
+    async def rotate(db: AsyncSession, refresh_token: str) -> Dict[str, Any]:
+        """
+        Spend ``refresh_token`` and return a fresh pair for the same session.
+        Raises ``InvalidRefreshToken``; a replayed token revokes its family.
+        Commits.
+        """
+        now = datetime.utcnow()
+        token_hash = security.hash_token(refresh_token)
+        successor_id = str(uuid4())
+        spent = (
+            await db.execute(
+                update(RefreshToken)
+                .where(
+                    RefreshToken.token_hash == token_hash,
+                    RefreshToken.revoked_at.is_(None),
+                    RefreshToken.expires_at > now,
+                )
+                .values(revoked_at=now, replaced_by_id=successor_id)
+                .returning(RefreshToken.user_id, RefreshToken.family_id)
+            )
+        ).first()
+        if spent is None:
+            replayed = (
+                await db.execute(
+                    select(RefreshToken.user_id, RefreshToken.family_id).where(
+                        RefreshToken.token_hash == token_hash, RefreshToken.revoked_at.is_not(None)
+                    )
+                )
+            ).first()
+            if replayed is not None:
+                await TokenService.revoke_session(db, replayed.user_id, replayed.family_id, now=now)
+                await db.commit()
+            raise InvalidRefreshToken()
+
+        user = (
+            await db.execute(select(User.id, User.email, User.is_active).where(User.id == spent.user_id))
+        ).first()
+        if user is None or not user.is_active:
+            await db.rollback()
+            raise InvalidRefreshToken()
+
+        token = await TokenService._new_refresh_token(db, user.id, spent.family_id, now, successor_id)
+        await db.commit()
+        return TokenService._pair(TokenService.access_token(user.id, user.email, spent.family_id), token)
+
+    @staticmethod
+    async def revoke_session(
+        db: AsyncSession, user_id: str, family_id: str, *, now: Optional[datetime] = None
+    ) -> None:
+        """Revoke every live refresh token of one session. Does not commit."""
+        await db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.family_id == family_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=now or datetime.utcnow())
+        )
+
+    @staticmethod
+    async def logout(db: AsyncSession, user_id: str, session_id: Optional[str], jti: str, expires_at: float) -> None:
+        """End one session: its refresh tokens and the presented access token. Commits."""
+        if session_id:
+            await TokenService.revoke_session(db, user_id, session_id)
+            await db.commit()
+        await get_revocation_list().revoke_token(jti, expires_at)
+
+    @staticmethod
+    async def revoke_all(db: AsyncSession, user_id: str) -> None:
+        """
+        End every session of ``user_id``: all refresh tokens, and access
+        tokens issued before now. Does not commit.
+        """
+        now = datetime.utcnow()
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+        await get_revocation_list().revoke_user(user_id, time.time())
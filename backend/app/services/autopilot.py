@@ -13,9 +13,12 @@ from app.models.bill import Bill
 from app.models.budget import BudgetCategory, BudgetRule
 from app.models.income import IncomeSource
 from app.models.notification import Notification
-from app.models.savings import SavingsGoal, SavingsLog
+from app.models.savings import SavingsGoal
 from app.models.subscription import Subscription
 from app.models.transaction import Transaction
+from app.services.ledger import LedgerService
+from app.services.recurrence import RecurrenceRule, add_interval, monthly_multiplier
+from app.services.savings import SavingsService
 
 
 class AutopilotService:
@@ -58,19 +61,8 @@ class AutopilotService:
 
     @staticmethod
     def _monthly_multiplier(frequency: str | None) -> Decimal:
-        value = (frequency or "monthly").strip().lower()
-        if value == "monthly":
-            return Decimal("1")
-        if value == "weekly":
-            return Decimal("52") / Decimal("12")
-        if value == "biweekly":
-            return Decimal("26") / Decimal("12")
-        if value == "yearly":
-            return Decimal("1") / Decimal("12")
-        if value == "daily":
-            return Decimal("30")
         # Unknown frequencies default to monthly for safety.
-        return Decimal("1")
+        return monthly_multiplier(frequency)
 
     @staticmethod
     def _to_money(value: Decimal) -> float:
@@ -138,15 +130,28 @@ class AutopilotService:
             )
         )
 
+    @classmethod
+    def _bill_rule(cls, now: datetime, bill: Bill) -> RecurrenceRule:
+        return RecurrenceRule.from_frequency(
+            bill.frequency,
+            cls._next_recurring_date(now, bill.due_day),
+            day_of_month=bill.due_day,
+        )
+
     @staticmethod
-    def _resolve_subscription_due_date(now: datetime, subscription: Subscription) -> datetime:
-        cycle_days = 30 if (subscription.billing_cycle or "monthly") == "monthly" else 365
+    def _subscription_rule(subscription: Subscription) -> RecurrenceRule:
+        return RecurrenceRule.from_frequency(
+            subscription.billing_cycle,
+            subscription.next_billing_date,
+            day_of_month=subscription.billing_day,
+        )
+
+    @classmethod
+    def _resolve_subscription_due_date(cls, now: datetime, subscription: Subscription) -> datetime:
         if subscription.next_billing_date:
-            next_due = subscription.next_billing_date
-            while next_due.date() < now.date():
-                next_due = next_due + timedelta(days=cycle_days)
-            return next_due
-        return now + timedelta(days=cycle_days)
+            next_due = cls._subscription_rule(subscription).next_occurrence(now)
+            return datetime.combine(next_due, subscription.next_billing_date.time())
+        return add_interval(now, subscription.billing_cycle)
 
     @classmethod
     async def _current_month_income_from_transactions(
@@ -200,49 +205,46 @@ class AutopilotService:
         )
         bills = bills_res.scalars().all()
         for bill in bills:
-            due_on = cls._next_recurring_date(now, bill.due_day).date()
-            if due_on < today or due_on > horizon:
-                continue
-
-            dedupe_key = ("BILL", bill.id, due_on)
-            if dedupe_key in existing_keys:
-                continue
-
-            order = AutopilotPayment(
-                user_id=user_id,
-                source_type="BILL",
-                source_id=bill.id,
-                title=bill.name,
-                amount=cls._to_decimal(bill.amount_estimated),
-                currency="INR",
-                due_on=due_on,
-                status="approval_required",
-                approval_required=True,
-                provider=settings.PAYMENTS_PROVIDER,
-                category_id=bill.category_id,
-                meta_json=cls._dump_meta(
-                    {
-                        "autopay_enabled": bool(bill.autopay_enabled),
-                        "frequency": bill.frequency or "monthly",
-                    }
-                ),
-            )
-            session.add(order)
-            existing_keys[dedupe_key] = order
-            prepared_orders.append(order)
+            for due_on in cls._bill_rule(now, bill).between(today, horizon):
+                dedupe_key = ("BILL", bill.id, due_on)
+                if dedupe_key in existing_keys:
+                    continue
 
-            await cls._create_notification(
-                session=session,
-                user_id=user_id,
-                title=f"Approval needed: {bill.name}",
-                message=(
-                    f"Approve INR {cls._to_money(cls._to_decimal(bill.amount_estimated)):.2f} "
-                    f"for {bill.name} (due {due_on.isoformat()})."
-                ),
-                notification_type="payment_approval_required",
-                action_url="/dashboard",
-                related_id=order.id,
-            )
+                order = AutopilotPayment(
+                    user_id=user_id,
+                    source_type="BILL",
+                    source_id=bill.id,
+                    title=bill.name,
+                    amount=cls._to_decimal(bill.amount_estimated),
+                    currency="INR",
+                    due_on=due_on,
+                    status="approval_required",
+                    approval_required=True,
+                    provider=settings.PAYMENTS_PROVIDER,
+                    category_id=bill.category_id,
+                    meta_json=cls._dump_meta(
+                        {
+                            "autopay_enabled": bool(bill.autopay_enabled),
+                            "frequency": bill.frequency or "monthly",
+                        }
+                    ),
+                )
+                session.add(order)
+                existing_keys[dedupe_key] = order
+                prepared_orders.append(order)
+
+                await cls._create_notification(
+                    session=session,
+                    user_id=user_id,
+                    title=f"Approval needed: {bill.name}",
+                    message=(
+                        f"Approve INR {cls._to_money(cls._to_decimal(bill.amount_estimated)):.2f} "
+                        f"for {bill.name} (due {due_on.isoformat()})."
+                    ),
+                    notification_type="payment_approval_required",
+                    action_url="/dashboard",
+                    related_id=order.id,
+                )
 
         subscriptions_res = await session.execute(
             select(Subscription).filter(
@@ -255,47 +257,48 @@ class AutopilotService:
             due_at = cls._resolve_subscription_due_date(now, subscription)
             if subscription.next_billing_date is None:
                 subscription.next_billing_date = due_at
+                subscription.billing_day = due_at.day
                 session.add(subscription)
-            due_on = due_at.date()
-            if due_on < today or due_on > horizon:
-                continue
-
-            dedupe_key = ("SUBSCRIPTION", subscription.id, due_on)
-            if dedupe_key in existing_keys:
-                continue
-
-            order = AutopilotPayment(
-                user_id=user_id,
-                source_type="SUBSCRIPTION",
-                source_id=subscription.id,
-                title=subscription.name,
-                amount=cls._to_decimal(subscription.amount),
-                currency="INR",
-                due_on=due_on,
-                status="approval_required",
-                approval_required=True,
-                provider=settings.PAYMENTS_PROVIDER,
-                category_id=subscription.category_id,
-                meta_json=cls._dump_meta(
-                    {"billing_cycle": subscription.billing_cycle or "monthly"}
-                ),
+            billing_rule = RecurrenceRule.from_frequency(
+                subscription.billing_cycle, due_at, day_of_month=subscription.billing_day
             )
-            session.add(order)
-            existing_keys[dedupe_key] = order
-            prepared_orders.append(order)
+            for due_on in billing_rule.between(today, horizon):
+                dedupe_key = ("SUBSCRIPTION", subscription.id, due_on)
+                if dedupe_key in existing_keys:
+                    continue
 
-            await cls._create_notification(
-                session=session,
-                user_id=user_id,
-                title=f"Approval needed: {subscription.name}",
-                message=(
-                    f"Approve INR {cls._to_money(cls._to_decimal(subscription.amount)):.2f} "
-                    f"for {subscription.name} (due {due_on.isoformat()})."
-                ),
-                notification_type="payment_approval_required",
-                action_url="/dashboard",
-                related_id=order.id,
-            )
+                order = AutopilotPayment(
+                    user_id=user_id,
+                    source_type="SUBSCRIPTION",
+                    source_id=subscription.id,
+                    title=subscription.name,
+                    amount=cls._to_decimal(subscription.amount),
+                    currency="INR",
+                    due_on=due_on,
+                    status="approval_required",
+                    approval_required=True,
+                    provider=settings.PAYMENTS_PROVIDER,
+                    category_id=subscription.category_id,
+                    meta_json=cls._dump_meta(
+                        {"billing_cycle": subscription.billing_cycle or "monthly"}
+                    ),
+                )
+                session.add(order)
+                existing_keys[dedupe_key] = order
+                prepared_orders.append(order)
+
+                await cls._create_notification(
+                    session=session,
+                    user_id=user_id,
+                    title=f"Approval needed: {subscription.name}",
+                    message=(
+                        f"Approve INR {cls._to_money(cls._to_decimal(subscription.amount)):.2f} "
+                        f"for {subscription.name} (due {due_on.isoformat()})."
+                    ),
+                    notification_type="payment_approval_required",
+                    action_url="/dashboard",
+                    related_id=order.id,
+                )
 
         if commit and prepared_orders:
             await session.commit()
@@ -560,24 +563,24 @@ class AutopilotService:
                 status="completed",
                 subscription_id=subscription.id,
             )
-            cycle_days = 30 if (subscription.billing_cycle or "monthly") == "monthly" else 365
             base_date = subscription.next_billing_date or now
             if base_date < now:
+                # Overdue: the schedule restarts from today.
                 base_date = now
-            subscription.next_billing_date = base_date + timedelta(days=cycle_days)
+                subscription.billing_day = now.day
+            subscription.billing_day = subscription.billing_day or base_date.day
+            subscription.next_billing_date = add_interval(
+                base_date, subscription.billing_cycle, day_of_month=subscription.billing_day
+            )
             session.add(transaction)
             session.add(subscription)
             await session.flush()
             order.transaction_id = transaction.id
 
         elif order.source_type == "GOAL":
-            goal_res = await session.execute(
-                select(SavingsGoal).filter(
-                    SavingsGoal.id == order.source_id,
-                    SavingsGoal.user_id == order.user_id,
-                )
+            goal = await SavingsService.contribute_one(
+                session, order.user_id, order.source_id, amount_decimal, "Autopilot contribution"
             )
-            goal = goal_res.scalars().first()
             if not goal:
                 order.status = "failed"
                 order.failure_reason = "Linked savings goal not found."
@@ -586,18 +589,6 @@ class AutopilotService:
                 await session.refresh(order)
                 return cls._serialize_payment_order(order)
 
-            goal.current_amount = cls._to_decimal(goal.current_amount) + amount_decimal
-            if cls._to_decimal(goal.current_amount) >= cls._to_decimal(goal.target_amount):
-                goal.is_completed = True
-
-            session.add(
-                SavingsLog(
-                    goal_id=goal.id,
-                    amount=amount_decimal,
-                    note="Autopilot contribution",
-                )
-            )
-
             transaction = Transaction(
                 user_id=order.user_id,
                 category_id=order.category_id,
@@ -607,7 +598,6 @@ class AutopilotService:
                 occurred_at=now,
                 status="completed",
             )
-            session.add(goal)
             session.add(transaction)
             await session.flush()
             order.transaction_id = transaction.id
@@ -688,12 +678,69 @@ class AutopilotService:
         free_money_min_percent: float = 20.0,
     ) -> Dict[str, Any]:
         now = datetime.utcnow()
-        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        floor_percent = max(0.0, min(float(free_money_min_percent), 80.0))
 
         income_res = await session.execute(select(IncomeSource).filter(IncomeSource.user_id == user_id))
         income_sources = income_res.scalars().all()
 
+        monthly_income_from_transactions = await cls._current_month_income_from_transactions(
+            session, user_id, now
+        )
+
+        bills_res = await session.execute(select(Bill).filter(Bill.user_id == user_id))
+        bills = bills_res.scalars().all()
+
+        subs_res = await session.execute(
+            select(Subscription).filter(Subscription.user_id == user_id, Subscription.is_active == True)
+        )
+        subscriptions = subs_res.scalars().all()
+
+        goals_res = await session.execute(
+            select(SavingsGoal).filter(SavingsGoal.user_id == user_id, SavingsGoal.is_completed == False)
+        )
+        goals = goals_res.scalars().all()
+
+        budget_categories_res = await session.execute(
+            select(BudgetCategory).filter(BudgetCategory.user_id == user_id)
+        )
+        budget_categories = budget_categories_res.scalars().all()
+
+        budget_rules_res = await session.execute(
+            select(BudgetRule).filter(BudgetRule.user_id == user_id)
+        )
+        budget_rules = budget_rules_res.scalars().all()
+
+        return cls.build_salary_rule_split(
+            now=now,
+            income_sources=income_sources,
+            monthly_income_from_transactions=monthly_income_from_transactions,
+            bills=bills,
+            subscriptions=subscriptions,
+            goals=goals,
+            budget_categories=budget_categories,
+            budget_rules=budget_rules,
+            salary_override=salary_override,
+            free_money_min_percent=free_money_min_percent,
+        )
+
+    @classmethod
+    def build_salary_rule_split(
+        cls,
+        *,
+        now: datetime,
+        income_sources: List[IncomeSource],
+        monthly_income_from_transactions: Decimal,
+        bills: List[Bill],
+        subscriptions: List[Subscription],
+        goals: List[SavingsGoal],
+        budget_categories: List[BudgetCategory],
+        budget_rules: List[BudgetRule],
+        salary_override: float | None = None,
+        free_money_min_percent: float = 20.0,
+    ) -> Dict[str, Any]:
+        """Pure salary split over already-loaded rows (no I/O)."""
+        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        floor_percent = max(0.0, min(float(free_money_min_percent), 80.0))
+
         estimated_salary_from_sources = sum(
             (
                 cls._to_decimal(income.amount) * cls._monthly_multiplier(income.frequency)
@@ -703,10 +750,6 @@ class AutopilotService:
             Decimal("0"),
         )
 
-        monthly_income_from_transactions = await cls._current_month_income_from_transactions(
-            session, user_id, now
-        )
-
         if salary_override is None:
             if monthly_income_from_transactions > 0:
                 salary_considered = max(Decimal("0"), monthly_income_from_transactions)
@@ -718,9 +761,6 @@ class AutopilotService:
             salary_considered = max(Decimal("0"), cls._to_decimal(salary_override))
             salary_source = "salary_override"
 
-        bills_res = await session.execute(select(Bill).filter(Bill.user_id == user_id))
-        bills = bills_res.scalars().all()
-
         commitments_items: List[Dict[str, Any]] = []
         commitments_total = Decimal("0")
 
@@ -748,11 +788,6 @@ class AutopilotService:
                 }
             )
 
-        subs_res = await session.execute(
-            select(Subscription).filter(Subscription.user_id == user_id, Subscription.is_active == True)
-        )
-        subscriptions = subs_res.scalars().all()
-
         for subscription in subscriptions:
             amount = max(
                 Decimal("0"),
@@ -772,22 +807,8 @@ class AutopilotService:
                 }
             )
 
-        goals_res = await session.execute(
-            select(SavingsGoal).filter(SavingsGoal.user_id == user_id, SavingsGoal.is_completed == False)
-        )
-        goals = goals_res.scalars().all()
-
-        budget_categories_res = await session.execute(
-            select(BudgetCategory).filter(BudgetCategory.user_id == user_id)
-        )
-        budget_categories = budget_categories_res.scalars().all()
         category_name_map = {category.id: category.name for category in budget_categories}
 
-        budget_rules_res = await session.execute(
-            select(BudgetRule).filter(BudgetRule.user_id == user_id)
-        )
-        budget_rules = budget_rules_res.scalars().all()
-
         planned_expense_items: List[Dict[str, Any]] = []
         planned_expense_requested_total = Decimal("0")
         for rule in budget_rules:
@@ -932,13 +953,54 @@ class AutopilotService:
             "warnings": warnings,
         }
 
-    @staticmethod
-    async def calculate_safe_to_spend(session: AsyncSession, user_id: str) -> Dict[str, Any]:
+    @classmethod
+    async def calculate_safe_to_spend(cls, session: AsyncSession, user_id: str) -> Dict[str, Any]:
         now = datetime.utcnow()
         start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
         income_res = await session.execute(select(IncomeSource).filter(IncomeSource.user_id == user_id))
-        income_sources = income_res.scalars().all()
+        monthly_income_from_transactions = await cls._current_month_income_from_transactions(
+            session, user_id, now
+        )
+        bills_res = await session.execute(select(Bill).filter(Bill.user_id == user_id))
+        subs_res = await session.execute(
+            select(Subscription).filter(Subscription.user_id == user_id, Subscription.is_active == True)
+        )
+        goals_res = await session.execute(
+            select(SavingsGoal).filter(SavingsGoal.user_id == user_id, SavingsGoal.is_completed == False)
+        )
+        trans_res = await session.execute(
+            select(Transaction).filter(
+                Transaction.user_id == user_id,
+                Transaction.type == "EXPENSE",
+                Transaction.occurred_at >= start_of_month,
+            )
+        )
+        spent_this_month = sum((cls._to_decimal(t.amount) for t in trans_res.scalars().all()), Decimal("0"))
+
+        return cls.build_safe_to_spend(
+            now=now,
+            income_sources=income_res.scalars().all(),
+            monthly_income_from_transactions=monthly_income_from_transactions,
+            bills=bills_res.scalars().all(),
+            subscriptions=subs_res.scalars().all(),
+            goals=goals_res.scalars().all(),
+            spent_this_month=spent_this_month,
+        )
+
+    @staticmethod
+    def build_safe_to_spend(
+        *,
+        now: datetime,
+        income_sources: List[IncomeSource],
+        monthly_income_from_transactions: Decimal,
+        bills: List[Bill],
+        subscriptions: List[Subscription],
+        goals: List[SavingsGoal],
+        spent_this_month: Decimal,
+    ) -> Dict[str, Any]:
+        """Pure part of ``calculate_safe_to_spend`` (active subscriptions, open goals)."""
+        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         monthly_income_from_sources = sum(
             (
                 AutopilotService._to_decimal(income.amount)
@@ -949,10 +1011,6 @@ class AutopilotService:
             Decimal("0"),
         )
 
-        monthly_income_from_transactions = await AutopilotService._current_month_income_from_transactions(
-            session, user_id, now
-        )
-
         if monthly_income_from_transactions > 0:
             monthly_income = monthly_income_from_transactions
             income_basis = "income_transactions"
@@ -960,8 +1018,6 @@ class AutopilotService:
             monthly_income = monthly_income_from_sources
             income_basis = "income_sources"
 
-        bills_res = await session.execute(select(Bill).filter(Bill.user_id == user_id))
-        bills = bills_res.scalars().all()
         unpaid_bills_amount = Decimal("0")
         for bill in bills:
             is_paid_this_month = bool(bill.last_paid_at and bill.last_paid_at >= start_of_month)
@@ -971,10 +1027,6 @@ class AutopilotService:
                     * AutopilotService._monthly_multiplier(getattr(bill, "frequency", "monthly"))
                 )
 
-        subs_res = await session.execute(
-            select(Subscription).filter(Subscription.user_id == user_id, Subscription.is_active == True)
-        )
-        subscriptions = subs_res.scalars().all()
         subscriptions_amount = sum(
             (
                 AutopilotService._to_decimal(sub.amount)
@@ -984,10 +1036,6 @@ class AutopilotService:
             Decimal("0"),
         )
 
-        goals_res = await session.execute(
-            select(SavingsGoal).filter(SavingsGoal.user_id == user_id, SavingsGoal.is_completed == False)
-        )
-        goals = goals_res.scalars().all()
         goals_amount = sum(
             (AutopilotService._to_decimal(goal.monthly_contribution) for goal in goals),
             Decimal("0"),
@@ -995,16 +1043,6 @@ class AutopilotService:
 
         total_commitments = unpaid_bills_amount + subscriptions_amount + goals_amount
 
-        trans_res = await session.execute(
-            select(Transaction).filter(
-                Transaction.user_id == user_id,
-                Transaction.type == "EXPENSE",
-                Transaction.occurred_at >= start_of_month,
-            )
-        )
-        transactions = trans_res.scalars().all()
-        spent_this_month = sum((AutopilotService._to_decimal(t.amount) for t in transactions), Decimal("0"))
-
         monthly_free_budget = monthly_income - total_commitments
         if monthly_free_budget < 0:
             monthly_free_budget = Decimal("0")
@@ -1043,13 +1081,52 @@ class AutopilotService:
             f"Failed {execution['failed']} approved payments",
         ]
 
-    @staticmethod
-    async def calculate_daily_safe_spend(session: AsyncSession, user_id: str) -> Dict[str, Any]:
+    @classmethod
+    async def calculate_daily_safe_spend(cls, session: AsyncSession, user_id: str) -> Dict[str, Any]:
         now = datetime.utcnow()
+        monthly_data = await cls.calculate_safe_to_spend(session, user_id)
+
+        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        month_txn_res = await session.execute(
+            select(Transaction).filter(
+                Transaction.user_id == user_id,
+                Transaction.type == "EXPENSE",
+                Transaction.occurred_at >= start_of_month,
+            )
+        )
+        month_transactions = month_txn_res.scalars().all()
+        spent_this_month = sum((cls._to_decimal(t.amount) for t in month_transactions), Decimal("0"))
+
+        start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        today_txn_res = await session.execute(
+            select(Transaction).filter(
+                Transaction.user_id == user_id,
+                Transaction.type == "EXPENSE",
+                Transaction.occurred_at >= start_of_today,
+            )
+        )
+        today_transactions = today_txn_res.scalars().all()
+        spent_today = sum((cls._to_decimal(t.amount) for t in today_transactions), Decimal("0"))
+
+        return cls.build_daily_safe_spend(
+            now=now,
+            monthly_data=monthly_data,
+            spent_this_month=spent_this_month,
+            spent_today=spent_today,
+        )
+
+    @staticmethod
+    def build_daily_safe_spend(
+        *,
+        now: datetime,
+        monthly_data: Dict[str, Any],
+        spent_this_month: Decimal,
+        spent_today: Decimal,
+    ) -> Dict[str, Any]:
+        """Pure part of ``calculate_daily_safe_spend``; ``monthly_data`` comes from ``build_safe_to_spend``."""
         days_in_month = calendar.monthrange(now.year, now.month)[1]
         days_remaining = max(1, days_in_month - now.day + 1)
 
-        monthly_data = await AutopilotService.calculate_safe_to_spend(session, user_id)
         monthly_income = AutopilotService._to_decimal(monthly_data["total_income"])
         monthly_committed = AutopilotService._to_decimal(monthly_data["total_committed"])
         monthly_safe_total = AutopilotService._to_decimal(monthly_data["monthly_free_budget"])
@@ -1071,28 +1148,6 @@ class AutopilotService:
             color_state = "careful"
             status_message = "Easy does it. You are close to the edge."
 
-        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        month_txn_res = await session.execute(
-            select(Transaction).filter(
-                Transaction.user_id == user_id,
-                Transaction.type == "EXPENSE",
-                Transaction.occurred_at >= start_of_month,
-            )
-        )
-        month_transactions = month_txn_res.scalars().all()
-        spent_this_month = sum((AutopilotService._to_decimal(t.amount) for t in month_transactions), Decimal("0"))
-
-        start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_txn_res = await session.execute(
-            select(Transaction).filter(
-                Transaction.user_id == user_id,
-                Transaction.type == "EXPENSE",
-                Transaction.occurred_at >= start_of_today,
-            )
-        )
-        today_transactions = today_txn_res.scalars().all()
-        spent_today = sum((AutopilotService._to_decimal(t.amount) for t in today_transactions), Decimal("0"))
-
         income_today = monthly_income / Decimal(days_in_month)
         committed_today = monthly_committed / Decimal(days_in_month)
 
@@ -1116,54 +1171,33 @@ class AutopilotService:
         }
 
     @staticmethod
-    async def get_timeline_events(
-        session: AsyncSession,
-        user_id: str,
-        days_past: int = 7,
-        days_future: int = 30,
+    def build_timeline(
+        *,
+        now: datetime,
+        start_date: datetime,
+        end_date: datetime,
+        categories: List[BudgetCategory],
+        payment_orders: List[AutopilotPayment],
+        transactions: List[Transaction],
+        current_balance: Decimal,
+        bills: List[Bill],
+        subscriptions: List[Subscription],
+        goals: List[SavingsGoal],
+        income_sources: List[IncomeSource],
     ) -> Dict[str, Any]:
-        now = datetime.utcnow()
-        days_past = max(0, min(days_past, 90))
-        days_future = max(1, min(days_future, 365))
-        start_date = now - timedelta(days=days_past)
-        end_date = now + timedelta(days=days_future)
-
-        # Keep timeline in sync with real autopilot payment pipeline.
-        await AutopilotService.prepare_payment_orders(
-            session,
-            user_id,
-            days_ahead=days_future,
-            commit=True,
-        )
-
+        """
+        Assemble timeline events from already-loaded rows (no I/O). The
+        endpoint reads the persisted index instead (``TimelineService``); this
+        is the reference it is checked against.
+        """
         events: List[Dict[str, Any]] = []
 
-        categories_res = await session.execute(
-            select(BudgetCategory).filter(BudgetCategory.user_id == user_id)
-        )
-        categories = categories_res.scalars().all()
         category_name_map = {str(category.id): category.name for category in categories}
 
-        payment_orders_res = await session.execute(
-            select(AutopilotPayment).filter(
-                AutopilotPayment.user_id == user_id,
-                AutopilotPayment.due_on >= start_date.date(),
-                AutopilotPayment.due_on <= end_date.date(),
-            )
-        )
-        payment_orders = payment_orders_res.scalars().all()
         payment_order_map = {
             (order.source_type, order.source_id, order.due_on): order for order in payment_orders
         }
 
-        tx_res = await session.execute(
-            select(Transaction).filter(
-                Transaction.user_id == user_id,
-                Transaction.occurred_at >= start_date,
-                Transaction.occurred_at <= now,
-            )
-        )
-        transactions = tx_res.scalars().all()
         for txn in transactions:
             if not txn.occurred_at:
                 continue
@@ -1189,91 +1223,88 @@ class AutopilotService:
                 }
             )
 
-        all_tx_res = await session.execute(select(Transaction).filter(Transaction.user_id == user_id))
-        all_transactions = all_tx_res.scalars().all()
-        total_income = sum(
-            (AutopilotService._to_decimal(t.amount) for t in all_transactions if t.type == "INCOME"),
-            Decimal("0"),
-        )
-        total_expense = sum(
-            (AutopilotService._to_decimal(t.amount) for t in all_transactions if t.type == "EXPENSE"),
-            Decimal("0"),
-        )
-        current_balance = total_income - total_expense
-
-        bills_res = await session.execute(select(Bill).filter(Bill.user_id == user_id))
-        bills = bills_res.scalars().all()
         bill_events: List[Dict[str, Any]] = []
         for bill in bills:
-            bill_date = AutopilotService._next_recurring_date(now, bill.due_day)
-            if bill_date > end_date:
-                continue
-            linked_order = payment_order_map.get(("BILL", bill.id, bill_date.date()))
-            payment_status = linked_order.status if linked_order else None
-            bill_events.append(
-                {
-                    "date": bill_date.date().isoformat(),
-                    "type": "BILL_DUE",
-                    "title": bill.name,
-                    "amount": -float(AutopilotService._to_decimal(bill.amount_estimated)),
-                    "is_automatic": bool(bill.autopay_enabled),
-                    "is_completed": bool(
-                        linked_order and linked_order.status == "succeeded"
-                    ),
-                    "details": {
-                        "bill_name": bill.name,
-                        "due_day": bill.due_day,
-                        "autopay_enabled": bool(bill.autopay_enabled),
-                        "payment_order_id": linked_order.id if linked_order else None,
-                        "payment_status": payment_status,
-                        "provider_action_url": linked_order.provider_action_url if linked_order else None,
-                    },
-                }
-            )
+            for bill_date in AutopilotService._bill_rule(now, bill).between(now, end_date):
+                linked_order = payment_order_map.get(("BILL", bill.id, bill_date))
+                payment_status = linked_order.status if linked_order else None
+                bill_events.append(
+                    {
+                        "date": bill_date.isoformat(),
+                        "type": "BILL_DUE",
+                        "title": bill.name,
+                        "amount": -float(AutopilotService._to_decimal(bill.amount_estimated)),
+                        "is_automatic": bool(bill.autopay_enabled),
+                        "is_completed": bool(
+                            linked_order and linked_order.status == "succeeded"
+                        ),
+                        "details": {
+                            "bill_name": bill.name,
+                            "due_day": bill.due_day,
+                            "frequency": bill.frequency or "monthly",
+                            "autopay_enabled": bool(bill.autopay_enabled),
+                            "payment_order_id": linked_order.id if linked_order else None,
+                            "payment_status": payment_status,
+                            "provider_action_url": linked_order.provider_action_url if linked_order else None,
+                        },
+                    }
+                )
         events.extend(bill_events)
 
-        subs_res = await session.execute(
-            select(Subscription).filter(Subscription.user_id == user_id, Subscription.is_active == True)
-        )
-        subscriptions = subs_res.scalars().all()
         subscription_events: List[Dict[str, Any]] = []
         for sub in subscriptions:
             next_billing = AutopilotService._resolve_subscription_due_date(now, sub)
+            billing_rule = RecurrenceRule.from_frequency(sub.billing_cycle, next_billing)
+            for billing_date in billing_rule.between(now, end_date):
+                linked_order = payment_order_map.get(("SUBSCRIPTION", sub.id, billing_date))
+                payment_status = linked_order.status if linked_order else None
+                subscription_events.append(
+                    {
+                        "date": billing_date.isoformat(),
+                        "type": "SUBSCRIPTION",
+                        "title": sub.name,
+                        "amount": -float(AutopilotService._to_decimal(sub.amount)),
+                        "is_automatic": True,
+                        "is_completed": bool(
+                            linked_order and linked_order.status == "succeeded"
+                        ),
+                        "details": {
+                            "subscription_name": sub.name,
+                            "billing_cycle": sub.billing_cycle,
+                            "payment_order_id": linked_order.id if linked_order else None,
+                            "payment_status": payment_status,
+                            "provider_action_url": linked_order.provider_action_url if linked_order else None,
+                        },
+                    }
+                )
+        events.extend(subscription_events)
 
-            if next_billing > end_date:
-                continue
-            linked_order = payment_order_map.get(("SUBSCRIPTION", sub.id, next_billing.date()))
-            payment_status = linked_order.status if linked_order else None
-            subscription_events.append(
+        # The same commitments are prepared on every payday, so build the list once.
+        auto_prepared_payments: List[Dict[str, float]] = []
+        for bill in bills:
+            auto_prepared_payments.append(
                 {
-                    "date": next_billing.date().isoformat(),
-                    "type": "SUBSCRIPTION",
-                    "title": sub.name,
-                    "amount": -float(AutopilotService._to_decimal(sub.amount)),
-                    "is_automatic": True,
-                    "is_completed": bool(
-                        linked_order and linked_order.status == "succeeded"
-                    ),
-                    "details": {
-                        "subscription_name": sub.name,
-                        "billing_cycle": sub.billing_cycle,
-                        "payment_order_id": linked_order.id if linked_order else None,
-                        "payment_status": payment_status,
-                        "provider_action_url": linked_order.provider_action_url if linked_order else None,
-                    },
+                    "name": bill.name,
+                    "amount": float(AutopilotService._to_decimal(bill.amount_estimated)),
                 }
             )
-        events.extend(subscription_events)
-
-        goals_res = await session.execute(
-            select(SavingsGoal).filter(SavingsGoal.user_id == user_id, SavingsGoal.is_completed == False)
-        )
-        goals = goals_res.scalars().all()
-
-        incomes_res = await session.execute(
-            select(IncomeSource).filter(IncomeSource.user_id == user_id, IncomeSource.active == True)
-        )
-        income_sources = incomes_res.scalars().all()
+        for sub in subscriptions:
+            auto_prepared_payments.append(
+                {
+                    "name": sub.name,
+                    "amount": float(AutopilotService._to_decimal(sub.amount)),
+                }
+            )
+        for goal in goals:
+            contribution_amount = AutopilotService._to_decimal(goal.monthly_contribution)
+            if contribution_amount > 0:
+                auto_prepared_payments.append(
+                    {
+                        "name": goal.name,
+                        "amount": float(contribution_amount),
+                    }
+                )
+        total_prepared = sum((Decimal(str(item["amount"])) for item in auto_prepared_payments), Decimal("0"))
 
         salary_dates: List[datetime] = []
         for income in income_sources:
@@ -1281,55 +1312,32 @@ class AutopilotService:
             if salary_day is None:
                 # Salary date must be explicitly set by user.
                 continue
-            salary_date = AutopilotService._next_recurring_date(now, salary_day)
-            if salary_date > end_date:
-                continue
+            salary_rule = RecurrenceRule.from_frequency(
+                income.frequency,
+                AutopilotService._next_recurring_date(now, salary_day),
+                day_of_month=salary_day,
+            )
+            salary_amount = AutopilotService._to_decimal(income.amount)
+            remaining_after = salary_amount - total_prepared
 
-            salary_dates.append(salary_date)
-            auto_prepared_payments: List[Dict[str, float]] = []
-            for bill in bills:
-                auto_prepared_payments.append(
-                    {
-                        "name": bill.name,
-                        "amount": float(AutopilotService._to_decimal(bill.amount_estimated)),
-                    }
-                )
-            for sub in subscriptions:
-                auto_prepared_payments.append(
+            for salary_day_date in salary_rule.between(now, end_date):
+                salary_date = datetime.combine(salary_day_date, datetime.min.time())
+                salary_dates.append(salary_date)
+                events.append(
                     {
-                        "name": sub.name,
-                        "amount": float(AutopilotService._to_decimal(sub.amount)),
+                        "date": salary_day_date.isoformat(),
+                        "type": "SALARY",
+                        "title": "Salary Credited",
+                        "amount": float(salary_amount),
+                        "is_automatic": False,
+                        "is_completed": salary_day_date <= now.date(),
+                        "details": {
+                            "source": f"Income ({(income.frequency or 'monthly').lower()})",
+                            "auto_prepared_payments": list(auto_prepared_payments),
+                            "remaining_after": float(remaining_after),
+                        },
                     }
                 )
-            for goal in goals:
-                contribution_amount = AutopilotService._to_decimal(goal.monthly_contribution)
-                if contribution_amount > 0:
-                    auto_prepared_payments.append(
-                        {
-                            "name": goal.name,
-                            "amount": float(contribution_amount),
-                        }
-                    )
-
-            total_prepared = sum((Decimal(str(item["amount"])) for item in auto_prepared_payments), Decimal("0"))
-            salary_amount = AutopilotService._to_decimal(income.amount)
-            remaining_after = salary_amount - total_prepared
-
-            events.append(
-                {
-                    "date": salary_date.date().isoformat(),
-                    "type": "SALARY",
-                    "title": "Salary Credited",
-                    "amount": float(salary_amount),
-                    "is_automatic": False,
-                    "is_completed": salary_date.date() <= now.date(),
-                    "details": {
-                        "source": f"Income ({(income.frequency or 'monthly').lower()})",
-                        "auto_prepared_payments": auto_prepared_payments,
-                        "remaining_after": float(remaining_after),
-                    },
-                }
-            )
 
         next_salary = min(salary_dates) if salary_dates else None
         if next_salary:
@@ -0,0 +1,126 @@
+"""
+Avatar uploads.
+
+The request body is capped before it is parsed: ``RequestBodyLimitMiddleware``
+refuses the avatar route's body once it passes ``AVATAR_MAX_BYTES`` plus
+``MULTIPART_OVERHEAD_BYTES``, so an oversized upload is never spooled in
+full. The service then works on the file Starlette spooled (in memory or a
+temporary file) without copying it: one pass in ``CHUNK_SIZE`` pieces hashes
+it and enforces the exact cap, and Pillow decodes it from there. Hashing,
+decoding, resizing and all file writes run in the thread pool, off the event
+loop.
+
+Renditions are content-addressed: every size is stored as
+``avatars/<key>/<size>.webp``, where ``key`` is the SHA-256 of the original
+bytes salted with the rendition settings. A URL therefore never changes
+content, which lets the static mount serve it as ``immutable``, and
+re-uploading the same picture reuses the stored files.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+from typing import BinaryIO, Tuple
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+AVATAR_DIR = os.path.join("app", "static", "avatars")
+AVATAR_URL_PREFIX = "/static/avatars"
+# Largest first: each size is resized from the previous one.
+AVATAR_SIZES: Tuple[int, ...] = (256, 128, 64)
+WEBP_QUALITY = 80
+ALLOWED_CONTENT_TYPES = ("image/jpeg", "image/jpg", "image/png", "image/gif", "image/webp")
+CHUNK_SIZE = 64 * 1024
+# Allowance for multipart boundaries and part headers around the file.
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+# Decoded-size cap, well under Pillow's own decompression-bomb limit.
+MAX_PIXELS = 40_000_000
+
+# Paths (relative to AVATAR_DIR) whose content can never change.
+CONTENT_ADDRESSED_PATH = re.compile(r"^[0-9a-f]{64}/\d+\.webp$")
+
+# Bump when sizes or encoding change so new renditions get new URLs.
+_RENDITION = f"v1:{','.join(map(str, AVATAR_SIZES))}:webp{WEBP_QUALITY}".encode()
+
+
+class AvatarError(ValueError):
+    """The upload is not an acceptable avatar; the message is user-facing."""
+
+
+class AvatarTooLarge(AvatarError):
+    pass
+
+
+def avatar_url(key: str, size: int = AVATAR_SIZES[0]) -> str:
+    return f"{AVATAR_URL_PREFIX}/{key}/{size}.webp"
+
+
+def _content_key(source: BinaryIO, max_bytes: int) -> str:
+    source.seek(0)
+    digest = hashlib.sha256(_RENDITION)
+    received = 0
+    while chunk := source.read(CHUNK_SIZE):
+        received += len(chunk)
+        if received > max_bytes:
+            raise AvatarTooLarge(f"File too large. Maximum size is {max_bytes // (1024 * 1024)}MB.")
+        digest.update(chunk)
+    if received == 0:
+        raise AvatarError("The file is empty.")
+    source.seek(0)
+    return digest.hexdigest()
+
+
+def _render(source: BinaryIO, key: str) -> None:
+    from PIL import Image, ImageOps, UnidentifiedImageError  # imported lazily: only uploads need it
+
+    target = os.path.join(AVATAR_DIR, key)
+    if all(os.path.exists(os.path.join(target, f"{size}.webp")) for size in AVATAR_SIZES):
+        return
+
+    try:
+        with Image.open(source) as image:
+            if image.width * image.height > MAX_PIXELS:
+                raise AvatarError("Image dimensions are too large.")
+            # JPEG can decode straight to a reduced scale.
+            image.draft("RGB", (AVATAR_SIZES[0], AVATAR_SIZES[0]))
+            image = ImageOps.exif_transpose(image)
+            has_alpha = image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+            image = image.convert("RGBA" if has_alpha else "RGB")
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError) as exc:
+        raise AvatarError("Could not read the image.") from exc
+
+    os.makedirs(AVATAR_DIR, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=AVATAR_DIR, prefix=f".{key[:8]}-")
+    try:
+        for size in AVATAR_SIZES:
+            image = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+            image.save(os.path.join(staging, f"{size}.webp"), "WEBP", quality=WEBP_QUALITY, method=4)
+        try:
+            os.rename(staging, target)
+        except OSError:
+            # A concurrent upload of the same picture got there first.
+            if not os.path.isdir(target):
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+class AvatarService:
+    @staticmethod
+    async def store(file: UploadFile, *, max_bytes: int) -> str:
+        """
+        Validate and render ``file``; returns the content key of the stored
+        renditions. Raises ``AvatarError`` (``AvatarTooLarge`` over
+        ``max_bytes``) for bad uploads.
+        """
+        if file.content_type not in ALLOWED_CONTENT_TYPES:
+            raise AvatarError("Invalid file type. Only JPEG, PNG, GIF, and WebP images are allowed.")
+        if file.size is not None and file.size > max_bytes:
+            raise AvatarTooLarge(f"File too large. Maximum size is {max_bytes // (1024 * 1024)}MB.")
+
+        key = await run_in_threadpool(_content_key, file.file, max_bytes)
+        await run_in_threadpool(_render, file.file, key)
+        return key
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import List, Dict
+from typing import Any, List, Dict, Iterable, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 import calendar
 
@@ -90,3 +90,74 @@ class BudgetEngine:
             "daily_spendable": daily_spendable,
             "category_breakdown": allocations
         }
+
+    @staticmethod
+    def calculate_range_overview(
+        incomes: List[IncomeSource],
+        rules: List[BudgetRule],
+        categories: List[BudgetCategory],
+        monthly_spend: Iterable[Tuple[int, int, Optional[str], Any]],
+        months: Sequence[Tuple[int, int]],
+    ) -> Dict:
+        """
+        Allocations vs. spend for several months as a month x category matrix.
+
+        ``monthly_spend`` holds pre-aggregated ``(year, month, category_id, total)``
+        expense rows (one grouped query); allocation and spend arithmetic is done
+        on NumPy arrays instead of per-transaction Python loops. Allocations use
+        the same rules as ``calculate_monthly_overview``. Amounts are floats
+        rounded to cents, meant for charts.
+        """
+        import numpy as np  # imported lazily: only this endpoint needs it
+
+        total_income = float(sum([i.amount for i in incomes if i.active]))
+
+        columns: Dict[str, int] = {}
+        column_meta: List[Dict] = []
+
+        def column(category_id: str, name: str, color: Optional[str]) -> int:
+            if category_id not in columns:
+                columns[category_id] = len(column_meta)
+                column_meta.append({"id": category_id, "name": name, "color": color})
+            return columns[category_id]
+
+        for category in categories:
+            column(category.id, category.name, category.color)
+        uncategorized = column("uncategorized", "Uncategorized", None)
+
+        allocated = np.zeros(len(column_meta))
+        for rule in rules:
+            index = columns.get(rule.category_id)
+            if index is None:
+                continue
+            if rule.allocation_type == "FIXED":
+                allocated[index] = float(rule.allocation_value)
+            elif rule.allocation_type == "PERCENT":
+                allocated[index] = total_income * float(rule.allocation_value) / 100
+
+        month_index = {key: position for position, key in enumerate(months)}
+        rows, cols, amounts = [], [], []
+        for year, month, category_id, total in monthly_spend:
+            position = month_index.get((int(year), int(month)))
+            if position is None:
+                continue
+            rows.append(position)
+            cols.append(columns.get(category_id, uncategorized) if category_id else uncategorized)
+            amounts.append(float(total or 0))
+
+        spent = np.zeros((len(months), len(column_meta)))
+        np.add.at(spent, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), amounts)
+        remaining = allocated[np.newaxis, :] - spent
+        remaining[:, uncategorized] = -spent[:, uncategorized]
+        month_spent = spent.sum(axis=1)
+
+        return {
+            "months": [f"{year:04d}-{month:02d}" for year, month in months],
+            "categories": column_meta,
+            "allocated": np.round(allocated, 2).tolist(),
+            "spent": np.round(spent, 2).tolist(),
+            "remaining": np.round(remaining, 2).tolist(),
+            "total_income": round(total_income, 2),
+            "total_spent": np.round(month_spent, 2).tolist(),
+            "remaining_budget": np.round(total_income - month_spent, 2).tolist(),
+        }
@@ -0,0 +1,353 @@
+"""
+Rule-based auto-categorization.
+
+A user's active ``CategorizationRule`` rows are compiled into a single
+``CompiledRuleSet``: every CONTAINS pattern goes into one Aho-Corasick
+automaton (one pass over the description regardless of the number of rules),
+REGEX rules are pre-compiled and AMOUNT rules only check the range. When
+several rules match, the highest priority (then oldest) rule wins.
+
+User-supplied regular expressions run on the server. ``regex_problem`` only
+accepts patterns whose matching cost stays close to linear: at most one
+unbounded repeat (``*``, ``+``, ``{n,}``), no repeated groups (nested
+repetition, alternation under repetition) and no backreferences. Matching
+uses the ``regex`` module with a per-rule timeout as a backstop, descriptions
+are matched only up to ``REGEX_MAX_INPUT`` characters, and callers run the
+matching in the thread pool so a slow rule never blocks the event loop.
+
+Compiled sets are cached per user and keyed by a cheap fingerprint of the rule
+table (row count + latest ``updated_at``), so a rule change made by any worker
+is picked up on the next lookup; the rules router also drops the local entry
+straight away.
+"""
+
+import logging
+import re
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import regex
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from starlette.concurrency import run_in_threadpool
+
+from app.models.categorization_rule import CategorizationRule
+from app.models.timeline import sync_timeline_transactions
+from app.models.transaction import Transaction
+from app.models.user import bump_data_version
+
+logger = logging.getLogger(__name__)
+
+RULE_SET_CACHE_SIZE = 1024
+UPDATE_CHUNK_SIZE = 500
+REGEX_MAX_LENGTH = 100
+REGEX_MAX_INPUT = 256
+REGEX_TIMEOUT_SECONDS = 0.05
+
+_COUNTED_REPEAT = re.compile(r"\{(\d*)(,?)(\d*)\}")
+
+
+def _too_complex(pattern: str) -> bool:
+    """
+    True when ``pattern`` has more than one unbounded repeat, repeats a group
+    more than once, or refers back to a group.
+
+    A deliberately conservative scan of the pattern text: escapes and character
+    classes are skipped, everything else is treated as a single-character atom.
+    """
+    unbounded = 0
+    previous = None  # what a following quantifier applies to: "atom", "group" or None
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            escaped = pattern[index + 1:index + 2]
+            if escaped.isdigit() and escaped != "0":
+                return True
+            previous = "atom"
+            index += 2
+            continue
+        if char == "[":
+            index += 1
+            if pattern[index:index + 1] == "^":
+                index += 1
+            if pattern[index:index + 1] == "]":
+                index += 1
+            while index < len(pattern) and pattern[index] != "]":
+                index += 2 if pattern[index] == "\\" else 1
+            previous = "atom"
+            index += 1
+            continue
+        if char == "(":
+            if pattern.startswith("(?P=", index) or pattern.startswith("(?(", index):
+                return True
+            previous = None
+            index += 2 if pattern.startswith("(?", index) else 1
+            continue
+        if char == ")":
+            previous = "group"
+            index += 1
+            continue
+        if char in "*+?{":
+            counted = _COUNTED_REPEAT.match(pattern, index) if char == "{" else None
+            if char == "{" and counted is None:
+                previous = "atom"
+                index += 1
+                continue
+            if previous is not None:
+                if counted is not None:
+                    low, comma, high = counted.groups()
+                    is_unbounded = bool(comma) and not high
+                    repeats = is_unbounded or int(high or low or 0) > 1
+                else:
+                    is_unbounded = char != "?"
+                    repeats = is_unbounded
+                if repeats and previous == "group":
+                    return True
+                unbounded += is_unbounded
+                if unbounded > 1:
+                    return True
+            index = counted.end() if counted is not None else index + 1
+            if pattern[index:index + 1] in ("?", "+"):
+                index += 1  # lazy / possessive suffix
+            previous = None
+            continue
+        previous = None if char in "|^$" else "atom"
+        index += 1
+    return False
+
+
+def regex_problem(pattern: str) -> Optional[str]:
+    """Why ``pattern`` cannot be a REGEX rule (user-facing), or None if it can."""
+    if len(pattern) > REGEX_MAX_LENGTH:
+        return f"Regular expressions are limited to {REGEX_MAX_LENGTH} characters"
+    try:
+        # Standard ``re`` syntax only: the ``regex`` module's extensions (recursion,
+        # ``\g<name>`` references, fuzzy matching) are not accepted.
+        re.compile(pattern, re.IGNORECASE)
+        regex.compile(pattern, regex.IGNORECASE)
+    except (re.error, regex.error):
+        return "Invalid regular expression"
+    if _too_complex(pattern):
+        return (
+            "Regular expression is too complex: use at most one unbounded repeat (*, + or {n,}), "
+            "no repeated groups and no backreferences"
+        )
+    return None
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher; ``search`` returns the indexes of matched patterns."""
+
+    def __init__(self, patterns: Sequence[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        outputs: List[Set[int]] = [set()]
+
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(index)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                outputs[child] |= outputs[self._fail[child]]
+
+        self._outputs: List[Tuple[int, ...]] = [tuple(sorted(output)) for output in outputs]
+
+    def search(self, text: str) -> Set[int]:
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found: Set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+@dataclass(frozen=True)
+class _Rule:
+    category_id: str
+    min_amount: Optional[Decimal]
+    max_amount: Optional[Decimal]
+
+    def accepts(self, amount: Optional[Decimal]) -> bool:
+        if self.min_amount is None and self.max_amount is None:
+            return True
+        if amount is None:
+            return False
+        if self.min_amount is not None and amount < self.min_amount:
+            return False
+        if self.max_amount is not None and amount > self.max_amount:
+            return False
+        return True
+
+
+class CompiledRuleSet:
+    def __init__(self, rules: Iterable[CategorizationRule]):
+        ordered = sorted(
+            (rule for rule in rules if rule.is_active),
+            key=lambda rule: (-(rule.priority or 0), rule.created_at, rule.id),
+        )
+        self._rules: List[_Rule] = []
+        substring_ranks: Dict[str, List[int]] = {}
+        self._regexes: List[Tuple[regex.Pattern, int]] = []
+        self._always: List[int] = []
+
+        for rank, rule in enumerate(ordered):
+            self._rules.append(_Rule(rule.category_id, rule.min_amount, rule.max_amount))
+            if rule.match_type == "REGEX" and rule.pattern:
+                if regex_problem(rule.pattern):
+                    continue  # stored before patterns were checked; never run it
+                self._regexes.append((regex.compile(rule.pattern, regex.IGNORECASE), rank))
+            elif rule.match_type == "CONTAINS" and rule.pattern:
+                substring_ranks.setdefault(rule.pattern.lower(), []).append(rank)
+            elif rule.match_type == "AMOUNT":
+                self._always.append(rank)
+
+        self._substrings = list(substring_ranks)
+        self._substring_ranks = [substring_ranks[pattern] for pattern in self._substrings]
+        self._automaton = AhoCorasick(self._substrings) if self._substrings else None
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def match(self, description: Optional[str], amount: Optional[Decimal]) -> Optional[str]:
+        """Category id of the best matching rule, or None."""
+        if not self._rules:
+            return None
+        candidates: Set[int] = set(self._always)
+        if description:
+            if self._automaton is not None:
+                for index in self._automaton.search(description.lower()):
+                    candidates.update(self._substring_ranks[index])
+            bounded = description[:REGEX_MAX_INPUT]
+            for compiled, rank in self._regexes:
+                if rank not in candidates and self._search(compiled, bounded):
+                    candidates.add(rank)
+        for rank in sorted(candidates):
+            rule = self._rules[rank]
+            if rule.accepts(amount):
+                return rule.category_id
+        return None
+
+    def _search(self, compiled: "regex.Pattern", text: str) -> bool:
+        try:
+            return compiled.search(text, timeout=REGEX_TIMEOUT_SECONDS) is not None
+        except TimeoutError:
+            # Drop the rule from this compiled set so it cannot burn the budget again.
+            self._regexes = [entry for entry in self._regexes if entry[0] is not compiled]
+            logger.warning("Categorization regex %r timed out and was disabled", compiled.pattern)
+            return False
+
+
+_rule_sets: "OrderedDict[str, Tuple[tuple, CompiledRuleSet]]" = OrderedDict()
+
+
+class CategorizationService:
+    @staticmethod
+    def invalidate(user_id: str) -> None:
+        _rule_sets.pop(user_id, None)
+
+    @staticmethod
+    async def get_rule_set(db: AsyncSession, user_id: str) -> CompiledRuleSet:
+        fingerprint = tuple(
+            (
+                await db.execute(
+                    select(func.count(CategorizationRule.id), func.max(CategorizationRule.updated_at)).filter(
+                        CategorizationRule.user_id == user_id
+                    )
+                )
+            ).one()
+        )
+        cached = _rule_sets.get(user_id)
+        if cached is not None and cached[0] == fingerprint:
+            _rule_sets.move_to_end(user_id)
+            return cached[1]
+
+        result = await db.execute(select(CategorizationRule).filter(CategorizationRule.user_id == user_id))
+        rule_set = CompiledRuleSet(result.scalars().all())
+        _rule_sets[user_id] = (fingerprint, rule_set)
+        _rule_sets.move_to_end(user_id)
+        while len(_rule_sets) > RULE_SET_CACHE_SIZE:
+            _rule_sets.popitem(last=False)
+        return rule_set
+
+    @staticmethod
+    async def categorize(db: AsyncSession, transaction: Transaction) -> bool:
+        """Fill ``transaction.category_id`` from the user's rules when it is unset."""
+        if transaction.category_id:
+            return False
+        rule_set = await CategorizationService.get_rule_set(db, transaction.user_id)
+        category_id = await run_in_threadpool(rule_set.match, transaction.description, transaction.amount)
+        if category_id is None:
+            return False
+        transaction.category_id = category_id
+        return True
+
+    @staticmethod
+    def _targets(rule_set: CompiledRuleSet, rows: Sequence[tuple]) -> Dict[str, List[str]]:
+        targets: Dict[str, List[str]] = {}
+        for transaction_id, description, amount, current_category_id in rows:
+            category_id = rule_set.match(description, amount)
+            if category_id is not None and category_id != current_category_id:
+                targets.setdefault(category_id, []).append(transaction_id)
+        return targets
+
+    @staticmethod
+    async def recategorize(db: AsyncSession, user_id: str, *, only_uncategorized: bool = True) -> dict:
+        """
+        Re-apply the rules to the user's history.
+
+        Matching runs in the thread pool over (id, description, amount) tuples; writes are
+        one ``UPDATE ... WHERE id IN (...)`` per target category and chunk.
+        """
+        rule_set = await CategorizationService.get_rule_set(db, user_id)
+        query = select(Transaction.id, Transaction.description, Transaction.amount, Transaction.category_id).filter(
+            Transaction.user_id == user_id
+        )
+        if only_uncategorized:
+            query = query.filter(Transaction.category_id.is_(None))
+
+        rows = (await db.execute(query)).all() if len(rule_set) else []
+        targets = await run_in_threadpool(CategorizationService._targets, rule_set, rows)
+
+        for category_id, transaction_ids in targets.items():
+            for start in range(0, len(transaction_ids), UPDATE_CHUNK_SIZE):
+                await db.execute(
+                    update(Transaction)
+                    .where(
+                        Transaction.user_id == user_id,
+                        Transaction.id.in_(transaction_ids[start:start + UPDATE_CHUNK_SIZE]),
+                    )
+                    .values(category_id=category_id)
+                    .execution_options(synchronize_session=False)
+                )
+            await sync_timeline_transactions(db, transaction_ids)
+        if targets:
+            await bump_data_version(db, user_id)
+        await db.commit()
+
+        by_category = {category_id: len(ids) for category_id, ids in targets.items()}
+        return {"scanned": len(rows), "updated": sum(by_category.values()), "by_category": by_category}
@@ -0,0 +1,344 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Date, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
+
+from app.models.bill import Bill
+from app.models.budget import BudgetCategory, BudgetRule
+from app.models.income import IncomeSource
+from app.models.notification import Notification
+from app.models.savings import SavingsGoal
+from app.models.subscription import Subscription
+from app.models.transaction import Transaction
+from app.services.autopilot import AutopilotService
+from app.services.financial_triage import FinancialTriageService
+from app.services.health_score import HealthScoreService
+from app.services.ledger import LedgerService
+from app.services.timeline import TimelineService
+
+NOTIFICATION_LIMIT = 50
+RECENT_TRANSACTION_LIMIT = 5
+
+# (day, type, category_id, summed amount)
+DailyTotal = Tuple[date, str, Optional[str], Decimal]
+
+
+def _start_of_previous_month(start_of_month: datetime) -> datetime:
+    if start_of_month.month == 1:
+        return start_of_month.replace(year=start_of_month.year - 1, month=12)
+    return start_of_month.replace(month=start_of_month.month - 1)
+
+
+class DashboardService:
+    @staticmethod
+    def build_summary(
+        *,
+        now: datetime,
+        chart_range: str,
+        daily_totals: Sequence[DailyTotal],
+        recent_transactions: Sequence[Transaction],
+        categories: List[BudgetCategory],
+        goals: List[SavingsGoal],
+        safe_to_spend_stats: Dict[str, Any],
+        total_balance: Decimal,
+        opening_balance: Decimal,
+    ) -> Dict[str, Any]:
+        """
+        Dashboard summary (pure; no I/O).
+
+        ``daily_totals`` are the per-day sums from the start of the previous
+        month on (see ``daily_totals``), ``recent_transactions`` the latest
+        rows, and ``total_balance``/``opening_balance`` (balance before this
+        month) come from the materialized ledger.
+        """
+        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        month_start = start_of_month.date()
+
+        # 1. Total Balance & Savings
+        total_savings = sum((goal.current_amount or Decimal(0) for goal in goals), Decimal(0))
+
+        # 2. Monthly Stats
+        monthly_totals = [row for row in daily_totals if row[0] >= month_start]
+        monthly_income = sum(amount for _, kind, _, amount in monthly_totals if kind == 'INCOME')
+        monthly_expenses = sum(amount for _, kind, _, amount in monthly_totals if kind == 'EXPENSE')
+
+        # Previous Month Stats
+        prev_month_start = _start_of_previous_month(start_of_month).date()
+        prev_month_totals = [row for row in daily_totals if prev_month_start <= row[0] < month_start]
+        prev_income = sum(amount for _, kind, _, amount in prev_month_totals if kind == 'INCOME')
+        prev_expenses = sum(amount for _, kind, _, amount in prev_month_totals if kind == 'EXPENSE')
+
+        def calc_change(current, previous):
+            if previous == 0:
+                return 100.0 if current > 0 else 0.0
+            return float((current - previous) / previous * 100)
+
+        income_change = calc_change(monthly_income, prev_income)
+        expenses_change = calc_change(monthly_expenses, prev_expenses)
+
+        # Balance Trend
+        prev_total_balance = opening_balance
+
+        balance_change = calc_change(total_balance, prev_total_balance)
+
+        cat_name_map = {str(c.id): c.name for c in categories}
+
+        # 4. Recent Transactions
+        recent_transactions = sorted(recent_transactions, key=lambda t: t.occurred_at, reverse=True)[:RECENT_TRANSACTION_LIMIT]
+        recent_mapped = [
+            {
+                "id": t.id,
+                "title": t.description or "Unknown",
+                "category": cat_name_map.get(str(t.category_id), "Uncategorized"),
+                "amount": t.amount if t.type == 'INCOME' else -t.amount,
+                "date": t.occurred_at.strftime("%b %d") if t.occurred_at else "",
+                "type": t.type.lower()
+            }
+            for t in recent_transactions
+        ]
+
+        # 5. Spending Chart
+        days = []
+        if chart_range == 'week':
+            # Last 7 days
+            for i in range(6, -1, -1):
+                day = now - timedelta(days=i)
+                days.append(day.date())
+        else:
+            # Month view: Start of month to now
+            curr = start_of_month
+            while curr <= now:
+                days.append(curr.date())
+                curr += timedelta(days=1)
+
+        expenses_by_day: Dict[Any, Decimal] = {}
+        for day, kind, _, amount in daily_totals:
+            if kind == 'EXPENSE':
+                expenses_by_day[day] = expenses_by_day.get(day, 0) + amount
+
+        chart_data = [
+            {
+                "name": day.strftime("%a") if chart_range == 'week' else day.strftime("%b %d"),
+                "amount": float(expenses_by_day.get(day, 0)),
+            }
+            for day in days
+        ]
+
+        # 6. Category Chart (Expenses by Category for this month)
+        cat_map = {}
+        for _, kind, category_id, amount in monthly_totals:
+            if kind == 'EXPENSE':
+                cat_id = str(category_id) if category_id else "Uncategorized"
+                cat_map[cat_id] = cat_map.get(cat_id, 0) + amount
+
+        category_chart = [
+            {"name": cat_name_map.get(cat_id, "Uncategorized"), "value": float(amount)}
+            for cat_id, amount in cat_map.items()
+        ]
+        # Sort categories by value desc for insights
+        category_chart.sort(key=lambda x: x['value'], reverse=True)
+
+        # 3. Health Score (Calculated LAST to use category data)
+        health_stats = HealthScoreService.calculate_score(
+            monthly_income,
+            monthly_expenses,
+            0,
+            0,
+            top_categories=category_chart
+        )
+
+        return {
+            "total_balance": total_balance,
+            "balance_change": balance_change,
+            "monthly_income": monthly_income,
+            "monthly_expenses": monthly_expenses,
+            "income_change": income_change,
+            "expenses_change": expenses_change,
+            "total_savings": total_savings,
+            "health_score": health_stats,
+            "recent_transactions": recent_mapped,
+            "spending_chart": chart_data,
+            "category_chart": category_chart,
+            "safe_to_spend_stats": safe_to_spend_stats
+        }
+
+    @staticmethod
+    async def daily_totals(session: AsyncSession, user_id: str, since: datetime) -> List[DailyTotal]:
+        """Amounts summed per day, type and category for transactions dated ``since`` or later."""
+        day = func.date(Transaction.occurred_at, type_=Date)
+        result = await session.execute(
+            select(day, Transaction.type, Transaction.category_id, func.sum(Transaction.amount))
+            .filter(Transaction.user_id == user_id, Transaction.occurred_at >= since)
+            .group_by(day, Transaction.type, Transaction.category_id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    @staticmethod
+    async def recent_transactions(session: AsyncSession, user_id: str) -> List[Transaction]:
+        result = await session.execute(
+            select(Transaction)
+            .filter(Transaction.user_id == user_id)
+            .order_by(Transaction.occurred_at.desc())
+            .limit(RECENT_TRANSACTION_LIMIT)
+        )
+        return result.scalars().all()
+
+    @staticmethod
+    async def get_summary(session: AsyncSession, user_id: str, chart_range: str = "week") -> Dict[str, Any]:
+        """
+        Summary from bounded reads: per-day sums since the start of the previous
+        month (which covers the month, previous-month and 7-day chart figures),
+        the latest transactions, and balances from the materialized ledger.
+        """
+        now = datetime.utcnow()
+        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        daily_totals = await DashboardService.daily_totals(session, user_id, _start_of_previous_month(start_of_month))
+        recent_transactions = await DashboardService.recent_transactions(session, user_id)
+        categories_res = await session.execute(select(BudgetCategory).filter(BudgetCategory.user_id == user_id))
+        goals_res = await session.execute(select(SavingsGoal).filter(SavingsGoal.user_id == user_id))
+
+        # 7. Autopilot / Safe-to-Spend Stats + Salary Rule Engine
+        safe_to_spend_stats = await AutopilotService.calculate_safe_to_spend(session, user_id)
+        safe_to_spend_stats["salary_rule_engine"] = await AutopilotService.calculate_salary_rule_split(session, user_id)
+
+        return DashboardService.build_summary(
+            now=now,
+            chart_range=chart_range,
+            daily_totals=daily_totals,
+            recent_transactions=recent_transactions,
+            categories=categories_res.scalars().all(),
+            goals=goals_res.scalars().all(),
+            safe_to_spend_stats=safe_to_spend_stats,
+            total_balance=await LedgerService.current_balance(session, user_id),
+            opening_balance=await LedgerService.balance_before(session, user_id, start_of_month.date()),
+        )
+
+    @staticmethod
+    async def get_bootstrap(
+        session: AsyncSession,
+        user_id: str,
+        *,
+        chart_range: str = "week",
+        days_past: int = 7,
+        days_future: int = 30,
+    ) -> Dict[str, Any]:
+        """
+        Everything the dashboard needs on first load, from one session.
+
+        Each table is read once (transactions as this month's rows, per-day
+        sums since the previous month and the latest few rows, never the whole
+        history); the summary, safe-to-spend and salary split sections are then
+        built from the same rows by the services' pure builders instead of each
+        re-querying the ledger. The timeline is the
+        same window read from the event index as the timeline endpoint. List
+        sections are returned as ORM objects for the caller to serialize.
+        """
+        now = datetime.utcnow()
+        days_past = max(0, min(days_past, 90))
+        days_future = max(1, min(days_future, 365))
+        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # Same payment-order sync and recurring-row refresh as the timeline endpoint.
+        await AutopilotService.prepare_payment_orders(session, user_id, days_ahead=days_future, commit=True)
+        await TimelineService.ensure_recurring(session, user_id, now=now)
+
+        month_transactions = (
+            await session.execute(
+                select(Transaction).filter(Transaction.user_id == user_id, Transaction.occurred_at >= start_of_month)
+            )
+        ).scalars().all()
+        daily_totals = await DashboardService.daily_totals(session, user_id, _start_of_previous_month(start_of_month))
+        recent_transactions = await DashboardService.recent_transactions(session, user_id)
+        categories = (await session.execute(select(BudgetCategory).filter(BudgetCategory.user_id == user_id))).scalars().all()
+        rules = (await session.execute(select(BudgetRule).filter(BudgetRule.user_id == user_id))).scalars().all()
+        incomes = (await session.execute(select(IncomeSource).filter(IncomeSource.user_id == user_id))).scalars().all()
+        goals = (await session.execute(select(SavingsGoal).filter(SavingsGoal.user_id == user_id))).scalars().all()
+        bills = (
+            await session.execute(select(Bill).options(selectinload(Bill.category)).filter(Bill.user_id == user_id))
+        ).scalars().all()
+        subscriptions = (
+            await session.execute(
+                select(Subscription).options(selectinload(Subscription.category)).filter(Subscription.user_id == user_id)
+            )
+        ).scalars().all()
+        notifications = (
+            await session.execute(
+                select(Notification)
+                .filter(Notification.user_id == user_id)
+                .order_by(Notification.created_at.desc())
+                .limit(NOTIFICATION_LIMIT)
+            )
+        ).scalars().all()
+        triage = await FinancialTriageService.generate(session, user_id)
+
+        zero = Decimal("0")
+        income_this_month = sum(
+            (t.amount for t in month_transactions if t.type == "INCOME" and t.occurred_at <= now), zero
+        )
+        spent_this_month = sum(
+            (t.amount for t in month_transactions if t.type == "EXPENSE"), zero
+        )
+        spent_today = sum(
+            (t.amount for t in month_transactions if t.type == "EXPENSE" and t.occurred_at >= start_of_today), zero
+        )
+        current_balance = await LedgerService.current_balance(session, user_id)
+        opening_balance = await LedgerService.balance_before(session, user_id, start_of_month.date())
+        active_subscriptions = [sub for sub in subscriptions if sub.is_active]
+        open_goals = [goal for goal in goals if not goal.is_completed]
+
+        safe_to_spend = AutopilotService.build_safe_to_spend(
+            now=now,
+            income_sources=incomes,
+            monthly_income_from_transactions=income_this_month,
+            bills=bills,
+            subscriptions=active_subscriptions,
+            goals=open_goals,
+            spent_this_month=spent_this_month,
+        )
+        salary_rule_engine = AutopilotService.build_salary_rule_split(
+            now=now,
+            income_sources=incomes,
+            monthly_income_from_transactions=income_this_month,
+            bills=bills,
+            subscriptions=active_subscriptions,
+            goals=open_goals,
+            budget_categories=categories,
+            budget_rules=rules,
+        )
+        summary = DashboardService.build_summary(
+            now=now,
+            chart_range=chart_range,
+            daily_totals=daily_totals,
+            recent_transactions=recent_transactions,
+            categories=categories,
+            goals=goals,
+            safe_to_spend_stats={**safe_to_spend, "salary_rule_engine": salary_rule_engine},
+            total_balance=current_balance,
+            opening_balance=opening_balance,
+        )
+        timeline = await TimelineService.get_window(
+            session, user_id, days_past=days_past, days_future=days_future, now=now
+        )
+
+        return {
+            "summary": summary,
+            "triage": triage,
+            "timeline": timeline,
+            "safe_to_spend_daily": AutopilotService.build_daily_safe_spend(
+                now=now,
+                monthly_data=safe_to_spend,
+                spent_this_month=spent_this_month,
+                spent_today=spent_today,
+            ),
+            "notifications": notifications,
+            "categories": categories,
+            "bills": bills,
+            "subscriptions": subscriptions,
+            "goals": goals,
+            "incomes": incomes,
+        }
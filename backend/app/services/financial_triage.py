@@ -2,6 +2,7 @@ import calendar
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from sqlalchemy import and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -10,6 +11,8 @@ from app.models.budget import BudgetCategory, BudgetRule
 from app.models.subscription import Subscription
 from app.models.transaction import Transaction
 from app.schemas.triage import FinancialTriageResponse, TriageAction
+from app.services.ledger import LedgerService
+from app.services.subscription_usage import STALE_MAX_USES, STALE_WINDOW_DAYS, SubscriptionUsageService
 
 
 class FinancialTriageService:
@@ -50,30 +53,30 @@ class FinancialTriageService:
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         thirty_days_ago = now - timedelta(days=30)
 
-        transactions_result = await db.execute(
-            select(Transaction).filter(Transaction.user_id == user_id)
-        )
-        transactions = transactions_result.scalars().all()
-
-        monthly_transactions = [t for t in transactions if t.occurred_at and t.occurred_at >= month_start]
-        monthly_income = sum(
-            (cls._to_decimal(t.amount) for t in monthly_transactions if t.type == "INCOME"),
-            Decimal("0"),
-        )
-        monthly_expenses = sum(
-            (cls._to_decimal(t.amount) for t in monthly_transactions if t.type == "EXPENSE"),
-            Decimal("0"),
+        # One pass over the user's transactions; each figure is an aggregate FILTER.
+        is_income = Transaction.type == "INCOME"
+        is_expense = Transaction.type == "EXPENSE"
+        this_month = Transaction.occurred_at >= month_start
+        is_pending_expense = and_(is_expense, func.lower(Transaction.status) == "pending")
+        is_recent_uncategorized = and_(
+            is_expense, Transaction.category_id.is_(None), Transaction.occurred_at >= thirty_days_ago
         )
+        totals = (
+            await db.execute(
+                select(
+                    func.sum(Transaction.amount).filter(and_(is_income, this_month)).label("monthly_income"),
+                    func.sum(Transaction.amount).filter(and_(is_expense, this_month)).label("monthly_expenses"),
+                    func.count().filter(is_pending_expense).label("pending_count"),
+                    func.sum(Transaction.amount).filter(is_pending_expense).label("pending_total"),
+                    func.count().filter(is_recent_uncategorized).label("uncategorized_count"),
+                    func.sum(Transaction.amount).filter(is_recent_uncategorized).label("uncategorized_total"),
+                ).where(Transaction.user_id == user_id)
+            )
+        ).one()
 
-        total_income = sum(
-            (cls._to_decimal(t.amount) for t in transactions if t.type == "INCOME"),
-            Decimal("0"),
-        )
-        total_expenses = sum(
-            (cls._to_decimal(t.amount) for t in transactions if t.type == "EXPENSE"),
-            Decimal("0"),
-        )
-        total_balance = total_income - total_expenses
+        monthly_income = cls._to_decimal(totals.monthly_income)
+        monthly_expenses = cls._to_decimal(totals.monthly_expenses)
+        total_balance = await LedgerService.current_balance(db, user_id)
 
         if monthly_income > 0:
             burn_rate_pct = float((monthly_expenses / monthly_income) * Decimal("100"))
@@ -91,22 +94,10 @@ class FinancialTriageService:
         else:
             liquidity_buffer_days = 365
 
-        pending_expenses = [
-            t for t in transactions if t.type == "EXPENSE" and (t.status or "").lower() == "pending"
-        ]
-        pending_transaction_count = len(pending_expenses)
-        pending_transaction_total = sum((cls._to_decimal(t.amount) for t in pending_expenses), Decimal("0"))
-
-        uncategorized_expenses = [
-            t
-            for t in transactions
-            if t.type == "EXPENSE" and t.category_id is None and t.occurred_at and t.occurred_at >= thirty_days_ago
-        ]
-        uncategorized_expense_count = len(uncategorized_expenses)
-        uncategorized_expense_total = sum(
-            (cls._to_decimal(t.amount) for t in uncategorized_expenses),
-            Decimal("0"),
-        )
+        pending_transaction_count = totals.pending_count
+        pending_transaction_total = cls._to_decimal(totals.pending_total)
+        uncategorized_expense_count = totals.uncategorized_count
+        uncategorized_expense_total = cls._to_decimal(totals.uncategorized_total)
 
         category_result = await db.execute(
             select(BudgetCategory).filter(BudgetCategory.user_id == user_id)
@@ -117,14 +108,19 @@ class FinancialTriageService:
         rule_result = await db.execute(select(BudgetRule).filter(BudgetRule.user_id == user_id))
         rules = rule_result.scalars().all()
 
-        monthly_category_spend: dict[str, Decimal] = {}
-        for transaction in monthly_transactions:
-            if transaction.type != "EXPENSE" or transaction.category_id is None:
-                continue
-            monthly_category_spend[transaction.category_id] = (
-                monthly_category_spend.get(transaction.category_id, Decimal("0"))
-                + cls._to_decimal(transaction.amount)
+        category_spend_result = await db.execute(
+            select(Transaction.category_id, func.sum(Transaction.amount))
+            .where(
+                Transaction.user_id == user_id,
+                is_expense,
+                this_month,
+                Transaction.category_id.is_not(None),
             )
+            .group_by(Transaction.category_id)
+        )
+        monthly_category_spend: dict[str, Decimal] = {
+            category_id: cls._to_decimal(spent) for category_id, spent in category_spend_result.all()
+        }
 
         over_budget_rules: list[dict] = []
         for rule in rules:
@@ -165,6 +161,9 @@ class FinancialTriageService:
             select(Subscription).filter(Subscription.user_id == user_id, Subscription.is_active == True)
         )
         subscriptions = subscription_result.scalars().all()
+        recent_uses = await SubscriptionUsageService.uses_since(
+            db, user_id, now - timedelta(days=STALE_WINDOW_DAYS)
+        )
 
         monthly_subscription_cost = Decimal("0")
         stale_subscriptions: list[dict] = []
@@ -174,7 +173,7 @@ class FinancialTriageService:
                 base_amount if subscription.billing_cycle == "monthly" else base_amount / Decimal("12")
             )
             monthly_subscription_cost += monthly_cost
-            if subscription.usage_count <= 1 and monthly_cost >= Decimal("15"):
+            if recent_uses.get(subscription.id, 0) <= STALE_MAX_USES and monthly_cost >= Decimal("15"):
                 stale_subscriptions.append(
                     {"subscription": subscription, "monthly_cost": monthly_cost}
                 )
@@ -366,7 +365,7 @@ class FinancialTriageService:
                 severity="low",
                 area="subscriptions",
                 title=f"Low-usage subscription: {sub.name}",
-                detail="Usage is minimal but cost is recurring. If this is not essential, pause or cancel it.",
+                detail=f"Used {recent_uses.get(sub.id, 0)} time(s) in the last {STALE_WINDOW_DAYS} days but the cost is recurring. If this is not essential, pause or cancel it.",
                 impact_amount=worst_stale["monthly_cost"],
                 action_route="/dashboard/subscriptions",
                 action_label="Review subscription",
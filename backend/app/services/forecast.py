@@ -0,0 +1,289 @@
+"""
+Monte Carlo cash-flow forecast.
+
+The balance path of every scenario is
+
+    current balance + cumulative scheduled flows - cumulative discretionary spend
+
+* Scheduled flows are deterministic: salary credits from income sources with a
+  payday, bill and subscription charges on their recurrence dates, and goal
+  contributions on the first payday of each month (or the 1st without one)
+  until the goal's target is met. They are computed once and shared by every
+  scenario.
+* Discretionary spend (expenses not linked to a bill or subscription) is
+  modelled by a day-of-week bootstrap of the last ``HISTORY_DAYS`` days: each
+  forecast day draws one historical day with the same weekday. Days without
+  history on that weekday fall back to the whole window.
+
+All scenarios are simulated at once as a ``(scenarios, horizon)`` NumPy array.
+The generator is seeded from the user and date, so repeated requests on a
+given day return the same bands.
+"""
+
+import hashlib
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import Date, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.models.bill import Bill
+from app.models.income import IncomeSource
+from app.models.savings import SavingsGoal
+from app.models.subscription import Subscription
+from app.models.transaction import Transaction
+from app.services.autopilot import AutopilotService
+from app.services.ledger import LedgerService
+from app.services.recurrence import RecurrenceRule
+
+HISTORY_DAYS = 90
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _money(value: Any) -> float:
+    return float(AutopilotService._to_decimal(value))
+
+
+def _seed(user_id: str, today: date) -> int:
+    digest = hashlib.sha256(f"{user_id}:{today.isoformat()}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _sorted_percentiles(np, rows, percentiles):
+    """``np.percentile(..., method="linear")`` of each already-sorted row."""
+    positions = np.asarray(percentiles, dtype=np.float64) / 100 * (rows.shape[1] - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, rows.shape[1] - 1)
+    weight = positions - lower
+    low_values, high_values = rows[:, lower].T, rows[:, upper].T
+    return low_values + (high_values - low_values) * weight[:, np.newaxis]
+
+
+class ForecastService:
+    @staticmethod
+    def scheduled_flows(
+        *,
+        now: datetime,
+        horizon_days: int,
+        income_sources: Sequence[IncomeSource],
+        bills: Sequence[Bill],
+        subscriptions: Sequence[Subscription],
+        goals: Sequence[SavingsGoal],
+    ) -> Dict[str, List[float]]:
+        """
+        Per-day scheduled income and outflows for the days after ``now``
+        (index 0 is tomorrow; anything still due today lands there too).
+        """
+        start = now.date() + timedelta(days=1)
+        end = now.date() + timedelta(days=horizon_days)
+        income = [0.0] * horizon_days
+        outflows = [0.0] * horizon_days
+
+        def index(day: date) -> int:
+            return max(0, (day - start).days)
+
+        paydays: List[date] = []
+        for source in income_sources:
+            if not source.active:
+                continue
+            salary_day = AutopilotService._parse_payday(source.payday)
+            if salary_day is None:
+                continue
+            rule = RecurrenceRule.from_frequency(
+                source.frequency,
+                AutopilotService._next_recurring_date(now, salary_day),
+                day_of_month=salary_day,
+            )
+            amount = _money(source.amount)
+            for day in rule.between(now, end):
+                income[index(day)] += amount
+                paydays.append(day)
+
+        for bill in bills:
+            amount = _money(bill.amount_estimated)
+            for day in AutopilotService._bill_rule(now, bill).between(now, end):
+                outflows[index(day)] += amount
+
+        for subscription in subscriptions:
+            if not subscription.is_active:
+                continue
+            next_billing = AutopilotService._resolve_subscription_due_date(now, subscription)
+            rule = RecurrenceRule.from_frequency(subscription.billing_cycle, next_billing)
+            amount = _money(subscription.amount)
+            for day in rule.between(now, end):
+                outflows[index(day)] += amount
+
+        contribution_days: Dict[tuple, date] = {}
+        for day in sorted(paydays):
+            contribution_days.setdefault((day.year, day.month), day)
+        month = start.replace(day=1)
+        while month <= end:
+            contribution_days.setdefault((month.year, month.month), max(month, start))
+            month = (month + timedelta(days=32)).replace(day=1)
+        for goal in goals:
+            if goal.is_completed:
+                continue
+            contribution = _money(goal.monthly_contribution)
+            remaining = _money(goal.target_amount) - _money(goal.current_amount)
+            if contribution <= 0 or remaining <= 0:
+                continue
+            for day in sorted(contribution_days.values()):
+                if day > end or remaining <= 0:
+                    break
+                amount = min(contribution, remaining)
+                outflows[index(day)] += amount
+                remaining -= amount
+
+        return {"income": income, "outflows": outflows}
+
+    @staticmethod
+    def simulate(
+        *,
+        now: datetime,
+        current_balance: float,
+        daily_spend_history: Sequence[float],
+        scheduled_income: Sequence[float],
+        scheduled_outflows: Sequence[float],
+        scenarios: int,
+        seed: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Vectorized Monte Carlo over ``scenarios`` paths (pure; no I/O).
+        ``daily_spend_history`` is ordered oldest first and ends yesterday.
+        """
+        import numpy as np  # imported lazily: only the forecast needs it
+
+        horizon = len(scheduled_income)
+        start = now.date() + timedelta(days=1)
+        rng = np.random.default_rng(seed)
+
+        history = np.asarray(daily_spend_history, dtype=np.float64)
+        net_scheduled = np.asarray(scheduled_income, dtype=np.float64) - np.asarray(scheduled_outflows, dtype=np.float64)
+
+        # Paths are laid out (horizon, scenarios): the running sum adds whole
+        # rows and the per-day percentiles sort contiguous rows in place, which
+        # is several times faster than np.percentile down a strided axis.
+        if history.size:
+            # Group the history by weekday so each forecast day samples its own.
+            first_history_day = now.date() - timedelta(days=history.size)
+            history_weekdays = (first_history_day.weekday() + np.arange(history.size)) % 7
+            pool = history[np.argsort(history_weekdays, kind="stable")]
+            pool = np.append(pool, pool[-1])  # guards the u * size rounding edge
+            counts = np.bincount(history_weekdays, minlength=7)
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            forecast_weekdays = (start.weekday() + np.arange(horizon)) % 7
+            pool_size = counts[forecast_weekdays].astype(np.float64)
+            pool_offset = offsets[forecast_weekdays].astype(np.float64)
+            missing = pool_size == 0
+            pool_size[missing] = history.size
+            pool_offset[missing] = 0
+
+            draws = rng.random((horizon, scenarios))
+            draws *= pool_size[:, np.newaxis]
+            draws += pool_offset[:, np.newaxis]
+            paths = pool[draws.astype(np.intp)]
+            np.subtract(net_scheduled[:, np.newaxis], paths, out=paths)
+        else:
+            paths = np.repeat(net_scheduled[:, np.newaxis], scenarios, axis=1)
+        paths[0] += current_balance
+        np.cumsum(paths, axis=0, out=paths)
+
+        minimums = paths.min(axis=0)
+        paths.sort(axis=1)
+        bands = _sorted_percentiles(np, paths, PERCENTILES)
+        end_balance = bands[:, -1]
+
+        return {
+            "start_date": start.isoformat(),
+            "horizon_days": horizon,
+            "scenarios": scenarios,
+            "current_balance": round(current_balance, 2),
+            "dates": [(start + timedelta(days=offset)).isoformat() for offset in range(horizon)],
+            "scheduled_net": np.round(net_scheduled, 2).tolist(),
+            "bands": {f"p{percentile}": np.round(band, 2).tolist() for percentile, band in zip(PERCENTILES, bands)},
+            "end_balance": {
+                f"p{percentile}": round(float(value), 2) for percentile, value in zip(PERCENTILES, end_balance)
+            },
+            "probability_below_zero": round(float(np.mean(minimums < 0)), 4),
+            "median_min_balance": round(float(np.median(minimums)), 2),
+            "model": {
+                "history_days": int(history.size),
+                "mean_daily_spend": round(float(history.mean()), 2) if history.size else 0.0,
+                "scheduled_income": round(float(np.sum(scheduled_income)), 2),
+                "scheduled_outflows": round(float(np.sum(scheduled_outflows)), 2),
+            },
+        }
+
+    @staticmethod
+    async def daily_spend_history(db: AsyncSession, user_id: str, now: datetime, days: int = HISTORY_DAYS) -> List[float]:
+        """Discretionary spend per day for the ``days`` days before today."""
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        window_start = today - timedelta(days=days)
+        day = func.date(Transaction.occurred_at, type_=Date)
+        rows = await db.execute(
+            select(day, func.sum(Transaction.amount))
+            .where(
+                Transaction.user_id == user_id,
+                Transaction.type == "EXPENSE",
+                Transaction.bill_id.is_(None),
+                Transaction.subscription_id.is_(None),
+                Transaction.occurred_at >= window_start,
+                Transaction.occurred_at < today,
+            )
+            .group_by(day)
+        )
+        history = [0.0] * days
+        for spent_on, amount in rows.all():
+            offset = (spent_on - window_start.date()).days
+            if 0 <= offset < days:
+                history[offset] = _money(amount)
+
+        # Do not let the days before the first transaction count as no spend.
+        first_transaction = await db.scalar(
+            select(func.min(Transaction.occurred_at)).where(Transaction.user_id == user_id)
+        )
+        if first_transaction is None:
+            return []
+        skip = max(0, (first_transaction.date() - window_start.date()).days)
+        return history[skip:]
+
+    @staticmethod
+    async def get_forecast(
+        db: AsyncSession,
+        user_id: str,
+        *,
+        horizon_days: int = 90,
+        scenarios: int = 5000,
+    ) -> Dict[str, Any]:
+        now = datetime.utcnow()
+        income_sources = (await db.execute(select(IncomeSource).filter(IncomeSource.user_id == user_id))).scalars().all()
+        bills = (await db.execute(select(Bill).filter(Bill.user_id == user_id))).scalars().all()
+        subscriptions = (
+            await db.execute(select(Subscription).filter(Subscription.user_id == user_id))
+        ).scalars().all()
+        goals = (await db.execute(select(SavingsGoal).filter(SavingsGoal.user_id == user_id))).scalars().all()
+
+        scheduled = ForecastService.scheduled_flows(
+            now=now,
+            horizon_days=horizon_days,
+            income_sources=income_sources,
+            bills=bills,
+            subscriptions=subscriptions,
+            goals=goals,
+        )
+        current_balance = await LedgerService.current_balance(db, user_id)
+        daily_spend_history = await ForecastService.daily_spend_history(db, user_id, now)
+        # Tens of milliseconds of NumPy at the larger scenario counts: keep it off the event loop.
+        forecast = await run_in_threadpool(
+            ForecastService.simulate,
+            now=now,
+            current_balance=float(current_balance),
+            daily_spend_history=daily_spend_history,
+            scheduled_income=scheduled["income"],
+            scheduled_outflows=scheduled["outflows"],
+            scenarios=scenarios,
+            seed=_seed(user_id, now.date()),
+        )
+        forecast["generated_at"] = now
+        return forecast
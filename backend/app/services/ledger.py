@@ -0,0 +1,131 @@
+"""
+Reads, consistency checks and rebuilds for the materialized ledger
+(``user_balances`` / ``ledger_daily_net``, see ``app/models/ledger.py``).
+
+``current_balance`` is a primary-key lookup. ``balance_before`` subtracts the
+daily nets from the given day on, a range scan over the ``(user_id, day)``
+primary key that only touches the days after it, so recent dates stay cheap
+however long the ledger is.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import Date, DateTime, case, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ledger import LedgerDailyNet, UserBalance
+from app.models.transaction import Transaction
+
+_SIGNED_AMOUNT = case(
+    (Transaction.type == "INCOME", Transaction.amount),
+    (Transaction.type == "EXPENSE", -Transaction.amount),
+    else_=0,
+)
+_DAY = func.date(func.coalesce(Transaction.occurred_at, Transaction.created_at), type_=Date)
+_CENT = Decimal("0.01")
+
+
+def _money(value) -> Decimal:
+    if value is None:
+        return Decimal("0")
+    return (value if isinstance(value, Decimal) else Decimal(str(value))).quantize(_CENT)
+
+
+class LedgerService:
+    @staticmethod
+    async def current_balance(db: AsyncSession, user_id: str) -> Decimal:
+        """Lifetime INCOME minus EXPENSE for ``user_id``."""
+        balance = await db.scalar(select(UserBalance.balance).where(UserBalance.user_id == user_id))
+        return _money(balance)
+
+    @staticmethod
+    async def balance_before(db: AsyncSession, user_id: str, day: date) -> Decimal:
+        """Balance over transactions dated before ``day``."""
+        row = (
+            await db.execute(
+                select(
+                    select(UserBalance.balance).where(UserBalance.user_id == user_id).scalar_subquery().label("balance"),
+                    select(func.sum(LedgerDailyNet.net))
+                    .where(LedgerDailyNet.user_id == user_id, LedgerDailyNet.day >= day)
+                    .scalar_subquery()
+                    .label("since"),
+                )
+            )
+        ).one()
+        return _money(row.balance) - _money(row.since)
+
+    @staticmethod
+    async def find_drift(db: AsyncSession, user_ids: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        Compare the materialized tables with the transactions they summarize.
+        Returns one entry per user whose balance or any daily net is off.
+        """
+        scope = sorted(set(user_ids)) if user_ids is not None else None
+
+        expected_daily_query = select(Transaction.user_id, _DAY.label("day"), func.sum(_SIGNED_AMOUNT)).group_by(
+            Transaction.user_id, _DAY
+        )
+        stored_daily_query = select(LedgerDailyNet.user_id, LedgerDailyNet.day, LedgerDailyNet.net)
+        stored_balance_query = select(UserBalance.user_id, UserBalance.balance)
+        if scope is not None:
+            expected_daily_query = expected_daily_query.where(Transaction.user_id.in_(scope))
+            stored_daily_query = stored_daily_query.where(LedgerDailyNet.user_id.in_(scope))
+            stored_balance_query = stored_balance_query.where(UserBalance.user_id.in_(scope))
+
+        expected_daily = {
+            (user_id, day): _money(net) for user_id, day, net in (await db.execute(expected_daily_query)).all()
+        }
+        stored_daily = {
+            (user_id, day): _money(net) for user_id, day, net in (await db.execute(stored_daily_query)).all()
+        }
+        stored_balances = {user_id: _money(balance) for user_id, balance in (await db.execute(stored_balance_query)).all()}
+
+        expected_balances: Dict[str, Decimal] = {}
+        for (user_id, _), net in expected_daily.items():
+            expected_balances[user_id] = expected_balances.get(user_id, Decimal("0")) + net
+
+        days_off: Dict[str, int] = {}
+        for key in set(expected_daily) | set(stored_daily):
+            if expected_daily.get(key, Decimal("0")) != stored_daily.get(key, Decimal("0")):
+                days_off[key[0]] = days_off.get(key[0], 0) + 1
+
+        drift: List[Dict] = []
+        for user_id in sorted(set(expected_balances) | set(stored_balances) | set(days_off)):
+            expected = expected_balances.get(user_id, Decimal("0"))
+            stored = stored_balances.get(user_id, Decimal("0"))
+            if expected != stored or user_id in days_off:
+                drift.append(
+                    {
+                        "user_id": user_id,
+                        "expected_balance": expected,
+                        "stored_balance": stored,
+                        "days_off": days_off.get(user_id, 0),
+                    }
+                )
+        return drift
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, user_ids: Optional[Iterable[str]] = None) -> None:
+        """Recompute both tables from ``transactions`` (all users, or just ``user_ids``)."""
+        scope = sorted(set(user_ids)) if user_ids is not None else None
+        if scope == []:
+            return
+
+        clear_daily = delete(LedgerDailyNet)
+        clear_balances = delete(UserBalance)
+        daily_source = select(Transaction.user_id, _DAY, func.sum(_SIGNED_AMOUNT)).group_by(Transaction.user_id, _DAY)
+        balance_source = select(Transaction.user_id, func.sum(_SIGNED_AMOUNT), literal(datetime.utcnow(), DateTime)).group_by(
+            Transaction.user_id
+        )
+        if scope is not None:
+            clear_daily = clear_daily.where(LedgerDailyNet.user_id.in_(scope))
+            clear_balances = clear_balances.where(UserBalance.user_id.in_(scope))
+            daily_source = daily_source.where(Transaction.user_id.in_(scope))
+            balance_source = balance_source.where(Transaction.user_id.in_(scope))
+
+        await db.execute(clear_daily)
+        await db.execute(clear_balances)
+        await db.execute(insert(LedgerDailyNet).from_select(["user_id", "day", "net"], daily_source))
+        await db.execute(insert(UserBalance).from_select(["user_id", "balance", "updated_at"], balance_source))
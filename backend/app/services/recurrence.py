@@ -0,0 +1,212 @@
+"""
+Recurrence rules for bills, subscriptions and income sources.
+
+A rule is anchored on its first occurrence and repeats every ``interval``
+periods of its frequency. Day-based frequencies (daily/weekly/biweekly) step
+by a fixed number of days; month-based frequencies (monthly/quarterly/yearly)
+step by calendar months and keep the requested day of month, clamped to the
+month length (a bill due on the 31st lands on Feb 28/29, then back on Mar 31).
+
+Expansions are computed arithmetically (no walking from the anchor) and are
+memoized per ``(rule, window)`` so repeated timeline/safe-to-spend requests
+for the same day reuse the same tuple of dates.
+"""
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from typing import Tuple
+
+DAY_STEPS = {"daily": 1, "weekly": 7, "biweekly": 14}
+MONTH_STEPS = {"monthly": 1, "quarterly": 3, "yearly": 12}
+SUPPORTED_FREQUENCIES = frozenset(DAY_STEPS) | frozenset(MONTH_STEPS)
+
+FREQUENCY_ALIASES = {
+    "day": "daily",
+    "week": "weekly",
+    "fortnightly": "biweekly",
+    "bi-weekly": "biweekly",
+    "month": "monthly",
+    "quarter": "quarterly",
+    "year": "yearly",
+    "annual": "yearly",
+    "annually": "yearly",
+}
+
+# Monthly normalisation factors. "daily" intentionally stays at 30 to match
+# the figures users already see in safe-to-spend.
+MONTHLY_MULTIPLIERS = {
+    "daily": Decimal("30"),
+    "weekly": Decimal("52") / Decimal("12"),
+    "biweekly": Decimal("26") / Decimal("12"),
+    "monthly": Decimal("1"),
+    "quarterly": Decimal("1") / Decimal("3"),
+    "yearly": Decimal("1") / Decimal("12"),
+}
+
+EXPANSION_CACHE_SIZE = 4096
+
+
+def normalize_frequency(frequency: str | None) -> str:
+    """Map free-form frequency strings onto a supported frequency.
+
+    Unknown values default to monthly for safety, matching the historical
+    behaviour of the autopilot calculations.
+    """
+    value = (frequency or "monthly").strip().lower()
+    value = FREQUENCY_ALIASES.get(value, value)
+    if value not in SUPPORTED_FREQUENCIES:
+        return "monthly"
+    return value
+
+
+def monthly_multiplier(frequency: str | None) -> Decimal:
+    return MONTHLY_MULTIPLIERS[normalize_frequency(frequency)]
+
+
+def _month_index(value: date) -> int:
+    return value.year * 12 + value.month - 1
+
+
+def _date_from_month_index(index: int, day: int) -> date:
+    year, month_zero = divmod(index, 12)
+    month = month_zero + 1
+    return date(year, month, max(1, min(day, calendar.monthrange(year, month)[1])))
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    frequency: str
+    anchor: date
+    interval: int = 1
+    day_of_month: int | None = None
+
+    @classmethod
+    def from_frequency(
+        cls,
+        frequency: str | None,
+        anchor: date | datetime,
+        *,
+        interval: int = 1,
+        day_of_month: int | None = None,
+    ) -> "RecurrenceRule":
+        if isinstance(anchor, datetime):
+            anchor = anchor.date()
+        normalized = normalize_frequency(frequency)
+        if normalized in MONTH_STEPS:
+            day_of_month = max(1, min(day_of_month or anchor.day, 31))
+        else:
+            day_of_month = None
+        return cls(
+            frequency=normalized,
+            anchor=anchor,
+            interval=max(1, int(interval)),
+            day_of_month=day_of_month,
+        )
+
+    @property
+    def step_days(self) -> int | None:
+        step = DAY_STEPS.get(self.frequency)
+        return step * self.interval if step else None
+
+    @property
+    def step_months(self) -> int | None:
+        step = MONTH_STEPS.get(self.frequency)
+        return step * self.interval if step else None
+
+    def _month_occurrence(self, k: int) -> date:
+        return _date_from_month_index(
+            _month_index(self.anchor) + k * self.step_months,
+            self.day_of_month or self.anchor.day,
+        )
+
+    def _first_index_on_or_after(self, start: date) -> int:
+        if start <= self.anchor:
+            return 0
+        step_days = self.step_days
+        if step_days:
+            return -(-(start - self.anchor).days // step_days)
+        k = max(0, (_month_index(start) - _month_index(self.anchor)) // self.step_months)
+        # Day clamping means the occurrence in ``start``'s month may still be
+        # before ``start``; at most one extra step is ever needed.
+        while self._month_occurrence(k) < start:
+            k += 1
+        return k
+
+    def next_occurrence(self, on_or_after: date | datetime) -> date:
+        if isinstance(on_or_after, datetime):
+            on_or_after = on_or_after.date()
+        k = self._first_index_on_or_after(on_or_after)
+        if self.step_days:
+            return self.anchor + timedelta(days=k * self.step_days)
+        return self._month_occurrence(k)
+
+    def between(self, start: date | datetime, end: date | datetime) -> Tuple[date, ...]:
+        """Occurrences in the inclusive window ``[start, end]`` (memoized)."""
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+        return _expand_cached(self, start, end)
+
+
+def _expand(rule: RecurrenceRule, start: date, end: date) -> Tuple[date, ...]:
+    if end < start or end < rule.anchor:
+        return ()
+
+    k = rule._first_index_on_or_after(start)
+    step_days = rule.step_days
+    if step_days:
+        first = rule.anchor.toordinal() + k * step_days
+        last = end.toordinal()
+        if first > last:
+            return ()
+        return tuple(map(date.fromordinal, range(first, last + 1, step_days)))
+
+    step_months = rule.step_months
+    day = rule.day_of_month or rule.anchor.day
+    index = _month_index(rule.anchor) + k * step_months
+    last_index = _month_index(end)
+    occurrences = []
+    while index <= last_index:
+        occurrence = _date_from_month_index(index, day)
+        if occurrence > end:
+            break
+        occurrences.append(occurrence)
+        index += step_months
+    return tuple(occurrences)
+
+
+@lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def _expand_cached(rule: RecurrenceRule, start: date, end: date) -> Tuple[date, ...]:
+    return _expand(rule, start, end)
+
+
+def expansion_cache_info():
+    return _expand_cached.cache_info()
+
+
+def clear_expansion_cache() -> None:
+    _expand_cached.cache_clear()
+
+
+def add_interval(
+    value: datetime, frequency: str | None, count: int = 1, day_of_month: int | None = None
+) -> datetime:
+    """
+    Advance ``value`` by ``count`` periods of ``frequency``, keeping the time of day.
+
+    Month-based steps land on ``day_of_month`` (default: ``value``'s day),
+    clamped to the month length. Pass the schedule's pinned day when chaining
+    from a previous result, or a clamped Feb 28 becomes the new billing day.
+    """
+    normalized = normalize_frequency(frequency)
+    if normalized in DAY_STEPS:
+        return value + timedelta(days=DAY_STEPS[normalized] * count)
+    shifted = _date_from_month_index(
+        _month_index(value) + MONTH_STEPS[normalized] * count,
+        day_of_month or value.day,
+    )
+    return value.replace(year=shifted.year, month=shifted.month, day=shifted.day)
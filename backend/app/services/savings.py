@@ -0,0 +1,165 @@
+"""
+Savings goal contributions.
+
+A contribution is one ``UPDATE ... SET current_amount = current_amount + :x
+... RETURNING`` per goal: the database adds to whatever is committed, so
+concurrent contributions never overwrite each other and no read is needed
+before the write. Completion is decided in the same statement. The matching
+``savings_logs`` rows go in as one multi-row ``INSERT``.
+
+Progress figures are aggregates over ``savings_logs`` (indexed on
+``(goal_id, created_at)``), so they never load the contribution history.
+"""
+
+import math
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from sqlalchemy import case, func, insert, select, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.savings import SavingsGoal, SavingsLog
+from app.models.user import bump_data_version
+
+# (goal_id, amount, note)
+Contribution = Tuple[str, Decimal, Optional[str]]
+
+DAYS_PER_MONTH = 365.25 / 12
+_CENT = Decimal("0.01")
+
+
+def _money(value) -> Decimal:
+    if value is None:
+        return Decimal("0.00")
+    return (value if isinstance(value, Decimal) else Decimal(str(value))).quantize(_CENT)
+
+
+def _month_start(year: int, month: int) -> datetime:
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return datetime(year, month, 1)
+
+
+class SavingsService:
+    @staticmethod
+    async def contribute(
+        db: AsyncSession, user_id: str, contributions: Sequence[Contribution]
+    ) -> Dict[str, SavingsGoal]:
+        """
+        Add ``contributions`` to the user's goals and log each one. Returns the
+        updated goals by id; goals that do not exist or belong to someone else
+        are left out and get no log. Does not commit.
+        """
+        totals: Dict[str, Decimal] = {}
+        for goal_id, amount, _ in contributions:
+            totals[goal_id] = totals.get(goal_id, Decimal("0")) + Decimal(str(amount))
+
+        goals: Dict[str, SavingsGoal] = {}
+        for goal_id, total in totals.items():
+            new_amount = func.coalesce(SavingsGoal.current_amount, 0) + total
+            result = await db.execute(
+                update(SavingsGoal)
+                .where(SavingsGoal.id == goal_id, SavingsGoal.user_id == user_id)
+                .values(
+                    current_amount=new_amount,
+                    is_completed=case((new_amount >= SavingsGoal.target_amount, true()), else_=SavingsGoal.is_completed),
+                )
+                .returning(SavingsGoal)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            goal = result.scalars().first()
+            if goal is not None:
+                goals[goal_id] = goal
+
+        logs = [
+            {"id": str(uuid4()), "goal_id": goal_id, "amount": amount, "note": note}
+            for goal_id, amount, note in contributions
+            if goal_id in goals
+        ]
+        if logs:
+            await db.execute(insert(SavingsLog), logs)
+            await bump_data_version(db, user_id)
+        return goals
+
+    @staticmethod
+    async def contribute_one(
+        db: AsyncSession, user_id: str, goal_id: str, amount: Decimal, note: Optional[str] = None
+    ) -> Optional[SavingsGoal]:
+        goals = await SavingsService.contribute(db, user_id, [(goal_id, amount, note)])
+        return goals.get(goal_id)
+
+    @staticmethod
+    async def get_progress(
+        db: AsyncSession, goal: SavingsGoal, *, months: int = 12, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Contribution totals for ``goal``, per-month sums for the last ``months``
+        months (zero-filled) and an estimated completion date.
+
+        The estimate divides what is left by the average monthly contribution
+        since the first one (``estimate_basis="history"``), or by the planned
+        ``monthly_contribution`` when there is no history (``"planned"``).
+        """
+        now = now or datetime.utcnow()
+        totals = (
+            await db.execute(
+                select(
+                    func.count(SavingsLog.id),
+                    func.sum(SavingsLog.amount),
+                    func.min(SavingsLog.created_at),
+                    func.max(SavingsLog.created_at),
+                ).where(SavingsLog.goal_id == goal.id)
+            )
+        ).one()
+        count, total, first_at, last_at = totals[0], _money(totals[1]), totals[2], totals[3]
+
+        window_start = _month_start(now.year, now.month - months + 1)
+        year_col = func.extract("year", SavingsLog.created_at)
+        month_col = func.extract("month", SavingsLog.created_at)
+        monthly_rows = await db.execute(
+            select(year_col, month_col, func.sum(SavingsLog.amount), func.count(SavingsLog.id))
+            .where(SavingsLog.goal_id == goal.id, SavingsLog.created_at >= window_start)
+            .group_by(year_col, month_col)
+        )
+        by_month = {(int(year), int(month)): (amount, n) for year, month, amount, n in monthly_rows.all()}
+        monthly: List[Dict[str, Any]] = []
+        for offset in range(months):
+            first_day = _month_start(window_start.year, window_start.month + offset)
+            amount, n = by_month.get((first_day.year, first_day.month), (None, 0))
+            monthly.append({"month": f"{first_day.year:04d}-{first_day.month:02d}", "total": _money(amount), "count": n})
+
+        target, current = _money(goal.target_amount), _money(goal.current_amount)
+        remaining = max(target - current, Decimal("0.00"))
+        average_monthly = Decimal("0.00")
+        if count:
+            months_active = (now.year - first_at.year) * 12 + now.month - first_at.month + 1
+            average_monthly = _money(total / max(months_active, 1))
+
+        estimate_basis, estimated_completion = None, None
+        if not goal.is_completed and remaining > 0:
+            planned = _money(goal.monthly_contribution)
+            rate = average_monthly if average_monthly > 0 else planned
+            if rate > 0:
+                estimate_basis = "history" if average_monthly > 0 else "planned"
+                days = math.ceil(float(remaining / rate) * DAYS_PER_MONTH)
+                estimated_completion = now.date() + timedelta(days=days)
+
+        return {
+            "goal_id": goal.id,
+            "target_amount": target,
+            "current_amount": current,
+            "remaining": remaining,
+            "progress_percent": round(float(current / target * 100), 2) if target > 0 else 0.0,
+            "is_completed": bool(goal.is_completed),
+            "contribution_count": count,
+            "total_contributed": total,
+            "average_contribution": _money(total / count) if count else Decimal("0.00"),
+            "average_monthly_contribution": average_monthly,
+            "first_contribution_at": first_at,
+            "last_contribution_at": last_at,
+            "estimate_basis": estimate_basis,
+            "estimated_completion_date": estimated_completion,
+            "monthly": monthly,
+        }
@@ -0,0 +1,185 @@
+"""
+Subscription usage events and cost-per-use analytics.
+
+Usage is appended to ``subscription_usage_events`` (one multi-row ``INSERT``
+per batch) and ``subscriptions.usage_count`` is bumped with
+``UPDATE ... SET usage_count = usage_count + :n RETURNING``, so concurrent
+check-ins are never lost and no read precedes the write.
+
+Analytics are one grouped query over the user's events: per subscription,
+the uses in each window (``SUM(quantity) FILTER (WHERE used_at >= ...)``)
+and in the window before the shortest one, which gives the trend.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.subscription import Subscription, SubscriptionUsageEvent
+from app.models.user import bump_data_version
+from app.services.recurrence import monthly_multiplier
+
+ANALYTICS_WINDOWS = (30, 90)
+# Active subscriptions used at most this often in the last STALE_WINDOW_DAYS
+# days are reported as low-usage by triage.
+STALE_WINDOW_DAYS = 30
+STALE_MAX_USES = 1
+_CENT = Decimal("0.01")
+
+# (subscription_id, used_at, quantity)
+UsageEvent = Tuple[str, Optional[datetime], int]
+
+
+def _money(value: Decimal) -> Decimal:
+    return value.quantize(_CENT)
+
+
+class SubscriptionUsageService:
+    @staticmethod
+    async def record(db: AsyncSession, user_id: str, events: Sequence[UsageEvent]) -> Dict[str, Subscription]:
+        """
+        Append ``events`` and bump the counters of the user's subscriptions.
+        Returns the updated subscriptions by id (with ``category`` loaded);
+        events for unknown or foreign subscriptions are dropped. Does not commit.
+        """
+        now = datetime.utcnow()
+        totals: Dict[str, int] = {}
+        for subscription_id, _, quantity in events:
+            totals[subscription_id] = totals.get(subscription_id, 0) + quantity
+
+        updated = set()
+        for subscription_id, quantity in totals.items():
+            result = await db.execute(
+                update(Subscription)
+                .where(Subscription.id == subscription_id, Subscription.user_id == user_id)
+                .values(usage_count=func.coalesce(Subscription.usage_count, 0) + quantity)
+                .returning(Subscription.id)
+            )
+            updated.update(result.scalars().all())
+
+        rows = [
+            {"subscription_id": subscription_id, "user_id": user_id, "used_at": used_at or now, "quantity": quantity}
+            for subscription_id, used_at, quantity in events
+            if subscription_id in updated
+        ]
+        if not rows:
+            return {}
+        await db.execute(insert(SubscriptionUsageEvent), rows)
+        await bump_data_version(db, user_id)
+
+        subscriptions = await db.execute(
+            select(Subscription)
+            .options(selectinload(Subscription.category))
+            .where(Subscription.id.in_(sorted(updated)))
+            .execution_options(populate_existing=True)
+        )
+        return {subscription.id: subscription for subscription in subscriptions.scalars().all()}
+
+    @staticmethod
+    async def uses_since(db: AsyncSession, user_id: str, since: datetime) -> Dict[str, int]:
+        """Uses per subscription since ``since`` (subscriptions without any are absent)."""
+        rows = await db.execute(
+            select(SubscriptionUsageEvent.subscription_id, func.sum(SubscriptionUsageEvent.quantity))
+            .where(SubscriptionUsageEvent.user_id == user_id, SubscriptionUsageEvent.used_at >= since)
+            .group_by(SubscriptionUsageEvent.subscription_id)
+        )
+        return {subscription_id: int(uses or 0) for subscription_id, uses in rows.all()}
+
+    @staticmethod
+    async def analytics(
+        db: AsyncSession,
+        user_id: str,
+        *,
+        windows: Sequence[int] = ANALYTICS_WINDOWS,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Cost per use over each of ``windows`` (days) for every subscription,
+        plus the trend of the shortest window against the one before it.
+        """
+        now = now or datetime.utcnow()
+        windows = sorted(set(windows))
+        trend_days = windows[0]
+        current_start = now - timedelta(days=trend_days)
+        previous_start = now - timedelta(days=2 * trend_days)
+        earliest = min(previous_start, now - timedelta(days=windows[-1]))
+
+        used_at, quantity = SubscriptionUsageEvent.used_at, SubscriptionUsageEvent.quantity
+        columns = [func.sum(quantity).filter(used_at >= now - timedelta(days=days)) for days in windows]
+        columns.append(func.sum(quantity).filter(used_at >= previous_start, used_at < current_start))
+        usage_rows = await db.execute(
+            select(SubscriptionUsageEvent.subscription_id, *columns)
+            .where(SubscriptionUsageEvent.user_id == user_id, used_at >= earliest)
+            .group_by(SubscriptionUsageEvent.subscription_id)
+        )
+        usage = {row[0]: row[1:] for row in usage_rows.all()}
+        last_used_rows = await db.execute(
+            select(SubscriptionUsageEvent.subscription_id, func.max(used_at))
+            .where(SubscriptionUsageEvent.user_id == user_id)
+            .group_by(SubscriptionUsageEvent.subscription_id)
+        )
+        last_used = dict(last_used_rows.all())
+
+        subscriptions = (
+            await db.execute(select(Subscription).where(Subscription.user_id == user_id).order_by(Subscription.name))
+        ).scalars().all()
+
+        items: List[Dict[str, Any]] = []
+        total_monthly_cost = Decimal("0")
+        unused = 0
+        for subscription in subscriptions:
+            monthly_cost = Decimal(str(subscription.amount or 0)) * monthly_multiplier(subscription.billing_cycle)
+            counts = usage.get(subscription.id)
+            window_uses = [int(value or 0) for value in counts[:-1]] if counts else [0] * len(windows)
+            previous_uses = int(counts[-1] or 0) if counts else 0
+
+            window_stats = {}
+            for days, uses in zip(windows, window_uses):
+                cost = monthly_cost * Decimal(days) / Decimal(30)
+                window_stats[f"{days}d"] = {
+                    "uses": uses,
+                    "cost": _money(cost),
+                    "cost_per_use": _money(cost / uses) if uses else None,
+                }
+
+            current_uses = window_uses[0]
+            if current_uses == 0 and previous_uses == 0:
+                trend = "unused"
+            elif current_uses > previous_uses:
+                trend = "rising"
+            elif current_uses < previous_uses:
+                trend = "falling"
+            else:
+                trend = "flat"
+
+            if subscription.is_active:
+                total_monthly_cost += monthly_cost
+                if current_uses == 0:
+                    unused += 1
+            items.append(
+                {
+                    "subscription_id": subscription.id,
+                    "name": subscription.name,
+                    "is_active": bool(subscription.is_active),
+                    "billing_cycle": subscription.billing_cycle,
+                    "monthly_cost": _money(monthly_cost),
+                    "usage_count": subscription.usage_count or 0,
+                    "last_used_at": last_used.get(subscription.id),
+                    "windows": window_stats,
+                    "trend": trend,
+                    "trend_previous_uses": previous_uses,
+                }
+            )
+
+        return {
+            "generated_at": now,
+            "windows": [f"{days}d" for days in windows],
+            "trend_window": f"{trend_days}d",
+            "total_monthly_cost": _money(total_monthly_cost),
+            "unused_count": unused,
+            "items": items,
+        }
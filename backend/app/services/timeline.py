@@ -0,0 +1,503 @@
+"""
+Timeline reads from the persisted event index (``app/models/timeline.py``).
+
+A window is one range scan over ``(user_id, event_date)`` in
+``(event_date, event_type, sort_at, id)`` order, which is also the keyset for
+cursor pagination. Everything that depends on other tables or on the current
+moment is overlaid on the returned page only: category names, payment order
+status, the salary split, goal contributions and the month-end projection.
+The summary and projection totals come from one aggregate over the recurring
+rows of the window, so they are the same on every page.
+
+The response matches ``AutopilotService.build_timeline`` for the same data,
+except that events sharing a date and type are ordered by ``sort_at``/``id``.
+"""
+
+import base64
+import calendar
+import json
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Row, and_, delete, func, insert, literal, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.autopilot_payment import AutopilotPayment
+from app.models.bill import Bill
+from app.models.budget import BudgetCategory
+from app.models.income import IncomeSource
+from app.models.savings import SavingsGoal
+from app.models.subscription import Subscription
+from app.models.timeline import (
+    RECURRING_HORIZON_DAYS,
+    TRANSACTION_EVENT_COLUMNS,
+    TRANSACTION_SOURCE,
+    TimelineEvent,
+    TimelineIndexState,
+    transaction_event_source,
+)
+from app.models.transaction import Transaction
+from app.services.autopilot import AutopilotService
+from app.services.ledger import LedgerService
+from app.services.recurrence import RecurrenceRule
+
+MAX_DAYS_PAST = 90
+MAX_DAYS_FUTURE = 365
+
+# (event_date, event_type, sort_at, id)
+EventKey = Tuple[date, str, datetime, str]
+
+_KEY_COLUMNS = (TimelineEvent.event_date, TimelineEvent.event_type, TimelineEvent.sort_at, TimelineEvent.id)
+
+
+def encode_cursor(key: EventKey) -> str:
+    event_date, event_type, sort_at, event_id = key
+    payload = json.dumps([event_date.isoformat(), event_type, sort_at.isoformat(), event_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> EventKey:
+    """Inverse of :func:`encode_cursor`; raises ``ValueError`` on anything else."""
+    try:
+        event_date, event_type, sort_at, event_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return date.fromisoformat(event_date), str(event_type), datetime.fromisoformat(sort_at), str(event_id)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def _money(value: Any) -> Decimal:
+    return AutopilotService._to_decimal(value)
+
+
+class TimelineService:
+    @staticmethod
+    def recurring_rows(
+        *,
+        now: datetime,
+        user_id: str,
+        bills: Sequence[Bill],
+        subscriptions: Sequence[Subscription],
+        income_sources: Sequence[IncomeSource],
+    ) -> List[Dict[str, Any]]:
+        """
+        ``timeline_events`` rows for the recurring occurrences from today to
+        ``RECURRING_HORIZON_DAYS`` ahead (pure; same rules as ``build_timeline``).
+        """
+        end = now + timedelta(days=RECURRING_HORIZON_DAYS)
+        rows: List[Dict[str, Any]] = []
+
+        def row(source_type, source_id, day, event_type, title, amount, is_automatic, details):
+            return {
+                "id": f"{source_type}:{source_id}:{day.isoformat()}",
+                "user_id": user_id,
+                "event_date": day,
+                "event_type": event_type,
+                "sort_at": _midnight(day),
+                "source_type": source_type,
+                "source_id": source_id,
+                "title": title,
+                "amount": amount,
+                "is_automatic": is_automatic,
+                "details": details,
+            }
+
+        for bill in bills:
+            details = {
+                "bill_name": bill.name,
+                "due_day": bill.due_day,
+                "frequency": bill.frequency or "monthly",
+                "autopay_enabled": bool(bill.autopay_enabled),
+            }
+            amount = -_money(bill.amount_estimated)
+            for day in AutopilotService._bill_rule(now, bill).between(now, end):
+                rows.append(row("BILL", bill.id, day, "BILL_DUE", bill.name, amount, bool(bill.autopay_enabled), details))
+
+        for sub in subscriptions:
+            if not sub.is_active:
+                continue
+            next_billing = AutopilotService._resolve_subscription_due_date(now, sub)
+            details = {"subscription_name": sub.name, "billing_cycle": sub.billing_cycle}
+            amount = -_money(sub.amount)
+            for day in RecurrenceRule.from_frequency(sub.billing_cycle, next_billing).between(now, end):
+                rows.append(row("SUBSCRIPTION", sub.id, day, "SUBSCRIPTION", sub.name, amount, True, details))
+
+        for income in income_sources:
+            if not income.active:
+                continue
+            salary_day = AutopilotService._parse_payday(income.payday)
+            if salary_day is None:
+                continue
+            salary_rule = RecurrenceRule.from_frequency(
+                income.frequency,
+                AutopilotService._next_recurring_date(now, salary_day),
+                day_of_month=salary_day,
+            )
+            details = {"source": f"Income ({(income.frequency or 'monthly').lower()})"}
+            amount = _money(income.amount)
+            for day in salary_rule.between(now, end):
+                rows.append(row("INCOME", income.id, day, "SALARY", "Salary Credited", amount, False, details))
+        return rows
+
+    @staticmethod
+    async def ensure_recurring(
+        db: AsyncSession, user_id: str, *, now: Optional[datetime] = None, commit: bool = True
+    ) -> bool:
+        """
+        Re-expand the user's recurring rows unless they were expanded today and
+        no source changed since. Runs on the primary. Returns whether it rebuilt.
+        """
+        now = now or datetime.utcnow()
+        state = (
+            await db.execute(
+                select(TimelineIndexState).where(TimelineIndexState.user_id == user_id).with_for_update()
+            )
+        ).scalar_one_or_none()
+        if state is not None and state.recurring_from == now.date():
+            return False
+
+        bills = (await db.execute(select(Bill).filter(Bill.user_id == user_id))).scalars().all()
+        subscriptions = (
+            await db.execute(select(Subscription).filter(Subscription.user_id == user_id, Subscription.is_active == True))
+        ).scalars().all()
+        income_sources = (
+            await db.execute(select(IncomeSource).filter(IncomeSource.user_id == user_id, IncomeSource.active == True))
+        ).scalars().all()
+        rows = TimelineService.recurring_rows(
+            now=now, user_id=user_id, bills=bills, subscriptions=subscriptions, income_sources=income_sources
+        )
+
+        await db.execute(
+            delete(TimelineEvent).where(
+                TimelineEvent.user_id == user_id, TimelineEvent.source_type != TRANSACTION_SOURCE
+            )
+        )
+        if rows:
+            await db.execute(TimelineEvent.__table__.insert(), rows)
+        if state is None:
+            db.add(TimelineIndexState(user_id=user_id, recurring_from=now.date()))
+        else:
+            state.recurring_from = now.date()
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
+        return True
+
+    @staticmethod
+    async def rebuild(db, user_ids: Optional[Iterable[str]] = None) -> None:
+        """
+        Recompute the TRANSACTION rows from ``transactions`` (all users, or just
+        ``user_ids``) and mark their recurring rows for re-expansion.
+        """
+        scope = sorted(set(user_ids)) if user_ids is not None else None
+        if scope == []:
+            return
+        clear = delete(TimelineEvent).where(TimelineEvent.source_type == TRANSACTION_SOURCE)
+        source = transaction_event_source()
+        stale = update(TimelineIndexState).values(recurring_from=None)
+        if scope is not None:
+            clear = clear.where(TimelineEvent.user_id.in_(scope))
+            source = source.where(Transaction.user_id.in_(scope))
+            stale = stale.where(TimelineIndexState.user_id.in_(scope))
+
+        await db.execute(clear)
+        await db.execute(insert(TimelineEvent).from_select(TRANSACTION_EVENT_COLUMNS, source))
+        await db.execute(stale)
+
+    @staticmethod
+    async def get_window(
+        db: AsyncSession,
+        user_id: str,
+        *,
+        days_past: int = 7,
+        days_future: int = 30,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Timeline events from ``days_past`` days ago to ``days_future`` days ahead.
+
+        Without ``limit`` the whole window is returned. With it, at most
+        ``limit`` events after ``cursor`` come back along with ``next_cursor``
+        (``None`` on the last page). Raises ``ValueError`` for a bad cursor.
+        """
+        now = now or datetime.utcnow()
+        days_past = max(0, min(days_past, MAX_DAYS_PAST))
+        days_future = max(1, min(days_future, MAX_DAYS_FUTURE))
+        start_date = now - timedelta(days=days_past)
+        end_date = now + timedelta(days=days_future)
+        today, end_day = now.date(), end_date.date()
+        after = decode_cursor(cursor) if cursor else None
+
+        recurring_window = and_(
+            TimelineEvent.source_type != TRANSACTION_SOURCE,
+            TimelineEvent.event_date >= today,
+            TimelineEvent.event_date <= end_day,
+        )
+        page_query = (
+            # Plain rows rather than ORM entities: the page is read-only.
+            select(*TimelineEvent.__table__.columns)
+            .where(
+                TimelineEvent.user_id == user_id,
+                TimelineEvent.event_date >= start_date.date(),
+                TimelineEvent.event_date <= end_day,
+                or_(
+                    and_(
+                        TimelineEvent.source_type == TRANSACTION_SOURCE,
+                        TimelineEvent.sort_at >= start_date,
+                        TimelineEvent.sort_at <= now,
+                    ),
+                    recurring_window,
+                ),
+            )
+            .order_by(*_KEY_COLUMNS)
+        )
+        if after is not None:
+            page_query = page_query.where(
+                tuple_(*_KEY_COLUMNS) > tuple_(*(literal(value, column.type) for value, column in zip(after, _KEY_COLUMNS)))
+            )
+        if limit is not None:
+            page_query = page_query.limit(limit + 1)
+        rows = (await db.execute(page_query)).all()
+
+        # Totals over the whole window, whichever page this is.
+        projection_date = TimelineService._projection_date(now)
+        cutoff = projection_date.date()
+        negative = TimelineEvent.amount < 0
+        salary = TimelineEvent.event_type == "SALARY"
+        totals = (
+            await db.execute(
+                select(
+                    func.sum(TimelineEvent.amount).filter(negative),
+                    func.sum(TimelineEvent.amount).filter(negative, TimelineEvent.event_date <= cutoff),
+                    func.sum(TimelineEvent.amount).filter(salary, TimelineEvent.event_date <= cutoff),
+                    func.min(TimelineEvent.event_date).filter(salary),
+                ).where(TimelineEvent.user_id == user_id, recurring_window)
+            )
+        ).one()
+        commitments, commitments_to_cutoff = -_money(totals[0]), -_money(totals[1])
+        income_to_cutoff, next_salary = _money(totals[2]), totals[3]
+
+        payment_orders = (
+            await db.execute(
+                select(AutopilotPayment).filter(
+                    AutopilotPayment.user_id == user_id,
+                    AutopilotPayment.due_on >= start_date.date(),
+                    AutopilotPayment.due_on <= end_day,
+                )
+            )
+        ).scalars().all()
+        payment_order_map = {(order.source_type, order.source_id, order.due_on): order for order in payment_orders}
+
+        # Paid occurrences are completed, so they are not upcoming commitments.
+        paid_ids = [
+            f"{order.source_type}:{order.source_id}:{order.due_on.isoformat()}"
+            for order in payment_orders
+            if order.status == "succeeded" and order.due_on >= today
+        ]
+        if paid_ids:
+            for paid_on, amount in (
+                await db.execute(
+                    select(TimelineEvent.event_date, TimelineEvent.amount).where(
+                        TimelineEvent.user_id == user_id, TimelineEvent.id.in_(paid_ids), negative
+                    )
+                )
+            ).all():
+                commitments += _money(amount)
+                if paid_on <= cutoff:
+                    commitments_to_cutoff += _money(amount)
+
+        bills = (await db.execute(select(Bill.name, Bill.amount_estimated).filter(Bill.user_id == user_id))).all()
+        subscriptions = (
+            await db.execute(
+                select(Subscription.name, Subscription.amount).filter(
+                    Subscription.user_id == user_id, Subscription.is_active == True
+                )
+            )
+        ).all()
+        goals = (
+            await db.execute(
+                select(SavingsGoal).filter(SavingsGoal.user_id == user_id, SavingsGoal.is_completed == False)
+            )
+        ).scalars().all()
+
+        auto_prepared_payments: List[Dict[str, float]] = [
+            {"name": name, "amount": float(_money(amount))} for name, amount in bills
+        ]
+        auto_prepared_payments.extend({"name": name, "amount": float(_money(amount))} for name, amount in subscriptions)
+        auto_prepared_payments.extend(
+            {"name": goal.name, "amount": float(_money(goal.monthly_contribution))}
+            for goal in goals
+            if _money(goal.monthly_contribution) > 0
+        )
+        total_prepared = sum((Decimal(str(item["amount"])) for item in auto_prepared_payments), Decimal("0"))
+
+        overlay: List[Tuple[EventKey, Dict[str, Any]]] = []
+        goal_total = Decimal("0")
+        if next_salary is not None:
+            for goal in goals:
+                target_amount = _money(goal.target_amount)
+                current_amount = _money(goal.current_amount)
+                contribution_amount = _money(goal.monthly_contribution)
+                if contribution_amount <= 0:
+                    continue
+                goal_total += contribution_amount
+                progress = int((current_amount / target_amount) * Decimal("100")) if target_amount > 0 else 0
+                key = (next_salary, "GOAL_CONTRIBUTION", _midnight(next_salary), f"GOAL:{goal.id}")
+                overlay.append(
+                    (
+                        key,
+                        {
+                            "date": next_salary.isoformat(),
+                            "type": "GOAL_CONTRIBUTION",
+                            "title": goal.name,
+                            "amount": -float(contribution_amount),
+                            "is_automatic": True,
+                            "is_completed": False,
+                            "details": {
+                                "goal_name": goal.name,
+                                "progress": progress,
+                                "target": float(target_amount),
+                            },
+                        },
+                    )
+                )
+        commitments += goal_total
+
+        if projection_date <= end_date:
+            if next_salary is not None and next_salary <= cutoff:
+                commitments_to_cutoff += goal_total
+            current_balance = await LedgerService.current_balance(db, user_id)
+            projected_balance = current_balance + income_to_cutoff - commitments_to_cutoff
+            if projected_balance < 0:
+                commitments += -projected_balance
+            days_to_projection = max((cutoff - today).days, 0)
+            if days_to_projection <= 21:
+                confidence, confidence_score = "high", 85
+            elif days_to_projection <= 45:
+                confidence, confidence_score = "medium", 65
+            else:
+                confidence, confidence_score = "low", 45
+            overlay.append(
+                (
+                    (cutoff, "PROJECTION", projection_date, "PROJECTION"),
+                    {
+                        "date": cutoff.isoformat(),
+                        "type": "PROJECTION",
+                        "title": "Projected Balance",
+                        "amount": float(projected_balance),
+                        "is_automatic": False,
+                        "is_completed": False,
+                        "details": {
+                            "confidence": confidence,
+                            "confidence_score": confidence_score,
+                        },
+                    },
+                )
+            )
+
+        category_ids = {row.category_id for row in rows if row.category_id}
+        category_names = {}
+        if category_ids:
+            category_names = dict(
+                (
+                    await db.execute(
+                        select(BudgetCategory.id, BudgetCategory.name).filter(
+                            BudgetCategory.user_id == user_id, BudgetCategory.id.in_(category_ids)
+                        )
+                    )
+                ).all()
+            )
+
+        merged = [
+            ((row.event_date, row.event_type, row.sort_at, row.id), row) for row in rows
+        ] + [(key, event) for key, event in overlay if after is None or key > after]
+        merged.sort(key=lambda item: item[0])
+        next_cursor = None
+        if limit is not None and len(merged) > limit:
+            merged = merged[:limit]
+            next_cursor = encode_cursor(merged[-1][0])
+
+        events = [
+            item
+            if isinstance(item, dict)
+            else TimelineService._event_from_row(
+                item,
+                today=today,
+                category_names=category_names,
+                payment_order_map=payment_order_map,
+                auto_prepared_payments=auto_prepared_payments,
+                total_prepared=total_prepared,
+            )
+            for _, item in merged
+        ]
+
+        return {
+            "events": events,
+            "today": today.isoformat(),
+            "summary": {
+                "upcoming_commitments": round(float(commitments), 2),
+                "next_salary_date": next_salary.isoformat() if next_salary else None,
+                "days_until_salary": (next_salary - today).days if next_salary else None,
+            },
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    def _projection_date(now: datetime) -> datetime:
+        month_end_day = calendar.monthrange(now.year, now.month)[1]
+        projection_date = now.replace(day=month_end_day, hour=0, minute=0, second=0, microsecond=0)
+        if projection_date <= now:
+            next_month_anchor = (now.replace(day=1) + timedelta(days=32)).replace(
+                day=1, hour=0, minute=0, second=0, microsecond=0
+            )
+            next_month_end = calendar.monthrange(next_month_anchor.year, next_month_anchor.month)[1]
+            projection_date = next_month_anchor.replace(day=next_month_end)
+        return projection_date
+
+    @staticmethod
+    def _event_from_row(
+        row: Row,
+        *,
+        today: date,
+        category_names: Dict[str, str],
+        payment_order_map: Dict[tuple, AutopilotPayment],
+        auto_prepared_payments: List[Dict[str, float]],
+        total_prepared: Decimal,
+    ) -> Dict[str, Any]:
+        event = {
+            "date": row.event_date.isoformat(),
+            "type": row.event_type,
+            "title": row.title,
+            "amount": float(row.amount),
+            "is_automatic": bool(row.is_automatic),
+            "is_completed": True,
+        }
+        if row.source_type == TRANSACTION_SOURCE:
+            event["details"] = {
+                "category": category_names.get(row.category_id, "Uncategorized") if row.category_id else "Uncategorized",
+                "transaction_type": row.transaction_type,
+            }
+        elif row.event_type == "SALARY":
+            event["is_completed"] = row.event_date <= today
+            event["details"] = {
+                **(row.details or {}),
+                "auto_prepared_payments": list(auto_prepared_payments),
+                "remaining_after": float(_money(row.amount) - total_prepared),
+            }
+        else:
+            linked_order = payment_order_map.get((row.source_type, row.source_id, row.event_date))
+            event["is_completed"] = bool(linked_order and linked_order.status == "succeeded")
+            event["details"] = {
+                **(row.details or {}),
+                "payment_order_id": linked_order.id if linked_order else None,
+                "payment_status": linked_order.status if linked_order else None,
+                "provider_action_url": linked_order.provider_action_url if linked_order else None,
+            }
+        return event
@@ -0,0 +1,180 @@
+"""
+Set-based bulk mutations for transactions.
+
+Every statement is scoped by ``user_id`` and works on chunks of ids, so a
+request touching thousands of rows costs a handful of round trips and a single
+commit instead of one request and commit per row.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Set
+
+from sqlalchemy import delete, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.bill import Bill
+from app.models.ledger import LEDGER_FIELDS, record_ledger_changes
+from app.models.subscription import Subscription
+from app.models.timeline import invalidate_recurring_timeline, sync_timeline_transactions
+from app.models.transaction import Transaction
+from app.models.user import bump_data_version
+from app.services.recurrence import add_interval
+
+ID_CHUNK_SIZE = 500
+LEDGER_COLUMNS = [getattr(Transaction, field) for field in LEDGER_FIELDS]
+
+
+def _chunks(ids: Sequence[str]) -> Iterator[List[str]]:
+    unique = list(dict.fromkeys(ids))
+    for start in range(0, len(unique), ID_CHUNK_SIZE):
+        yield unique[start:start + ID_CHUNK_SIZE]
+
+
+class TransactionBulkService:
+    @staticmethod
+    async def count_owned(db: AsyncSession, user_id: str, ids: Sequence[str]) -> int:
+        matched = 0
+        for chunk in _chunks(ids):
+            matched += (
+                await db.execute(
+                    select(func.count(Transaction.id)).filter(
+                        Transaction.user_id == user_id, Transaction.id.in_(chunk)
+                    )
+                )
+            ).scalar_one()
+        return matched
+
+    @staticmethod
+    async def update(db: AsyncSession, user_id: str, ids: Sequence[str], changes: Dict[str, object]) -> dict:
+        """
+        Apply ``changes`` (``category_id`` and/or ``status``) to the user's transactions.
+
+        ``status="completed"`` only affects pending rows and mirrors
+        ``complete_transaction``: ``occurred_at`` becomes the payment time, linked
+        bills get ``last_paid_at`` and linked subscriptions move
+        ``next_billing_date`` one cycle ahead.
+        """
+        now = datetime.utcnow()
+        matched = await TransactionBulkService.count_owned(db, user_id, ids)
+        completing = changes.get("status") == "completed"
+        plain_values = {key: value for key, value in changes.items() if not (completing and key == "status")}
+
+        updated_ids: Set[str] = set()
+        bill_ids: Set[str] = set()
+        subscription_ids: Set[str] = set()
+        for chunk in _chunks(ids):
+            owned = (Transaction.user_id == user_id, Transaction.id.in_(chunk))
+            if plain_values:
+                result = await db.execute(
+                    update(Transaction)
+                    .where(*owned)
+                    .values(**plain_values)
+                    .returning(Transaction.id)
+                    .execution_options(synchronize_session=False)
+                )
+                updated_ids.update(result.scalars().all())
+            if completing:
+                # Completion re-dates the rows, which moves them in the ledger.
+                before = {
+                    row.id: row
+                    for row in (
+                        await db.execute(
+                            select(Transaction.id, *LEDGER_COLUMNS).where(*owned, Transaction.status == "pending")
+                        )
+                    ).all()
+                }
+                result = await db.execute(
+                    update(Transaction)
+                    .where(*owned, Transaction.status == "pending")
+                    .values(status="completed", occurred_at=now)
+                    .returning(Transaction.id, Transaction.bill_id, Transaction.subscription_id, *LEDGER_COLUMNS)
+                    .execution_options(synchronize_session=False)
+                )
+                completed = result.all()
+                await record_ledger_changes(
+                    db, removed=[before[row.id] for row in completed if row.id in before], added=completed
+                )
+                for row in completed:
+                    updated_ids.add(row.id)
+                    if row.bill_id:
+                        bill_ids.add(row.bill_id)
+                    elif row.subscription_id:
+                        subscription_ids.add(row.subscription_id)
+
+        bills_updated = await TransactionBulkService._mark_bills_paid(db, user_id, bill_ids, now)
+        subscriptions_updated = await TransactionBulkService._advance_subscriptions(
+            db, user_id, subscription_ids, now
+        )
+        await sync_timeline_transactions(db, sorted(updated_ids))
+        if subscriptions_updated:
+            await invalidate_recurring_timeline(db, [user_id])
+        if updated_ids:
+            await bump_data_version(db, user_id)
+        await db.commit()
+        return {
+            "matched": matched,
+            "updated": len(updated_ids),
+            "bills_updated": bills_updated,
+            "subscriptions_updated": subscriptions_updated,
+        }
+
+    @staticmethod
+    async def delete(db: AsyncSession, user_id: str, ids: Sequence[str]) -> dict:
+        deleted = 0
+        for chunk in _chunks(ids):
+            result = await db.execute(
+                delete(Transaction)
+                .where(Transaction.user_id == user_id, Transaction.id.in_(chunk))
+                .returning(Transaction.id, *LEDGER_COLUMNS)
+                .execution_options(synchronize_session=False)
+            )
+            removed = result.all()
+            await record_ledger_changes(db, removed=removed)
+            await sync_timeline_transactions(db, [row.id for row in removed])
+            deleted += len(removed)
+        if deleted:
+            await bump_data_version(db, user_id)
+        await db.commit()
+        return {"matched": deleted, "updated": deleted}
+
+    @staticmethod
+    async def _mark_bills_paid(db: AsyncSession, user_id: str, bill_ids: Set[str], now: datetime) -> int:
+        updated = 0
+        for chunk in _chunks(sorted(bill_ids)):
+            result = await db.execute(
+                update(Bill)
+                .where(Bill.user_id == user_id, Bill.id.in_(chunk))
+                .values(last_paid_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            updated += result.rowcount
+        return updated
+
+    @staticmethod
+    async def _advance_subscriptions(
+        db: AsyncSession, user_id: str, subscription_ids: Set[str], now: datetime
+    ) -> int:
+        # next_billing_date depends only on the cycle: one UPDATE per distinct cycle.
+        by_cycle: Dict[Optional[str], List[str]] = {}
+        for chunk in _chunks(sorted(subscription_ids)):
+            rows = await db.execute(
+                select(Subscription.id, Subscription.billing_cycle).filter(
+                    Subscription.user_id == user_id, Subscription.id.in_(chunk)
+                )
+            )
+            for subscription_id, billing_cycle in rows.all():
+                by_cycle.setdefault(billing_cycle, []).append(subscription_id)
+
+        updated = 0
+        for billing_cycle, cycle_ids in by_cycle.items():
+            next_billing_date = add_interval(now, billing_cycle)
+            for chunk in _chunks(cycle_ids):
+                result = await db.execute(
+                    update(Subscription)
+                    .where(Subscription.user_id == user_id, Subscription.id.in_(chunk))
+                    .values(next_billing_date=next_billing_date, billing_day=now.day)
+                    .execution_options(synchronize_session=False)
+                )
+                updated += result.rowcount
+        return updated
@@ -0,0 +1,111 @@
+"""
+Transaction description search.
+
+Modes:
+  * ``contains`` – case-insensitive substring match (the historical behaviour).
+  * ``prefix``   – every search word must start a word in the description.
+  * ``fuzzy``    – typo-tolerant trigram matching.
+
+``prefix`` and ``fuzzy`` results are ordered by relevance, then recency.
+
+PostgreSQL is served by the indexes from migration ``3c1d9a7e5b20``: a
+pg_trgm GIN index (``ILIKE`` and the ``<%`` word-similarity operator) and a
+``to_tsvector('simple', ...)`` expression index (prefix ``tsquery``).
+SQLite, used by the test suite, goes through the ``transactions_fts`` FTS5
+trigram table declared next to the model.
+"""
+
+import re
+from typing import List
+
+from sqlalchemy import and_, func, literal, literal_column, or_, select, text
+from sqlalchemy.sql import Select
+
+from app.models.transaction import Transaction
+
+SEARCH_MODES = ("contains", "prefix", "fuzzy")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_TRIGRAM = 3
+
+
+def _words(term: str) -> List[str]:
+    return [word.lower() for word in _WORD_RE.findall(term)]
+
+
+def _fts_phrase(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+class TransactionSearchService:
+    @staticmethod
+    def apply(query: Select, term: str, mode: str, dialect_name: str) -> Select:
+        """Filter (and for ranked modes, order) ``query`` by description search."""
+        term = term.strip()
+        if not term:
+            return query
+        if mode == "contains":
+            return query.filter(Transaction.description.ilike(f"%{term}%"))
+        words = _words(term)
+        if not words:
+            return query.filter(Transaction.description.ilike(f"%{term}%"))
+        if dialect_name == "postgresql":
+            return TransactionSearchService._apply_postgres(query, term, words, mode)
+        if dialect_name == "sqlite":
+            return TransactionSearchService._apply_sqlite(query, words, mode)
+        return TransactionSearchService._apply_like(query, words)
+
+    @staticmethod
+    def _apply_postgres(query: Select, term: str, words: List[str], mode: str) -> Select:
+        if mode == "prefix":
+            document = func.to_tsvector(literal_column("'simple'"), func.coalesce(Transaction.description, ""))
+            ts_query = func.to_tsquery(literal_column("'simple'"), " & ".join(f"{word}:*" for word in words))
+            return query.filter(document.op("@@")(ts_query)).order_by(func.ts_rank(document, ts_query).desc())
+
+        # fuzzy: "term <% description" is true when the term is word-similar to
+        # some part of the description; it is served by the trigram GIN index.
+        return query.filter(literal(term).op("<%")(Transaction.description)).order_by(
+            func.word_similarity(term, Transaction.description).desc()
+        )
+
+    @staticmethod
+    def _apply_sqlite(query: Select, words: List[str], mode: str) -> Select:
+        if mode == "prefix":
+            # Trigram FTS narrows to substring hits; LIKE keeps word-start ones.
+            long_words = [word for word in words if len(word) >= _TRIGRAM]
+            word_start = and_(
+                *(
+                    or_(Transaction.description.ilike(f"{word}%"), Transaction.description.ilike(f"% {word}%"))
+                    for word in words
+                )
+            )
+            if not long_words:
+                return query.filter(word_start)
+            match = " AND ".join(_fts_phrase(word) for word in long_words)
+            return TransactionSearchService._join_fts(query, match).filter(word_start)
+
+        trigrams = sorted(
+            {word[index:index + _TRIGRAM] for word in words for index in range(len(word) - _TRIGRAM + 1)}
+        )
+        if not trigrams:
+            return TransactionSearchService._apply_like(query, words)
+        # Rows sharing more trigrams with the term rank higher (bm25).
+        return TransactionSearchService._join_fts(query, " OR ".join(_fts_phrase(gram) for gram in trigrams))
+
+    @staticmethod
+    def _join_fts(query: Select, match: str) -> Select:
+        hits = (
+            select(
+                literal_column("rowid").label("fts_rowid"),
+                literal_column("bm25(transactions_fts)").label("fts_rank"),
+            )
+            .select_from(text("transactions_fts"))
+            .where(text("transactions_fts MATCH :fts_match").bindparams(fts_match=match))
+            .subquery("fts_hits")
+        )
+        return query.join(hits, hits.c.fts_rowid == literal_column("transactions.rowid")).order_by(
+            hits.c.fts_rank
+        )
+
+    @staticmethod
+    def _apply_like(query: Select, words: List[str]) -> Select:
+        return query.filter(and_(*(Transaction.description.ilike(f"%{word}%") for word in words)))
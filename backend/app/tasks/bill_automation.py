@@ -10,7 +10,6 @@ This module runs daily to check all active bills/subscriptions and:
 from celery import shared_task
 import calendar
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
 from sqlalchemy import select, and_
 from uuid import uuid4
 import asyncio
@@ -21,28 +20,32 @@ from app.models.bill import Bill
 from app.models.subscription import Subscription
 from app.models.transaction import Transaction
 from app.models.notification import Notification
+from app.services.recurrence import RecurrenceRule, add_interval
 
-def calculate_next_due_date(due_day: int, last_paid_at: datetime = None) -> datetime:
-    """Calculate next bill due date based on due_day of month."""
+def calculate_next_due_date(
+    due_day: int, last_paid_at: datetime = None, frequency: str = "monthly"
+) -> datetime:
+    """Calculate next bill due date based on due_day of month and bill frequency."""
     today = datetime.utcnow()
     safe_due_day = max(1, due_day)
     
     if last_paid_at:
-        # Calculate from last payment
-        next_month = last_paid_at + relativedelta(months=1)
-        last_day = calendar.monthrange(next_month.year, next_month.month)[1]
-        return next_month.replace(day=min(safe_due_day, last_day))
+        # Calculate from last payment: the first occurrence after the paid cycle.
+        # Month-based schedules stay pinned to due_day; day-based ones step from the payment.
+        paid_cycle = last_paid_at
+        if RecurrenceRule.from_frequency(frequency, last_paid_at).step_months:
+            last_day = calendar.monthrange(last_paid_at.year, last_paid_at.month)[1]
+            paid_cycle = last_paid_at.replace(day=min(safe_due_day, last_day))
+        rule = RecurrenceRule.from_frequency(frequency, paid_cycle, day_of_month=safe_due_day)
+        next_due = rule.next_occurrence(paid_cycle + timedelta(days=1))
+        return paid_cycle.replace(year=next_due.year, month=next_due.month, day=next_due.day)
     else:
-        # First time - use this month or next
+        # First time - use this month or the next occurrence of the schedule
         last_day_this_month = calendar.monthrange(today.year, today.month)[1]
-        next_due = today.replace(day=min(safe_due_day, last_day_this_month))
-        
-        if next_due < today:
-            next_month = today + relativedelta(months=1)
-            last_day_next_month = calendar.monthrange(next_month.year, next_month.month)[1]
-            next_due = next_month.replace(day=min(safe_due_day, last_day_next_month))
-        
-        return next_due
+        anchor = today.replace(day=min(safe_due_day, last_day_this_month))
+        rule = RecurrenceRule.from_frequency(frequency, anchor, day_of_month=safe_due_day)
+        next_due = rule.next_occurrence(today)
+        return today.replace(year=next_due.year, month=next_due.month, day=next_due.day)
 
 async def create_pending_transaction_and_notification(
     db, user_id: str, bill_id: str = None, subscription_id: str = None,
@@ -106,7 +109,7 @@ async def process_bills():
                 continue
 
             # Calculate next due date
-            next_due = calculate_next_due_date(bill.due_day, bill.last_paid_at)
+            next_due = calculate_next_due_date(bill.due_day, bill.last_paid_at, bill.frequency)
             
             # Create pending transaction 3 days before
             reminder_date = next_due - timedelta(days=3)
@@ -137,8 +140,10 @@ async def process_subscriptions():
                 next_due = sub.next_billing_date
             else:
                 # Initialize next billing date
-                next_due = datetime.utcnow() + timedelta(days=30 if sub.billing_cycle == "monthly" else 365)
+                now = datetime.utcnow()
+                next_due = add_interval(now, sub.billing_cycle)
                 sub.next_billing_date = next_due
+                sub.billing_day = now.day
                 db.add(sub)
                 await db.commit()
             
@@ -163,7 +168,7 @@ def check_and_create_pending_bills():
     Creates pending transactions and notifications for upcoming payments.
     Also executes Autopilot payments for due bills.
     """
-async def run_all_tasks():
+    async def run_all_tasks():
         await process_bills()
 
         from app.services.autopilot import AutopilotService
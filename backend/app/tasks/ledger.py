@@ -0,0 +1,41 @@
+"""
+Celery task that checks the materialized ledger (``user_balances`` /
+``ledger_daily_net``) against ``transactions`` and rebuilds drifted users.
+
+Writes keep the tables in step transactionally; this is the safety net for
+rows changed outside the application (manual SQL, restores, bulk imports).
+"""
+
+import asyncio
+import logging
+
+from celery import shared_task
+
+from app.core.database import AsyncSessionLocal
+from app.services.ledger import LedgerService
+
+logger = logging.getLogger(__name__)
+
+
+async def verify_and_repair() -> int:
+    async with AsyncSessionLocal() as db:
+        drift = await LedgerService.find_drift(db)
+        for entry in drift:
+            logger.warning(
+                "Ledger drift for user %s: stored %s, expected %s (%s day(s) off)",
+                entry["user_id"],
+                entry["stored_balance"],
+                entry["expected_balance"],
+                entry["days_off"],
+            )
+        if drift:
+            await LedgerService.rebuild(db, [entry["user_id"] for entry in drift])
+            await db.commit()
+        return len(drift)
+
+
+@shared_task(name='app.tasks.ledger.verify_ledger_balances')
+def verify_ledger_balances():
+    """Nightly consistency check; rebuilds the ledger rows of drifted users."""
+    repaired = asyncio.run(verify_and_repair())
+    return f"Ledger check completed ({repaired} user(s) rebuilt)"
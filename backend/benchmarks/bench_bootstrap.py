@@ -0,0 +1,142 @@
+"""
+Dashboard first-load: N separate calls vs. GET /dashboard/bootstrap.
+
+Seeds one workload user (see ``benchmarks.workload``), then repeatedly times
+the sequence of requests the web app issues on login (summary, triage,
+timeline, safe-to-spend, notifications and five list endpoints) against the
+single bootstrap call. Reports median/min wall time and SQL statements per
+page load. Runs in-process through ``httpx.ASGITransport`` with the rate
+limiter and the response cache disabled, so every call does full work.
+
+Usage (from backend/):
+    python -m benchmarks.bench_bootstrap [--transactions 2000] [--rounds 20]
+        [--database-url sqlite+aiosqlite:///./bootstrap_bench.db]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+from sqlalchemy import event
+
+from benchmarks.workload import LOAD_TEST_PASSWORD, WorkloadSpec, seed
+
+API = "/api/v1"
+
+SEPARATE_CALLS = [
+    "/dashboard/summary",
+    "/dashboard/triage",
+    "/autopilot/timeline",
+    "/autopilot/safe-to-spend-daily",
+    "/notifications/",
+    "/categories/",
+    "/bills/",
+    "/subscriptions/",
+    "/goals/",
+    "/income/",
+]
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.core.cache import get_response_cache
+    from app.core.config import settings
+    from app.core.database import engine_options, get_db
+    from app.core.middleware import limiter
+    from app.main import app
+
+    engine = create_async_engine(args.database_url, **engine_options(args.database_url))
+    spec = WorkloadSpec(users=1, transactions_per_user=args.transactions, seed=args.seed)
+    await seed(engine, spec, create_schema=True)
+
+    statements = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def bench_get_db():
+        async with SessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = bench_get_db
+    limiter.enabled = False
+    settings.RESPONSE_CACHE_BACKEND = "none"
+    get_response_cache.cache_clear()
+
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            login = await client.post(
+                f"{API}/auth/login", data={"username": spec.email(0), "password": LOAD_TEST_PASSWORD}
+            )
+            login.raise_for_status()
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+            async def separate() -> None:
+                for path in SEPARATE_CALLS:
+                    (await client.get(API + path, headers=headers)).raise_for_status()
+
+            async def bootstrap() -> None:
+                (await client.get(f"{API}/dashboard/bootstrap", headers=headers)).raise_for_status()
+
+            for name, page_load in (("separate_calls", separate), ("bootstrap", bootstrap)):
+                await page_load()  # warm-up (also syncs payment orders once)
+                samples: List[float] = []
+                statements = 0
+                for _ in range(args.rounds):
+                    began = time.perf_counter()
+                    await page_load()
+                    samples.append(time.perf_counter() - began)
+                results[name] = {
+                    "requests": len(SEPARATE_CALLS) if name == "separate_calls" else 1,
+                    "median_ms": statistics.median(samples) * 1000,
+                    "min_ms": min(samples) * 1000,
+                    "statements": statements / args.rounds,
+                }
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=2000, help="ledger size of the benchmark user")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", default=None, help="defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    temp_dir = None
+    if args.database_url is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        args.database_url = f"sqlite+aiosqlite:///{os.path.join(temp_dir.name, 'bootstrap.db')}"
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    print(f"{'page load':<16} {'requests':>8} {'median ms':>10} {'min ms':>9} {'SQL stmts':>10}")
+    for name, stats in results.items():
+        print(
+            f"{name:<16} {stats['requests']:>8} {stats['median_ms']:>10.2f} "
+            f"{stats['min_ms']:>9.2f} {stats['statements']:>10.1f}"
+        )
+    speedup = results["separate_calls"]["median_ms"] / results["bootstrap"]["median_ms"]
+    print(f"bootstrap is {speedup:.2f}x faster than the separate-call sequence")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark cold start: process spawn to first successful request.
+
+Starts ``uvicorn app.main:app`` in a fresh process for each run and polls until
+``/health/live`` and then ``/health/ready`` answer 200, reporting both times.
+Uses the DATABASE_URL / .env of the current environment.
+
+``--schema`` additionally times the startup schema step in-process: the old
+``Base.metadata.create_all`` against the cached Alembic revision check.
+
+Usage (from backend/):
+    python -m benchmarks.bench_cold_start [--runs 5] [--port 8765] [--live-only] [--schema]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+def _wait_for(client: httpx.Client, url: str, began: float, deadline: float) -> float:
+    while time.perf_counter() < deadline:
+        try:
+            if client.get(url).status_code == 200:
+                return time.perf_counter() - began
+        except httpx.TransportError:
+            pass
+        time.sleep(0.005)
+    raise TimeoutError(f"{url} did not become healthy")
+
+
+def measure_once(port: int, timeout: float, live_only: bool) -> tuple[float, float | None]:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    began = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(timeout=1.0) as client:
+            deadline = began + timeout
+            live = _wait_for(client, f"http://127.0.0.1:{port}/health/live", began, deadline)
+            ready = None if live_only else _wait_for(
+                client, f"http://127.0.0.1:{port}/health/ready", began, deadline
+            )
+    finally:
+        process.terminate()
+        process.wait()
+    return live, ready
+
+
+async def measure_schema_step(runs: int) -> None:
+    from app.core.database import Base, engine
+    from app.core.schema import ensure_schema, reset_schema_cache
+    import app.models  # noqa: F401  (register every table on Base.metadata)
+
+    create_all, revision_check = [], []
+    for _ in range(runs):
+        began = time.perf_counter()
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        create_all.append(time.perf_counter() - began)
+
+        reset_schema_cache()
+        began = time.perf_counter()
+        await ensure_schema(engine, auto_create=False)
+        revision_check.append(time.perf_counter() - began)
+    await engine.dispose()
+
+    print(f"schema step  create_all     median {statistics.median(create_all) * 1000:8.1f} ms")
+    print(f"schema step  revision check median {statistics.median(revision_check) * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--live-only", action="store_true", help="skip /health/ready (no database needed)")
+    parser.add_argument("--schema", action="store_true", help="also time create_all vs revision check")
+    args = parser.parse_args()
+
+    samples = [measure_once(args.port, args.timeout, args.live_only) for _ in range(args.runs)]
+    live = [sample[0] for sample in samples]
+    print(f"runs={args.runs}")
+    print(f"first /health/live   median {statistics.median(live) * 1000:8.1f} ms  min {min(live) * 1000:8.1f} ms")
+    if not args.live_only:
+        ready = [sample[1] for sample in samples]
+        print(f"first /health/ready  median {statistics.median(ready) * 1000:8.1f} ms  min {min(ready) * 1000:8.1f} ms")
+
+    if args.schema:
+        asyncio.run(measure_schema_step(args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+CPU vs. bytes trade-off of response compression on typical payloads.
+
+Payloads are serialized exactly as the API sends them, from the in-memory
+dataset of ``bench_services``:
+
+  timeline_365        /autopilot/timeline?days_past=90&days_future=365
+  transactions_100    /transactions/ default page (100 rows)
+  transactions_1000   /transactions/?limit=1000
+  categories          /categories/ (typically below COMPRESSION_MINIMUM_SIZE)
+
+Each payload is compressed with gzip levels 1/6/9 and brotli qualities 1/4/11
+(the middleware defaults are gzip 6 and brotli 4); the table reports the
+compressed size, ratio, time per response and throughput. Brotli 11 is
+included as the offline ceiling and takes seconds on the timeline payload.
+
+Usage (from backend/):
+    python -m benchmarks.bench_compression [--size 10000] [--min-time 0.3] [--json compression.json]
+"""
+
+import argparse
+import json
+import zlib
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from app.api.v1.transactions import transaction_list_adapter
+from app.core.compression import _Compressor, brotli
+from app.core.responses import ORJSONResponse
+from app.schemas.budget import CategoryResponse
+from app.services.autopilot import AutopilotService
+from benchmarks.bench_services import NOW, Dataset, benchmark, build_dataset
+
+category_list_adapter = TypeAdapter(List[CategoryResponse])
+
+
+def timeline_payload(data: Dataset) -> bytes:
+    goals = data.goals[: max(1, data.size // 100)]
+    timeline = AutopilotService.build_timeline(
+        now=NOW,
+        start_date=NOW - timedelta(days=90),
+        end_date=NOW + timedelta(days=365),
+        categories=data.categories,
+        payment_orders=data.payment_orders,
+        transactions=data.transactions,
+        current_balance=Decimal("125000"),
+        bills=data.bills,
+        subscriptions=data.subscriptions,
+        goals=goals,
+        income_sources=data.incomes,
+    )
+    return ORJSONResponse(timeline).body
+
+
+def transactions_payload(data: Dataset, limit: int) -> bytes:
+    page = sorted(data.transactions, key=lambda t: t.occurred_at, reverse=True)[:limit]
+    return transaction_list_adapter.dump_json(transaction_list_adapter.validate_python(page, from_attributes=True))
+
+
+def categories_payload(data: Dataset) -> bytes:
+    owner = data.transactions[0].user_id
+    categories = [category for category in data.categories if category.user_id == owner]
+    return category_list_adapter.dump_json(category_list_adapter.validate_python(categories, from_attributes=True))
+
+
+PAYLOADS: Dict[str, Callable[[Dataset], bytes]] = {
+    "timeline_365": timeline_payload,
+    "transactions_100": lambda data: transactions_payload(data, 100),
+    "transactions_1000": lambda data: transactions_payload(data, 1000),
+    "categories": categories_payload,
+}
+
+CODECS = [("gzip", 1), ("gzip", 6), ("gzip", 9), ("br", 1), ("br", 4), ("br", 11)]
+
+
+def compress(encoding: str, level: int, payload: bytes) -> bytes:
+    gzip_level = level if encoding == "gzip" else zlib.Z_DEFAULT_COMPRESSION
+    return _Compressor(encoding, gzip_level, brotli_quality=level).compress(payload, final=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=10000, help="transactions in the dataset")
+    parser.add_argument("--min-time", type=float, default=0.3, help="seconds of timing per payload and codec")
+    parser.add_argument("--json", default=None, help="write results here")
+    args = parser.parse_args()
+
+    codecs = [codec for codec in CODECS if codec[0] == "gzip" or brotli is not None]
+    if len(codecs) < len(CODECS):
+        print("brotli is not installed; measuring gzip only")
+
+    data = build_dataset(args.size)
+    results: List[Dict[str, Any]] = []
+    print(f"{'payload':<18} {'codec':<8} {'bytes':>10} {'encoded':>10} {'ratio':>7} {'median ms':>10} {'MB/s':>8}")
+    for name, build in PAYLOADS.items():
+        payload = build(data)
+        print(f"{name:<18} {'identity':<8} {len(payload):>10} {len(payload):>10} {1.0:>7.2f} {0.0:>10.3f} {'-':>8}")
+        for encoding, level in codecs:
+            encoded = compress(encoding, level, payload)
+            timing = benchmark(lambda: compress(encoding, level, payload), args.min_time)
+            ratio = len(payload) / len(encoded)
+            throughput = len(payload) / 1e6 / (timing["median_ms"] / 1000)
+            codec = f"{encoding}-{level}"
+            results.append(
+                {"payload": name, "codec": codec, "bytes": len(payload), "encoded": len(encoded), "ratio": ratio, **timing}
+            )
+            print(
+                f"{name:<18} {codec:<8} {len(payload):>10} {len(encoded):>10} {ratio:>7.2f} "
+                f"{timing['median_ms']:>10.3f} {throughput:>8.1f}"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z", "results": results}, handle, indent=2)
+        print(f"results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
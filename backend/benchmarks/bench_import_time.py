@@ -0,0 +1,85 @@
+"""
+Benchmark import time of the ASGI app (the bulk of a worker's cold start).
+
+Runs ``python -X importtime -c "import app.main"`` in fresh interpreters,
+reports the median cumulative import time of ``app.main``, the number of
+modules loaded and the heaviest top-level packages from the last run.
+``--max-ms`` / ``--max-modules`` turn it into a check that exits non-zero when
+the budget is exceeded; the module count is the stable number to gate on,
+wall time is noisy on shared runners.
+
+Sentry, python-json-logger and Celery are only imported when they are used
+(SENTRY_DSN set, ENVIRONMENT=production, worker process). Target: keep the
+web worker under 900 modules. Lazy Sentry alone took ``app.main`` from 1096
+to 871 modules and removed the ~200 ms sentry_sdk -> httpcore -> trio chain.
+
+Usage (from backend/):
+    python -m benchmarks.bench_import_time [--runs 7] [--top 15] [--max-ms 1100] [--max-modules 900]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+TARGET = "app.main"
+
+
+def _run_once() -> tuple[int, int, dict[str, int]]:
+    env = dict(os.environ)
+    env.setdefault("SECRET_KEY", "import-time-benchmark")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    module_count = 0
+    packages: dict[str, int] = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        module_count += 1
+        if module == TARGET:
+            total_us = int(cumulative_us)
+        packages[module.split(".")[0]] += int(self_us)
+    return total_us, module_count, packages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if the median exceeds this")
+    parser.add_argument("--max-modules", type=int, default=None, help="fail if more modules are imported")
+    args = parser.parse_args()
+
+    totals = []
+    module_count = 0
+    packages: dict[str, int] = {}
+    for _ in range(args.runs):
+        total_us, module_count, packages = _run_once()
+        totals.append(total_us / 1000)
+
+    median_ms = statistics.median(totals)
+    print(f"{TARGET} import: median {median_ms:8.1f} ms  min {min(totals):8.1f} ms  ({args.runs} runs, {module_count} modules)")
+    print("heaviest packages (self time, last run):")
+    for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {package:<28} {self_us / 1000:8.1f} ms")
+
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"FAIL: median {median_ms:.1f} ms exceeds budget {args.max_ms:.1f} ms")
+        sys.exit(1)
+    if args.max_modules is not None and module_count > args.max_modules:
+        print(f"FAIL: {module_count} modules imported, budget is {args.max_modules}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+End-to-end load harness for the main API flows.
+
+Each virtual user logs in as one of the seeded workload users (see
+``benchmarks.workload``) and then loops over a weighted mix of dashboard
+summary, timeline, triage, transaction list and transaction create requests.
+Results (throughput, error count and p50/p90/p95/p99 latency per flow) are
+printed and written as JSON for comparison across commits.
+
+Targets:
+  * in-process (default): drives the ASGI app through ``httpx.ASGITransport``
+    against ``--database-url``; the rate limiter is disabled for the run.
+  * ``--base-url http://127.0.0.1:8000``: a running server seeded with the
+    same workload (raise RATE_LIMIT_LOGIN there, every user logs in once).
+
+Usage (from backend/):
+    python -m benchmarks.workload --users 20 --transactions 2000 \\
+        --database-url sqlite+aiosqlite:///./loadtest.db --create-schema
+    python -m benchmarks.bench_load --users 20 --concurrency 20 --duration 30 \\
+        --database-url sqlite+aiosqlite:///./loadtest.db --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List
+
+import httpx
+
+from benchmarks.workload import LOAD_TEST_PASSWORD, WorkloadSpec
+
+API = "/api/v1"
+
+# (name, weight); weights approximate what the web app issues per page view.
+FLOWS = [
+    ("dashboard_summary", 4),
+    ("timeline", 2),
+    ("triage", 1),
+    ("transactions_list", 3),
+    ("transaction_create", 1),
+]
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    position = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[position]
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, flow: str, seconds: float, ok: bool) -> None:
+        self.latencies[flow].append(seconds)
+        if not ok:
+            self.errors[flow] += 1
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        flows = {}
+        total = 0
+        for flow, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            total += len(ordered)
+            flows[flow] = {
+                "requests": len(ordered),
+                "errors": self.errors.get(flow, 0),
+                "rps": round(len(ordered) / elapsed, 2),
+                **{
+                    f"p{int(q * 100)}_ms": round(percentile(ordered, q) * 1000, 2)
+                    for q in (0.5, 0.9, 0.95, 0.99)
+                },
+                "max_ms": round(ordered[-1] * 1000, 2),
+            }
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "rps": round(total / elapsed, 2) if elapsed else 0.0,
+            "flows": flows,
+        }
+
+
+async def _timed(recorder: Recorder, flow: str, request) -> httpx.Response | None:
+    began = time.perf_counter()
+    try:
+        response = await request
+    except httpx.HTTPError:
+        recorder.record(flow, time.perf_counter() - began, ok=False)
+        return None
+    recorder.record(flow, time.perf_counter() - began, ok=response.status_code < 400)
+    return response
+
+
+async def virtual_user(
+    client: httpx.AsyncClient,
+    email: str,
+    recorder: Recorder,
+    deadline: float,
+    max_requests: int | None,
+    rng: random.Random,
+) -> None:
+    response = await _timed(
+        recorder,
+        "login",
+        client.post(f"{API}/auth/login", data={"username": email, "password": LOAD_TEST_PASSWORD}),
+    )
+    if response is None or response.status_code != 200:
+        return
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    names = [name for name, _ in FLOWS]
+    weights = [weight for _, weight in FLOWS]
+
+    issued = 0
+    while time.perf_counter() < deadline and (max_requests is None or issued < max_requests):
+        flow = rng.choices(names, weights)[0]
+        if flow == "dashboard_summary":
+            request = client.get(f"{API}/dashboard/summary", headers=headers)
+        elif flow == "timeline":
+            request = client.get(f"{API}/autopilot/timeline", headers=headers)
+        elif flow == "triage":
+            request = client.get(f"{API}/dashboard/triage", headers=headers)
+        elif flow == "transactions_list":
+            request = client.get(f"{API}/transactions/", params={"limit": 100}, headers=headers)
+        else:
+            request = client.post(
+                f"{API}/transactions/",
+                json={
+                    "amount": round(rng.uniform(50, 2000), 2),
+                    "type": "EXPENSE",
+                    "description": f"Load test purchase {rng.randint(1, 10_000)}",
+                    "occurred_at": datetime.utcnow().isoformat(),
+                },
+                headers=headers,
+            )
+        await _timed(recorder, flow, request)
+        issued += 1
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    spec = WorkloadSpec(users=args.users, seed=args.seed)
+    recorder = Recorder()
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+        cleanup = client.aclose
+    else:
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from sqlalchemy.orm import sessionmaker
+
+        from app.core.database import engine_options, get_db
+        from app.core.middleware import limiter
+        from app.main import app
+
+        engine = create_async_engine(args.database_url, **engine_options(args.database_url))
+        SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def load_test_get_db():
+            async with SessionLocal() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = load_test_get_db
+        limiter.enabled = False
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=args.timeout
+        )
+
+        async def cleanup() -> None:
+            await client.aclose()
+            await engine.dispose()
+
+    began = time.perf_counter()
+    deadline = began + args.duration
+    try:
+        await asyncio.gather(
+            *(
+                virtual_user(
+                    client,
+                    spec.email(worker % args.users),
+                    recorder,
+                    deadline,
+                    args.requests,
+                    random.Random(args.seed + worker),
+                )
+                for worker in range(args.concurrency)
+            )
+        )
+    finally:
+        await cleanup()
+    elapsed = time.perf_counter() - began
+
+    return {
+        "meta": {
+            "git_revision": _git_revision(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "target": args.base_url or f"asgi:{args.database_url}",
+            "users": args.users,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "requests_per_user": args.requests,
+            "seed": args.seed,
+        },
+        **recorder.summary(elapsed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10, help="seeded users to log in as")
+    parser.add_argument("--seed", type=int, default=42, help="seed used by benchmarks.workload")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds")
+    parser.add_argument("--requests", type=int, default=None, help="stop each virtual user after N requests")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("LOADTEST_DATABASE_URL", "sqlite+aiosqlite:///./loadtest.db"),
+        help="database for in-process runs",
+    )
+    parser.add_argument("--output", default=None, help="write the JSON report here")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(f"{report['requests']} requests in {report['elapsed_s']}s: {report['rps']} req/s, {report['errors']} errors")
+    print(f"  {'flow':<20} {'reqs':>6} {'err':>5} {'p50':>8} {'p95':>8} {'p99':>8}  (ms)")
+    for flow, stats in report["flows"].items():
+        print(
+            f"  {flow:<20} {stats['requests']:>6} {stats['errors']:>5} "
+            f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
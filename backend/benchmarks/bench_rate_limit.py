@@ -0,0 +1,106 @@
+"""
+Per-request overhead of the API rate limit (``enforce_rate_limit``).
+
+Times the pieces a request pays for, on a synthetic request:
+
+  key_anonymous     client address lookup (no Authorization header)
+  key_bearer        access-token verification for the per-user key
+  check_<strategy>  key + one limit check, memory storage
+  redis_<strategy>  the same against Redis (one Lua script per check); only
+                    with ``--redis-url`` and a reachable server
+
+The budget is set high enough that no check is refused, so every round does
+the full work of an allowed request.
+
+Usage (from backend/):
+    python -m benchmarks.bench_rate_limit [--min-time 0.3] [--redis-url redis://localhost:6379/15]
+        [--json rate_limit.json]
+"""
+
+import argparse
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from starlette.requests import Request
+
+from app.core.middleware import create_limiter, rate_limit_key
+from app.services.auth_tokens import TokenService
+from benchmarks.bench_services import benchmark
+
+STRATEGIES = ("sliding-window-counter", "fixed-window", "moving-window")
+BUDGET = "1000000/minute"
+
+
+def make_request(headers: Dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/transactions/",
+            "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+            "client": ("203.0.113.7", 54321),
+        }
+    )
+
+
+def redis_available(url: str) -> bool:
+    import redis
+
+    try:
+        return bool(redis.from_url(url, socket_connect_timeout=0.5).ping())
+    except Exception:
+        return False
+
+
+def check(storage: str, strategy: str, request: Request, redis_url: Optional[str] = None) -> Callable[[], None]:
+    from app.core.config import settings
+
+    previous, settings.RATE_LIMIT_STRATEGY = settings.RATE_LIMIT_STRATEGY, strategy
+    try:
+        limiter = create_limiter(storage=storage, default_limit=BUDGET, redis_url=redis_url)
+    finally:
+        settings.RATE_LIMIT_STRATEGY = previous
+    limiter.reset()
+    return lambda: limiter._check_request_limit(request, None, True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-time", type=float, default=0.3, help="seconds of timing per case")
+    parser.add_argument("--redis-url", default=None, help="also measure Redis storage (the database is flushed of limiter keys)")
+    parser.add_argument("--json", default=None, help="write results here")
+    args = parser.parse_args()
+
+    anonymous = make_request({})
+    token = TokenService.access_token("bench-user", "bench@example.com", "bench-session")
+    authenticated = make_request({"Authorization": f"Bearer {token}"})
+
+    cases: Dict[str, Callable[[], Any]] = {
+        "key_anonymous": lambda: rate_limit_key(anonymous),
+        "key_bearer": lambda: rate_limit_key(authenticated),
+    }
+    for strategy in STRATEGIES:
+        cases[f"check_{strategy}"] = check("memory", strategy, authenticated)
+    if args.redis_url:
+        if redis_available(args.redis_url):
+            for strategy in STRATEGIES:
+                cases[f"redis_{strategy}"] = check("redis", strategy, authenticated, args.redis_url)
+        else:
+            print(f"Redis at {args.redis_url} is unreachable; measuring memory storage only")
+
+    results: List[Dict[str, Any]] = []
+    print(f"{'case':<30} {'rounds':>7} {'median us':>10} {'min us':>10}")
+    for name, fn in cases.items():
+        timing = benchmark(fn, args.min_time)
+        results.append({"case": name, **timing})
+        print(f"{name:<30} {timing['rounds']:>7} {timing['median_ms'] * 1000:>10.1f} {timing['min_ms'] * 1000:>10.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z", "results": results}, handle, indent=2)
+        print(f"results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark response serialization on large payloads.
+
+Transactions list (10k ORM rows through ``List[TransactionResponse]``):
+  legacy     validate, ``jsonable_encoder``, stdlib json (pre dump_json FastAPI)
+  python     validate, ``dump_python(mode="json")``, stdlib json
+  validated  validate once, ``dump_json`` in pydantic-core (what the endpoint returns)
+
+Timeline-shaped payload (10k event dicts, the ``list[dict]`` response model):
+  legacy     model validate, ``jsonable_encoder``, stdlib json
+  pydantic   model validate, ``dump_json``
+  orjson     ``ORJSONResponse`` straight from the service dict
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.responses import ORJSONResponse, validated_json_response
+from app.models.transaction import Transaction
+from app.schemas.transaction import TransactionResponse
+
+
+class _TimelinePayload(BaseModel):
+    events: list[dict]
+    today: str
+    summary: dict
+
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> tuple[float, int]:
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        began = time.perf_counter()
+        body = fn()
+        best = min(best, time.perf_counter() - began)
+        size = len(body)
+    return best, size
+
+
+def _report(title: str, results: dict[str, tuple[float, int]]) -> None:
+    print(title)
+    for name, (seconds, size) in results.items():
+        print(f"  {name:<10} {seconds * 1000:8.1f} ms  {size / 1024:8.0f} KiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    start = datetime(2026, 1, 1)
+    transactions = [
+        Transaction(
+            id=f"txn-{index}",
+            user_id="user-1",
+            amount=Decimal("12.34") + index,
+            type="EXPENSE" if index % 4 else "INCOME",
+            description=f"Merchant {index % 250}",
+            occurred_at=start + timedelta(minutes=index),
+            created_at=start,
+        )
+        for index in range(args.rows)
+    ]
+    adapter = TypeAdapter(List[TransactionResponse])
+
+    _report(
+        f"transactions list ({args.rows} rows)",
+        {
+            "legacy": _best_of(
+                args.repeat,
+                lambda: JSONResponse(jsonable_encoder(adapter.validate_python(transactions, from_attributes=True))).body,
+            ),
+            "python": _best_of(
+                args.repeat,
+                lambda: JSONResponse(
+                    adapter.dump_python(adapter.validate_python(transactions, from_attributes=True), mode="json")
+                ).body,
+            ),
+            "validated": _best_of(args.repeat, lambda: validated_json_response(adapter, transactions).body),
+        },
+    )
+
+    timeline = {
+        "events": [
+            {
+                "date": (start + timedelta(days=index % 60)).date().isoformat(),
+                "type": "TRANSACTION",
+                "title": f"Merchant {index % 250}",
+                "amount": Decimal(index % 500) - Decimal("0.01"),
+                "is_automatic": False,
+                "is_completed": True,
+                "details": {"category": "Groceries", "transaction_type": "EXPENSE"},
+            }
+            for index in range(args.rows)
+        ],
+        "today": start.date().isoformat(),
+        "summary": {"current_balance": Decimal("1234.56"), "upcoming_commitments": 800.0},
+    }
+
+    _report(
+        f"timeline payload ({args.rows} events)",
+        {
+            "legacy": _best_of(
+                args.repeat, lambda: JSONResponse(jsonable_encoder(_TimelinePayload.model_validate(timeline))).body
+            ),
+            "pydantic": _best_of(args.repeat, lambda: _TimelinePayload.model_validate(timeline).model_dump_json()),
+            "orjson": _best_of(args.repeat, lambda: ORJSONResponse(timeline).body),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Micro-benchmarks for the pure service computations.
+
+Each case runs an in-memory computation over transient ORM objects built from
+the deterministic workload generator, at 1k/10k/100k transactions by default:
+
+  budget_overview     BudgetEngine.calculate_monthly_overview
+  health_score        dashboard month/category aggregation + HealthScoreService.calculate_score
+  goal_allocation     AutopilotService._allocate_goals_by_priority (n/10 goals)
+  salary_split        AutopilotService.build_salary_rule_split (n/100 bills, subs, goals, rules)
+  timeline            AutopilotService.build_timeline (n transactions in the window)
+  forecast            ForecastService.scheduled_flows + simulate (365 days x 5000 scenarios)
+
+Timing follows pytest-benchmark conventions (calibrated rounds, min/median/
+stddev); peak memory is measured separately with tracemalloc so it does not
+skew the timings. No database or network is needed.
+
+Usage (from backend/):
+    python -m benchmarks.bench_services [--sizes 1000,10000,100000] [--cases timeline,salary_split]
+        [--min-time 0.5] [--json services.json]
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from app.models import (
+    AutopilotPayment,
+    Bill,
+    BudgetCategory,
+    BudgetRule,
+    IncomeSource,
+    SavingsGoal,
+    Subscription,
+    Transaction,
+)
+from app.services.autopilot import AutopilotService
+from app.services.budget_engine import BudgetEngine
+from app.services.forecast import HISTORY_DAYS, ForecastService
+from app.services.health_score import HealthScoreService
+from benchmarks.workload import WorkloadSpec, generate_user_rows
+
+NOW = datetime(2026, 3, 15, 12, 0)
+
+
+@dataclass
+class Dataset:
+    size: int
+    transactions: List[Transaction]
+    incomes: List[IncomeSource]
+    categories: List[BudgetCategory]
+    rules: List[BudgetRule]
+    bills: List[Bill]
+    subscriptions: List[Subscription]
+    goals: List[SavingsGoal]
+    payment_orders: List[AutopilotPayment]
+
+
+def build_dataset(size: int, seed: int = 42) -> Dataset:
+    """``size`` transactions for one user; other entities scale with ``size``."""
+    fanout = max(1, size // 100)
+    rows: Dict[type, List[Dict[str, Any]]] = {}
+    for index in range(fanout):
+        per_user = generate_user_rows(
+            WorkloadSpec(users=fanout, transactions_per_user=size if index == 0 else 0, months=1, seed=seed),
+            index,
+            "bench",
+            NOW,
+        )
+        for model, model_rows in per_user.items():
+            if index and model is Transaction:
+                continue  # the ledger belongs to the first user only
+            rows.setdefault(model, []).extend(model_rows)
+
+    def objects(model: type) -> List[Any]:
+        return [model(**row) for row in rows.get(model, [])]
+
+    goals = objects(SavingsGoal)
+    # Goal allocation scales with n/10 goals; clone the generated ones.
+    while len(goals) < max(1, size // 10):
+        template = goals[len(goals) % max(1, len(goals))]
+        goals.append(
+            SavingsGoal(
+                id=f"goal-{len(goals)}",
+                user_id=template.user_id,
+                name=f"{template.name} {len(goals)}",
+                target_amount=template.target_amount,
+                current_amount=template.current_amount,
+                monthly_contribution=template.monthly_contribution,
+                priority=len(goals) % 10,
+                is_completed=False,
+            )
+        )
+
+    return Dataset(
+        size=size,
+        transactions=objects(Transaction),
+        incomes=objects(IncomeSource)[:1],
+        categories=objects(BudgetCategory),
+        rules=objects(BudgetRule),
+        bills=objects(Bill),
+        subscriptions=objects(Subscription),
+        goals=goals,
+        payment_orders=objects(AutopilotPayment),
+    )
+
+
+def case_budget_overview(data: Dataset) -> Callable[[], Any]:
+    return lambda: BudgetEngine.calculate_monthly_overview(
+        data.incomes, data.rules, data.transactions, NOW.year, NOW.month
+    )
+
+
+def case_health_score(data: Dataset) -> Callable[[], Any]:
+    category_names = {category.id: category.name for category in data.categories}
+    start_of_month = NOW.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    def run() -> Any:
+        monthly = [t for t in data.transactions if t.occurred_at >= start_of_month]
+        income = sum(t.amount for t in monthly if t.type == "INCOME")
+        expenses = sum(t.amount for t in monthly if t.type == "EXPENSE")
+        by_category: Dict[str, Decimal] = {}
+        for t in monthly:
+            if t.type == "EXPENSE":
+                key = str(t.category_id) if t.category_id else "Uncategorized"
+                by_category[key] = by_category.get(key, 0) + t.amount
+        chart = sorted(
+            ({"name": category_names.get(key, "Uncategorized"), "value": float(value)} for key, value in by_category.items()),
+            key=lambda item: item["value"],
+            reverse=True,
+        )
+        return HealthScoreService.calculate_score(income, expenses, 0, 0, top_categories=chart)
+
+    return run
+
+
+def case_goal_allocation(data: Dataset) -> Callable[[], Any]:
+    budget = sum((goal.monthly_contribution for goal in data.goals), Decimal("0")) / 2
+    return lambda: AutopilotService._allocate_goals_by_priority(data.goals, budget)
+
+
+def case_salary_split(data: Dataset) -> Callable[[], Any]:
+    income = sum((t.amount for t in data.transactions if t.type == "INCOME"), Decimal("0"))
+    goals = data.goals[: max(1, data.size // 100)]
+    return lambda: AutopilotService.build_salary_rule_split(
+        now=NOW,
+        income_sources=data.incomes,
+        monthly_income_from_transactions=income,
+        bills=data.bills,
+        subscriptions=data.subscriptions,
+        goals=goals,
+        budget_categories=data.categories,
+        budget_rules=data.rules,
+    )
+
+
+def case_timeline(data: Dataset) -> Callable[[], Any]:
+    goals = data.goals[: max(1, data.size // 100)]
+    return lambda: AutopilotService.build_timeline(
+        now=NOW,
+        start_date=NOW - timedelta(days=31),
+        end_date=NOW + timedelta(days=30),
+        categories=data.categories,
+        payment_orders=data.payment_orders,
+        transactions=data.transactions,
+        current_balance=Decimal("125000"),
+        bills=data.bills,
+        subscriptions=data.subscriptions,
+        goals=goals,
+        income_sources=data.incomes,
+    )
+
+
+def case_forecast(data: Dataset) -> Callable[[], Any]:
+    window_start = (NOW - timedelta(days=HISTORY_DAYS)).date()
+    history = [0.0] * HISTORY_DAYS
+    for t in data.transactions:
+        offset = (t.occurred_at.date() - window_start).days
+        if t.type == "EXPENSE" and 0 <= offset < HISTORY_DAYS and not (t.bill_id or t.subscription_id):
+            history[offset] += float(t.amount)
+    goals = data.goals[: max(1, data.size // 100)]
+
+    def run() -> Any:
+        scheduled = ForecastService.scheduled_flows(
+            now=NOW,
+            horizon_days=365,
+            income_sources=data.incomes,
+            bills=data.bills,
+            subscriptions=data.subscriptions,
+            goals=goals,
+        )
+        return ForecastService.simulate(
+            now=NOW,
+            current_balance=125000.0,
+            daily_spend_history=history,
+            scheduled_income=scheduled["income"],
+            scheduled_outflows=scheduled["outflows"],
+            scenarios=5000,
+        )
+
+    return run
+
+
+CASES: Dict[str, Callable[[Dataset], Callable[[], Any]]] = {
+    "budget_overview": case_budget_overview,
+    "health_score": case_health_score,
+    "goal_allocation": case_goal_allocation,
+    "salary_split": case_salary_split,
+    "timeline": case_timeline,
+    "forecast": case_forecast,
+}
+
+
+def benchmark(fn: Callable[[], Any], min_time: float, max_rounds: int = 1000) -> Dict[str, float]:
+    """Calibrated timing in the spirit of pytest-benchmark (gc disabled while timing)."""
+    fn()  # warm-up
+    samples: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        budget_end = time.perf_counter() + min_time
+        while len(samples) < max_rounds and (len(samples) < 3 or time.perf_counter() < budget_end):
+            began = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - began)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {
+        "rounds": len(samples),
+        "min_ms": min(samples) * 1000,
+        "median_ms": statistics.median(samples) * 1000,
+        "stddev_ms": (statistics.stdev(samples) if len(samples) > 1 else 0.0) * 1000,
+    }
+
+
+def peak_memory(fn: Callable[[], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds of timing per case and size")
+    parser.add_argument("--json", default=None, help="write results here")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    cases = [case for case in args.cases.split(",") if case]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    results: List[Dict[str, Any]] = []
+    print(f"{'case':<16} {'size':>8} {'rounds':>7} {'min ms':>10} {'median ms':>10} {'stddev':>9} {'peak KiB':>10}")
+    for size in sizes:
+        data = build_dataset(size)
+        for name in cases:
+            fn = CASES[name](data)
+            timing = benchmark(fn, args.min_time)
+            peak_kib = peak_memory(fn)
+            results.append({"case": name, "size": size, **timing, "peak_kib": peak_kib})
+            print(
+                f"{name:<16} {size:>8} {timing['rounds']:>7} {timing['min_ms']:>10.3f} "
+                f"{timing['median_ms']:>10.3f} {timing['stddev_ms']:>9.3f} {peak_kib:>10.1f}"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z", "results": results}, handle, indent=2)
+        print(f"results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
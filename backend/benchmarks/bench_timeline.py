@@ -0,0 +1,147 @@
+"""
+Timeline window: rebuilt from scratch vs. read from the event index.
+
+Seeds one workload user (see ``benchmarks.workload``) and times, per window
+size, the old read path (load every source row and run
+``AutopilotService.build_timeline``) against ``TimelineService.get_window``
+over the persisted index, both for the whole window and for one 50-event page.
+Reports median wall time per call and SQL statements per call.
+
+Usage (from backend/):
+    python -m benchmarks.bench_timeline [--transactions 5000] [--rounds 20]
+        [--database-url sqlite+aiosqlite:///./timeline_bench.db]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import event, select
+
+from benchmarks.workload import WorkloadSpec, seed
+
+WINDOWS = [(7, 30), (30, 365)]
+PAGE_SIZE = 50
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.core.database import engine_options
+    from app.models.autopilot_payment import AutopilotPayment
+    from app.models.bill import Bill
+    from app.models.budget import BudgetCategory
+    from app.models.income import IncomeSource
+    from app.models.savings import SavingsGoal
+    from app.models.subscription import Subscription
+    from app.models.transaction import Transaction
+    from app.models.user import User
+    from app.services.autopilot import AutopilotService
+    from app.services.ledger import LedgerService
+    from app.services.timeline import TimelineService
+
+    engine = create_async_engine(args.database_url, **engine_options(args.database_url))
+    spec = WorkloadSpec(users=1, transactions_per_user=args.transactions, seed=args.seed)
+    await seed(engine, spec, create_schema=True)
+
+    statements = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        async with SessionLocal() as session:
+            user_id = (await session.execute(select(User.id).where(User.email == spec.email(0)))).scalar_one()
+            await TimelineService.ensure_recurring(session, user_id)
+
+            async def rows(model, *criteria):
+                return (await session.execute(select(model).filter(model.user_id == user_id, *criteria))).scalars().all()
+
+            for days_past, days_future in WINDOWS:
+
+                async def rebuild() -> None:
+                    now = datetime.utcnow()
+                    start_date, end_date = now - timedelta(days=days_past), now + timedelta(days=days_future)
+                    AutopilotService.build_timeline(
+                        now=now,
+                        start_date=start_date,
+                        end_date=end_date,
+                        categories=await rows(BudgetCategory),
+                        payment_orders=await rows(
+                            AutopilotPayment,
+                            AutopilotPayment.due_on >= start_date.date(),
+                            AutopilotPayment.due_on <= end_date.date(),
+                        ),
+                        transactions=await rows(
+                            Transaction, Transaction.occurred_at >= start_date, Transaction.occurred_at <= now
+                        ),
+                        current_balance=await LedgerService.current_balance(session, user_id),
+                        bills=await rows(Bill),
+                        subscriptions=await rows(Subscription, Subscription.is_active == True),
+                        goals=await rows(SavingsGoal, SavingsGoal.is_completed == False),
+                        income_sources=await rows(IncomeSource, IncomeSource.active == True),
+                    )
+
+                async def window() -> None:
+                    await TimelineService.get_window(session, user_id, days_past=days_past, days_future=days_future)
+
+                async def page() -> None:
+                    await TimelineService.get_window(
+                        session, user_id, days_past=days_past, days_future=days_future, limit=PAGE_SIZE
+                    )
+
+                for name, call in (("rebuild", rebuild), ("index", window), (f"index page/{PAGE_SIZE}", page)):
+                    await call()  # warm-up
+                    samples: List[float] = []
+                    statements = 0
+                    for _ in range(args.rounds):
+                        session.expunge_all()
+                        began = time.perf_counter()
+                        await call()
+                        samples.append(time.perf_counter() - began)
+                    results[f"{days_past}d/{days_future}d {name}"] = {
+                        "median_ms": statistics.median(samples) * 1000,
+                        "min_ms": min(samples) * 1000,
+                        "statements": statements / args.rounds,
+                    }
+    finally:
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=5000, help="ledger size of the benchmark user")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", default=None, help="defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    temp_dir = None
+    if args.database_url is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        args.database_url = f"sqlite+aiosqlite:///{os.path.join(temp_dir.name, 'timeline.db')}"
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    print(f"{'case':<28} {'median ms':>10} {'min ms':>9} {'SQL stmts':>10}")
+    for name, stats in results.items():
+        print(f"{name:<28} {stats['median_ms']:>10.2f} {stats['min_ms']:>9.2f} {stats['statements']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,9 @@ async def setup_db():
     yield
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    # Each test runs on its own event loop; a fresh pool keeps the pool's
+    # wait queue from staying bound to a closed one.
+    await engine.dispose()
 
 @pytest.fixture
 async def client():
@@ -47,3 +47,113 @@ async def test_signup_flow(client: AsyncClient):
     assert me_response.status_code == 200
     me_data = me_response.json()
     assert me_data["email"] == email
+
+
+async def signup_tokens(client: AsyncClient, password: str = "password123") -> dict:
+    import time
+    email = f"tokens_{int(time.time() * 1000)}@example.com"
+    response = await client.post("/api/v1/auth/signup", json={"email": email, "password": password})
+    assert response.status_code == 201
+    return {"email": email, **response.json()}
+
+
+def bearer(tokens: dict) -> dict:
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens_rotate_and_replay_ends_session(client: AsyncClient):
+    first = await signup_tokens(client)
+    assert first["refresh_token"]
+    assert first["expires_in"] == settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert response.status_code == 200
+    second = response.json()
+    assert second["refresh_token"] != first["refresh_token"]
+    assert (await client.get("/api/v1/auth/me", headers=bearer(second))).json()["email"] == first["email"]
+
+    # Replaying a spent token fails and revokes its successor too.
+    replay = await client.post("/api/v1/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert replay.status_code == 401
+    after = await client.post("/api/v1/auth/refresh", json={"refresh_token": second["refresh_token"]})
+    assert after.status_code == 401
+
+    unknown = await client.post("/api/v1/auth/refresh", json={"refresh_token": "not-a-token"})
+    assert unknown.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_logout_and_password_change_revoke_tokens(client: AsyncClient):
+    session_a = await signup_tokens(client)
+    login = await client.post(
+        "/api/v1/auth/login", data={"username": session_a["email"], "password": "password123"}
+    )
+    session_b = login.json()
+    assert (await client.get("/api/v1/categories/", headers=bearer(session_b))).status_code == 200
+
+    # Password change from A ends every session, then hands A a new one.
+    changed = await client.post(
+        "/api/v1/users/me/password",
+        json={"old_password": "password123", "new_password": "password456"},
+        headers=bearer(session_a),
+    )
+    assert changed.status_code == 200
+    session_c = changed.json()
+    for old in (session_a, session_b):
+        assert (await client.get("/api/v1/categories/", headers=bearer(old))).status_code == 401
+        refreshed = await client.post("/api/v1/auth/refresh", json={"refresh_token": old["refresh_token"]})
+        assert refreshed.status_code == 401
+    assert (await client.get("/api/v1/categories/", headers=bearer(session_c))).status_code == 200
+
+    # Logout revokes the presented access token and the session's refresh token.
+    assert (await client.post("/api/v1/auth/logout", headers=bearer(session_c))).status_code == 200
+    assert (await client.get("/api/v1/auth/me", headers=bearer(session_c))).status_code == 401
+    refreshed = await client.post("/api/v1/auth/refresh", json={"refresh_token": session_c["refresh_token"]})
+    assert refreshed.status_code == 401
+
+
+class FakeRedis:
+    """Just the commands the revocation list uses, with expiry."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def set(self, key, value, ex=None):
+        import time
+        self.values[key] = (value, time.time() + ex if ex else None)
+
+    async def mget(self, keys):
+        import time
+        found = []
+        for key in keys:
+            value, expires = self.values.get(key, (None, None))
+            found.append(value if expires is None or expires > time.time() else None)
+        return found
+
+
+class BrokenRedis:
+    async def mget(self, keys):
+        raise ConnectionError("redis is down")
+
+
+@pytest.mark.asyncio
+async def test_redis_revocation_list():
+    import time
+    from app.core.revocation import RedisRevocationList
+
+    revoked = RedisRevocationList("redis://unused", client=FakeRedis())
+    now = time.time()
+    assert not await revoked.is_revoked("jti-1", "user-1", now)
+
+    await revoked.revoke_token("jti-1", now + 60)
+    assert await revoked.is_revoked("jti-1", "user-1", now)
+    assert not await revoked.is_revoked("jti-2", "user-1", now)
+
+    await revoked.revoke_user("user-1", now)
+    assert await revoked.is_revoked("jti-3", "user-1", now - 1)
+    assert not await revoked.is_revoked("jti-4", "user-1", now + 0.001)
+    assert not await revoked.is_revoked("jti-3", "user-2", now - 1)
+
+    # Lookup failures fail open; tokens are short-lived.
+    assert not await RedisRevocationList("redis://unused", client=BrokenRedis()).is_revoked("jti-1", "user-1", now)
@@ -1,4 +1,4 @@
-﻿from datetime import datetime
+﻿from datetime import datetime, timedelta
 import time
 
 import pytest
@@ -338,3 +338,98 @@ async def test_autopilot_payment_order_approval_and_execution(client: AsyncClien
     paid_bill = next((bill for bill in bills_res.json() if bill["id"] == bill_id), None)
     assert paid_bill is not None
     assert paid_bill["last_paid_at"] is not None
+
+
+def test_forecast_simulation_is_seeded_and_banded():
+    from app.services.forecast import ForecastService
+
+    now = datetime(2026, 3, 15, 12)
+    history = [((day * 37) % 11) * 6 for day in range(56)]  # ~29.5/day, varied per weekday
+    income = [0.0] * 60
+    outflows = [0.0] * 60
+    income[16] = 3000
+    outflows[25] = 900
+
+    def run(seed):
+        return ForecastService.simulate(
+            now=now,
+            current_balance=480,
+            daily_spend_history=history,
+            scheduled_income=income,
+            scheduled_outflows=outflows,
+            scenarios=400,
+            seed=seed,
+        )
+
+    forecast = run(7)
+    assert forecast == run(7)
+    assert forecast["dates"][0] == "2026-03-16" and len(forecast["dates"]) == 60
+    for day in range(60):
+        column = [forecast["bands"][f"p{p}"][day] for p in (5, 25, 50, 75, 95)]
+        assert column == sorted(column)
+    # 16 days to payday at ~29.5/day of spend: roughly half the paths dip below 0.
+    assert 0.2 < forecast["probability_below_zero"] < 0.8
+    assert forecast["bands"]["p50"][20] > forecast["bands"]["p50"][10] + 2000
+    assert forecast["model"]["history_days"] == 56
+
+    # The same draws from a history of only zero-spend days give flat paths.
+    quiet = ForecastService.simulate(
+        now=now,
+        current_balance=500,
+        daily_spend_history=[0] * 30,
+        scheduled_income=income,
+        scheduled_outflows=outflows,
+        scenarios=100,
+    )
+    assert quiet["end_balance"]["p5"] == quiet["end_balance"]["p95"] == 2600
+
+
+@pytest.mark.asyncio
+async def test_forecast_endpoint(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    income_res = await client.post(
+        "/api/v1/income/",
+        json={"amount": 3000, "frequency": "monthly", "payday": "1st", "active": True},
+        headers=headers,
+    )
+    assert income_res.status_code == 201
+    bill_res = await client.post(
+        "/api/v1/bills/",
+        json={"name": "Rent", "amount_estimated": 600, "due_day": 10, "autopay_enabled": False},
+        headers=headers,
+    )
+    assert bill_res.status_code == 201
+    for days_ago in range(1, 15):
+        expense_res = await client.post(
+            "/api/v1/transactions/",
+            json={
+                "amount": 10 * days_ago,
+                "type": "EXPENSE",
+                "description": "Coffee and lunch",
+                "occurred_at": (datetime.utcnow() - timedelta(days=days_ago)).isoformat(),
+            },
+            headers=headers,
+        )
+        assert expense_res.status_code == 201
+
+    response = await client.get(
+        "/api/v1/autopilot/forecast", params={"horizon_days": 120, "scenarios": 500}, headers=headers
+    )
+    assert response.status_code == 200
+    forecast = response.json()
+    assert forecast["horizon_days"] == 120 and len(forecast["bands"]["p50"]) == 120
+    assert forecast["current_balance"] == -1050.0
+    assert forecast["model"]["history_days"] == 14
+    assert forecast["model"]["scheduled_income"] == 12000.0
+    assert forecast["model"]["scheduled_outflows"] == 2400.0
+    assert forecast["end_balance"]["p5"] <= forecast["end_balance"]["p50"] <= forecast["end_balance"]["p95"]
+
+    repeat = await client.get(
+        "/api/v1/autopilot/forecast", params={"horizon_days": 120, "scenarios": 500}, headers=headers
+    )
+    assert repeat.json()["bands"] == forecast["bands"]
+
+    too_long = await client.get("/api/v1/autopilot/forecast", params={"horizon_days": 400}, headers=headers)
+    assert too_long.status_code == 422
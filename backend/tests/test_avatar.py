@@ -0,0 +1,116 @@
+import io
+import os
+import shutil
+import time
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from starlette.datastructures import Headers, UploadFile
+
+from app.core.config import settings
+from app.services.avatars import AVATAR_DIR, AVATAR_SIZES, AvatarService, AvatarTooLarge
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"avatar_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+def png_bytes(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 40, 90)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_avatar_renditions_are_content_addressed(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    upload = {"file": ("me.png", png_bytes(640, 480), "image/png")}
+
+    response = await client.post("/api/v1/users/me/avatar", files=upload, headers=headers)
+    assert response.status_code == 200
+    url = response.json()["avatar_url"]
+    key = url.split("/")[-2]
+    assert url == f"/static/avatars/{key}/{AVATAR_SIZES[0]}.webp"
+    try:
+        for size in AVATAR_SIZES:
+            with Image.open(os.path.join(AVATAR_DIR, key, f"{size}.webp")) as image:
+                assert image.format == "WEBP"
+                assert image.size == (size, size)
+
+        # Same picture, same URL; served as immutable.
+        again = await client.post("/api/v1/users/me/avatar", files=upload, headers=headers)
+        assert again.json()["avatar_url"] == url
+        served = await client.get(url)
+        assert served.status_code == 200
+        assert served.headers["content-type"] == "image/webp"
+        assert "immutable" in served.headers["cache-control"]
+    finally:
+        shutil.rmtree(os.path.join(AVATAR_DIR, key), ignore_errors=True)
+
+
+@pytest.mark.asyncio
+async def test_avatar_upload_rejections(client: AsyncClient, monkeypatch):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    before = set(os.listdir(AVATAR_DIR))
+
+    not_an_image = await client.post(
+        "/api/v1/users/me/avatar", files={"file": ("x.png", b"definitely not a png", "image/png")}, headers=headers
+    )
+    assert not_an_image.status_code == 400
+    wrong_type = await client.post(
+        "/api/v1/users/me/avatar", files={"file": ("x.txt", b"hello", "text/plain")}, headers=headers
+    )
+    assert wrong_type.status_code == 400
+
+    monkeypatch.setattr(settings, "AVATAR_MAX_BYTES", 1024)
+    # Within the multipart allowance: parsed, then refused by the exact cap.
+    too_large = await client.post(
+        "/api/v1/users/me/avatar", files={"file": ("big.png", os.urandom(4096), "image/png")}, headers=headers
+    )
+    assert too_large.status_code == 413
+    assert "too large" in too_large.json()["detail"]
+
+    # Well past it: refused on Content-Length before the body is read.
+    huge = await client.post(
+        "/api/v1/users/me/avatar", files={"file": ("huge.png", os.urandom(64 * 1024), "image/png")}, headers=headers
+    )
+    assert huge.status_code == 413
+
+    # No Content-Length (chunked): refused while the body arrives.
+    boundary = "avatarboundary"
+    head = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"huge.png\"\r\n"
+        "Content-Type: image/png\r\n\r\n"
+    ).encode()
+
+    async def chunked_body():
+        yield head
+        for _ in range(8):
+            yield os.urandom(8 * 1024)
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    chunked = await client.post(
+        "/api/v1/users/me/avatar",
+        content=chunked_body(),
+        headers={**headers, "Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+    assert chunked.status_code == 413
+
+    # Without a known size the service still enforces the exact cap.
+    unsized = UploadFile(io.BytesIO(os.urandom(4096)), headers=Headers({"content-type": "image/png"}))
+    with pytest.raises(AvatarTooLarge, match="too large"):
+        await AvatarService.store(unsized, max_bytes=1024)
+
+    # Nothing left behind, and the profile is unchanged.
+    assert set(os.listdir(AVATAR_DIR)) == before
+    assert (await client.get("/api/v1/users/me", headers=headers)).json()["avatar_url"] is None
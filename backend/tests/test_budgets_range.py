@@ -0,0 +1,75 @@
+import time
+
+import pytest
+from httpx import AsyncClient
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"budget_range_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_budget_summary_range_matrix_matches_monthly_summary(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    await client.post(
+        "/api/v1/income/",
+        json={"amount": 10000, "frequency": "monthly", "payday": "1", "active": True},
+        headers=headers,
+    )
+    food_id = (await client.post("/api/v1/categories/", json={"name": "Food"}, headers=headers)).json()["id"]
+    rent_id = (await client.post("/api/v1/categories/", json={"name": "Rent"}, headers=headers)).json()["id"]
+    await client.post(
+        "/api/v1/budgets/rules",
+        json={"category_id": food_id, "allocation_type": "PERCENT", "allocation_value": 20},
+        headers=headers,
+    )
+    await client.post(
+        "/api/v1/budgets/rules",
+        json={"category_id": rent_id, "allocation_type": "FIXED", "allocation_value": 4000},
+        headers=headers,
+    )
+
+    expenses = [
+        ("2025-12-31T23:00:00", food_id, 999),  # outside the range
+        ("2026-01-05T10:00:00", food_id, 300),
+        ("2026-01-20T10:00:00", food_id, 200.5),
+        ("2026-01-01T00:00:00", rent_id, 4000),
+        ("2026-03-15T10:00:00", None, 75),
+    ]
+    for occurred_at, category_id, amount in expenses:
+        response = await client.post(
+            "/api/v1/transactions/",
+            json={"amount": amount, "type": "EXPENSE", "category_id": category_id, "occurred_at": occurred_at},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    response = await client.get("/api/v1/budgets/summary/range", params={"from": "2026-01", "to": "2026-03"}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["months"] == ["2026-01", "2026-02", "2026-03"]
+    assert [category["name"] for category in data["categories"]] == ["Food", "Rent", "Uncategorized"]
+    assert data["allocated"] == [2000.0, 4000.0, 0.0]
+    assert data["spent"] == [[500.5, 4000.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 75.0]]
+    assert data["remaining"][0] == [1499.5, 0.0, 0.0]
+    assert data["remaining"][2][2] == -75.0
+    assert data["total_spent"] == [4500.5, 0.0, 75.0]
+
+    monthly = (await client.get("/api/v1/budgets/summary", params={"year": 2026, "month": 1}, headers=headers)).json()
+    assert float(monthly["total_spent"]) == data["total_spent"][0]
+    assert float(monthly["category_breakdown"][food_id]["spent"]) == data["spent"][0][0]
+
+    too_long = await client.get("/api/v1/budgets/summary/range", params={"from": "2024-01", "to": "2026-01"}, headers=headers)
+    assert too_long.status_code == 400
+    reversed_range = await client.get("/api/v1/budgets/summary/range", params={"from": "2026-02", "to": "2026-01"}, headers=headers)
+    assert reversed_range.status_code == 400
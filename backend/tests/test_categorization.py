@@ -0,0 +1,127 @@
+from datetime import datetime
+from decimal import Decimal
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from app.models.categorization_rule import CategorizationRule
+from app.services import categorization
+from app.services.categorization import AhoCorasick, CompiledRuleSet, regex_problem
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"rules_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+def test_aho_corasick_reports_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+
+    assert automaton.search("ushers") == {0, 1, 3}
+    assert automaton.search("nothing here") == {0}
+    assert automaton.search("xyz") == set()
+
+
+def test_rule_set_prefers_priority_then_amount_range():
+    created = datetime(2026, 1, 1)
+    rules = [
+        CategorizationRule(id="a", category_id="food", match_type="CONTAINS", pattern="Swiggy", priority=0, is_active=True, created_at=created),
+        CategorizationRule(id="b", category_id="treats", match_type="CONTAINS", pattern="swiggy", min_amount=Decimal("1000"), priority=5, is_active=True, created_at=created),
+        CategorizationRule(id="c", category_id="transport", match_type="REGEX", pattern=r"\b(uber|ola)\b", priority=0, is_active=True, created_at=created),
+        CategorizationRule(id="d", category_id="big", match_type="AMOUNT", min_amount=Decimal("50000"), priority=-1, is_active=True, created_at=created),
+        CategorizationRule(id="e", category_id="ignored", match_type="CONTAINS", pattern="uber", priority=10, is_active=False, created_at=created),
+    ]
+    rule_set = CompiledRuleSet(rules)
+
+    assert rule_set.match("SWIGGY order 123", Decimal("250")) == "food"
+    assert rule_set.match("Swiggy party order", Decimal("1500")) == "treats"
+    assert rule_set.match("Uber trip", Decimal("300")) == "transport"
+    assert rule_set.match("Ubering", Decimal("300")) is None
+    assert rule_set.match("Laptop", Decimal("80000")) == "big"
+    assert rule_set.match(None, Decimal("10")) is None
+
+
+@pytest.mark.asyncio
+async def test_rules_apply_on_create_and_recategorize(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    category = await client.post("/api/v1/categories/", json={"name": "Transport"}, headers=headers)
+    category_id = category.json()["id"]
+
+    old = await client.post(
+        "/api/v1/transactions/",
+        json={"amount": 250, "type": "EXPENSE", "description": "Uber to office"},
+        headers=headers,
+    )
+    assert old.json()["category_id"] is None
+
+    response = await client.post(
+        "/api/v1/categorization-rules/",
+        json={"category_id": category_id, "match_type": "REGEX", "pattern": "("},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+    response = await client.post(
+        "/api/v1/categorization-rules/",
+        json={"category_id": category_id, "pattern": "uber"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    rule_id = response.json()["id"]
+
+    new = await client.post(
+        "/api/v1/transactions/",
+        json={"amount": 180, "type": "EXPENSE", "description": "UBER airport"},
+        headers=headers,
+    )
+    assert new.json()["category_id"] == category_id
+
+    response = await client.post("/api/v1/transactions/recategorize", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"scanned": 1, "updated": 1, "by_category": {category_id: 1}}
+
+    transactions = (await client.get("/api/v1/transactions/", headers=headers)).json()
+    assert {item["category_id"] for item in transactions} == {category_id}
+
+    # Rule changes invalidate the cached matcher.
+    await client.put(f"/api/v1/categorization-rules/{rule_id}", json={"pattern": "lyft"}, headers=headers)
+    later = await client.post(
+        "/api/v1/transactions/",
+        json={"amount": 90, "type": "EXPENSE", "description": "Uber again"},
+        headers=headers,
+    )
+    assert later.json()["category_id"] is None
+
+
+def test_regex_rules_reject_catastrophic_backtracking():
+    for safe in (r"\b(uber|ola)\b", r"^amzn\s+mktp", r"swiggy.*order", r"\d{4,}"):
+        assert regex_problem(safe) is None, safe
+    for unsafe in (r"(a+)+$", r"(\w*)*x", r"(a|aa)*b", r"(x)\1", "a" * 101, r".*.*.*.*x", r"\w*\w*\w*\w*\w*!"):
+        assert regex_problem(unsafe), unsafe
+    assert regex_problem("(") == "Invalid regular expression"
+
+    # Rules stored before the check existed are skipped, not run.
+    rules = CompiledRuleSet(
+        [CategorizationRule(id="r", category_id="c", match_type="REGEX", pattern=r"(a+)+$", priority=0, is_active=True, created_at=datetime(2026, 1, 1))]
+    )
+    assert rules.match("a" * 40 + "!", Decimal("1")) is None
+
+
+def test_regex_rule_that_times_out_is_disabled(monkeypatch):
+    rules = CompiledRuleSet(
+        [CategorizationRule(id="r", category_id="c", match_type="REGEX", pattern=r"swiggy.*order", priority=0, is_active=True, created_at=datetime(2026, 1, 1))]
+    )
+    monkeypatch.setattr(categorization, "REGEX_TIMEOUT_SECONDS", 0.0)
+    assert rules.match("swiggy " + "x" * 200, Decimal("1")) is None
+    monkeypatch.undo()
+    # Disabled for the rest of this compiled set's life.
+    assert rules.match("swiggy order", Decimal("1")) is None
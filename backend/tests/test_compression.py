@@ -0,0 +1,112 @@
+import gzip
+import time
+
+import brotli
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import CompressionMiddleware, choose_encoding
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"compress_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+def test_choose_encoding_honours_quality_values():
+    assert choose_encoding("gzip, deflate, br") == "br"
+    assert choose_encoding("gzip, br;q=0") == "gzip"
+    assert choose_encoding("br;q=0.5, gzip;q=0.8") == "gzip"
+    assert choose_encoding("gzip, br", brotli_enabled=False) == "gzip"
+    assert choose_encoding("*") == "br"
+    assert choose_encoding("identity") is None
+    assert choose_encoding("") is None
+
+
+@pytest.mark.asyncio
+async def test_large_json_responses_are_compressed(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    for index in range(20):
+        response = await client.post(
+            "/api/v1/transactions/",
+            json={"amount": 100 + index, "type": "EXPENSE", "description": f"Groceries run {index}"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    plain = await client.get("/api/v1/transactions/", headers={**headers, "Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert len(plain.content) > 1024
+
+    for encoding, decode in (("gzip", gzip.decompress), ("br", brotli.decompress)):
+        async with client.stream(
+            "GET", "/api/v1/transactions/", headers={**headers, "Accept-Encoding": encoding}
+        ) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        assert response.headers["content-encoding"] == encoding
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) == len(raw) < len(plain.content)
+        assert decode(raw) == plain.content
+
+    small = await client.get("/api/v1/categories/", headers={**headers, "Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert "Accept-Encoding" in small.headers["vary"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_and_incompressible_bodies():
+    async def stream(request):
+        async def chunks():
+            for index in range(300):
+                yield f"line {index}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    async def png(request):
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    async def precompressed(request):
+        return PlainTextResponse("x" * 2000, headers={"Content-Encoding": "identity", "ETag": '"v1"'})
+
+    async def tagged(request):
+        return PlainTextResponse("x" * 2000, headers={"ETag": '"v1"'})
+
+    app = Starlette(
+        routes=[
+            Route("/stream", stream),
+            Route("/png", png),
+            Route("/precompressed", precompressed),
+            Route("/tagged", tagged),
+        ]
+    )
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        headers = {"Accept-Encoding": "gzip"}
+        async with client.stream("GET", "/stream", headers=headers) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        # Past the threshold the stream is compressed as it goes, without a length.
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(raw) == b"".join(f"line {index}\n".encode() for index in range(300))
+
+        image = await client.get("/png", headers=headers)
+        assert "content-encoding" not in image.headers
+
+        untouched = await client.get("/precompressed", headers=headers)
+        assert untouched.headers["content-encoding"] == "identity"
+        assert untouched.headers["etag"] == '"v1"'
+
+        weakened = await client.get("/tagged", headers=headers)
+        assert weakened.headers["content-encoding"] == "gzip"
+        assert weakened.headers["etag"] == 'W/"v1"'
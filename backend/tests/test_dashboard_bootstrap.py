@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+import time
+
+import pytest
+from httpx import AsyncClient
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"bootstrap_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_matches_individual_endpoints(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    now = datetime.utcnow()
+
+    await client.post("/api/v1/income/", json={"amount": 50000, "frequency": "monthly", "payday": "1"}, headers=headers)
+    category_id = (await client.post("/api/v1/categories/", json={"name": "Food"}, headers=headers)).json()["id"]
+    await client.post("/api/v1/bills/", json={"name": "Rent", "amount_estimated": 15000, "due_day": (now + timedelta(days=3)).day}, headers=headers)
+    await client.post("/api/v1/subscriptions/", json={"name": "Music", "amount": 199}, headers=headers)
+    await client.post("/api/v1/goals/", json={"name": "Trip", "target_amount": 60000, "monthly_contribution": 5000}, headers=headers)
+    for days_ago, amount, kind in [(0, 450, "EXPENSE"), (2, 1200, "EXPENSE"), (20, 50000, "INCOME")]:
+        await client.post(
+            "/api/v1/transactions/",
+            json={
+                "amount": amount,
+                "type": kind,
+                "category_id": category_id if kind == "EXPENSE" else None,
+                "description": f"{kind.title()} {days_ago}",
+                "occurred_at": (now - timedelta(days=days_ago)).isoformat(),
+            },
+            headers=headers,
+        )
+
+    response = await client.get("/api/v1/dashboard/bootstrap", headers=headers)
+    assert response.status_code == 200
+    bootstrap = response.json()
+
+    timeline = (await client.get("/api/v1/autopilot/timeline", headers=headers)).json()
+    assert bootstrap["timeline"] == timeline
+    assert bootstrap["summary"] == (await client.get("/api/v1/dashboard/summary", headers=headers)).json()
+    assert bootstrap["safe_to_spend_daily"] == (await client.get("/api/v1/autopilot/safe-to-spend-daily", headers=headers)).json()
+
+    triage = (await client.get("/api/v1/dashboard/triage", headers=headers)).json()
+    bootstrap["triage"].pop("generated_at")
+    triage.pop("generated_at")
+    assert bootstrap["triage"] == triage
+
+    for section, path in [
+        ("categories", "/api/v1/categories/"),
+        ("bills", "/api/v1/bills/"),
+        ("subscriptions", "/api/v1/subscriptions/"),
+        ("goals", "/api/v1/goals/"),
+        ("incomes", "/api/v1/income/"),
+        ("notifications", "/api/v1/notifications/"),
+    ]:
+        assert bootstrap[section] == (await client.get(path, headers=headers)).json(), section
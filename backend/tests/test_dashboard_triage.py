@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import time
 
 import pytest
@@ -80,6 +80,38 @@ async def test_dashboard_triage_returns_prioritized_actions(client: AsyncClient)
     )
     assert uncategorized_res.status_code == 201
 
+    # Outside the 30-day uncategorized window and the current month.
+    old_res = await client.post(
+        "/api/v1/transactions/",
+        json={
+            "amount": 30,
+            "type": "EXPENSE",
+            "description": "Old cash spend",
+            "occurred_at": (datetime.utcnow() - timedelta(days=45)).isoformat(),
+        },
+        headers=headers,
+    )
+    assert old_res.status_code == 201
+
+    pending_res = await client.post(
+        "/api/v1/transactions/",
+        json={
+            "amount": 15,
+            "type": "EXPENSE",
+            "description": "Card hold",
+            "category_id": category_id,
+            "occurred_at": occurred_at,
+        },
+        headers=headers,
+    )
+    assert pending_res.status_code == 201
+    hold_res = await client.patch(
+        "/api/v1/transactions/bulk",
+        json={"ids": [pending_res.json()["id"]], "status": "pending"},
+        headers=headers,
+    )
+    assert hold_res.status_code == 200
+
     bill_res = await client.post(
         "/api/v1/bills/",
         json={
@@ -99,7 +131,9 @@ async def test_dashboard_triage_returns_prioritized_actions(client: AsyncClient)
     assert isinstance(triage["stress_score"], int)
     assert triage["stress_level"] in {"low", "moderate", "high", "critical"}
     assert triage["monthly_income"] == "1000.00"
-    assert triage["monthly_expenses"] == "185.00"
+    assert triage["monthly_expenses"] == "200.00"
+    assert triage["pending_transaction_count"] == 1
+    assert triage["uncategorized_expense_count"] == 1
     assert len(triage["actions"]) > 0
 
     action_areas = {action["area"] for action in triage["actions"]}
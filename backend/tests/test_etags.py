@@ -0,0 +1,74 @@
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.database import get_db
+from app.main import app
+from app.models.notification import Notification
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"etag_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_support_conditional_get(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.post("/api/v1/categories/", json={"name": "Food"}, headers=headers)
+
+    first = await client.get("/api/v1/categories/", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    repeat = await client.get("/api/v1/categories/", headers={**headers, "If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["ETag"] == etag
+
+    weak = await client.get("/api/v1/categories/", headers={**headers, "If-None-Match": f'"other", W/{etag}'})
+    assert weak.status_code == 304
+
+    # ETags differ per collection and per query string.
+    bills = await client.get("/api/v1/bills/", headers={**headers, "If-None-Match": etag})
+    assert bills.status_code == 200
+    unread = await client.get("/api/v1/notifications/", params={"unread_only": True}, headers=headers)
+    everything = await client.get("/api/v1/notifications/", headers=headers)
+    assert unread.headers["ETag"] != everything.headers["ETag"]
+
+    # Any write changes the version, so the old ETag no longer matches.
+    await client.post("/api/v1/categories/", json={"name": "Travel"}, headers=headers)
+    changed = await client.get("/api/v1/categories/", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert {category["name"] for category in changed.json()} == {"Food", "Travel"}
+
+
+@pytest.mark.asyncio
+async def test_mark_all_read_invalidates_notification_etag(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+    async for session in app.dependency_overrides[get_db]():
+        session.add(Notification(user_id=user_id, title="Rent", message="Rent is due", type="bill_reminder"))
+        await session.commit()
+
+    unread = await client.get("/api/v1/notifications/", params={"unread_only": True}, headers=headers)
+    assert len(unread.json()) == 1
+    etag = unread.headers["ETag"]
+
+    assert (await client.post("/api/v1/notifications/mark-all-read", headers=headers)).status_code == 200
+    after = await client.get(
+        "/api/v1/notifications/", params={"unread_only": True}, headers={**headers, "If-None-Match": etag}
+    )
+    assert after.status_code == 200
+    assert after.json() == []
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.schema import ensure_schema, expected_revision, reset_schema_cache
+from app.main import app
+
+SCHEMA_DB_PATH = Path(__file__).resolve().parent / "test_money_manage_schema.db"
+
+
+@pytest.mark.asyncio
+async def test_liveness_and_readiness(client: AsyncClient):
+    live = await client.get("/health/live")
+    assert live.status_code == 200
+    assert live.json() == {"status": "ok"}
+
+    ready = await client.get("/health/ready")
+    assert ready.status_code == 200
+    assert ready.json()["database"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_readiness_reports_database_outage(client: AsyncClient):
+    class BrokenSession:
+        async def execute(self, *args, **kwargs):
+            raise ConnectionRefusedError("database is down")
+
+    async def broken_get_db():
+        yield BrokenSession()
+
+    previous = app.dependency_overrides[get_db]
+    app.dependency_overrides[get_db] = broken_get_db
+    try:
+        ready = await client.get("/health/ready")
+    finally:
+        app.dependency_overrides[get_db] = previous
+
+    assert ready.status_code == 503
+    assert ready.json()["status"] == "unavailable"
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_require_token(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(settings, "HEALTH_METRICS_TOKEN", None)
+    assert (await client.get("/health/db", headers={"X-Health-Token": ""})).status_code == 404
+
+    monkeypatch.setattr(settings, "HEALTH_METRICS_TOKEN", "s3cret")
+    assert (await client.get("/health/db")).status_code == 404
+    assert (await client.get("/health/db", headers={"X-Health-Token": "wrong"})).status_code == 404
+    response = await client.get("/health/db", headers={"X-Health-Token": "s3cret"})
+    assert response.status_code == 200
+    assert "primary" in response.json()
+
+
+@pytest.mark.asyncio
+async def test_schema_check_creates_stamps_and_caches():
+    SCHEMA_DB_PATH.unlink(missing_ok=True)
+    reset_schema_cache()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{SCHEMA_DB_PATH.as_posix()}")
+    try:
+        assert await ensure_schema(engine, auto_create=True) == "created"
+
+        async with engine.connect() as conn:
+            tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+            version = (await conn.exec_driver_sql("SELECT version_num FROM alembic_version")).scalar()
+        assert "transactions" in tables
+        assert version == expected_revision()
+
+        assert await ensure_schema(engine, auto_create=True) == "cached"
+        reset_schema_cache()
+        assert await ensure_schema(engine, auto_create=True) == "current"
+    finally:
+        reset_schema_cache()
+        await engine.dispose()
+        SCHEMA_DB_PATH.unlink(missing_ok=True)
+
+
+@pytest.mark.asyncio
+async def test_schema_check_leaves_unversioned_tables_to_migrations():
+    SCHEMA_DB_PATH.unlink(missing_ok=True)
+    reset_schema_cache()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{SCHEMA_DB_PATH.as_posix()}")
+    try:
+        # A database built by the old create-all startup: tables, no alembic_version.
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("CREATE TABLE users (id VARCHAR PRIMARY KEY, email VARCHAR)")
+
+        assert await ensure_schema(engine, auto_create=True) == "outdated"
+
+        async with engine.connect() as conn:
+            tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+        assert tables == ["users"]
+    finally:
+        reset_schema_cache()
+        await engine.dispose()
+        SCHEMA_DB_PATH.unlink(missing_ok=True)
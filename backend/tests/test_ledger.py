@@ -0,0 +1,101 @@
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.core.database import get_db
+from app.main import app
+from app.models.ledger import UserBalance
+from app.services.ledger import LedgerService
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"ledger_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+async def ledger_state(user_id: str, day):
+    async for session in app.dependency_overrides[get_db]():
+        return (
+            await LedgerService.current_balance(session, user_id),
+            await LedgerService.balance_before(session, user_id, day),
+            await LedgerService.find_drift(session, [user_id]),
+        )
+
+
+@pytest.mark.asyncio
+async def test_ledger_tracks_every_transaction_write(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+    now = datetime.utcnow()
+    today = now.date()
+
+    async def create(amount, kind, occurred_at):
+        response = await client.post(
+            "/api/v1/transactions/",
+            json={"amount": amount, "type": kind, "description": kind.title(), "occurred_at": occurred_at.isoformat()},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    await create(1000, "INCOME", now)
+    backdated = await create(200, "EXPENSE", now - timedelta(days=40))
+    groceries = await create(50, "EXPENSE", now)
+    assert await ledger_state(user_id, today) == (Decimal("750.00"), Decimal("-200.00"), [])
+
+    # Editing the amount and moving the date re-files the row.
+    response = await client.put(
+        f"/api/v1/transactions/{backdated}",
+        json={"amount": 250, "occurred_at": now.isoformat()},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert await ledger_state(user_id, today) == (Decimal("700.00"), Decimal("0"), [])
+
+    assert (await client.delete(f"/api/v1/transactions/{groceries}", headers=headers)).status_code == 200
+    response = await client.post("/api/v1/transactions/bulk-delete", json={"ids": [backdated]}, headers=headers)
+    assert response.status_code == 200
+    assert await ledger_state(user_id, today) == (Decimal("1000.00"), Decimal("0"), [])
+
+    summary = (await client.get("/api/v1/dashboard/summary", headers=headers)).json()
+    assert Decimal(summary["total_balance"]) == Decimal("1000")
+
+
+@pytest.mark.asyncio
+async def test_find_drift_and_rebuild(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+    response = await client.post(
+        "/api/v1/transactions/",
+        json={"amount": 300, "type": "INCOME", "description": "Salary"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+
+    async for session in app.dependency_overrides[get_db]():
+        await session.execute(update(UserBalance).where(UserBalance.user_id == user_id).values(balance=1))
+        drift = await LedgerService.find_drift(session, [user_id])
+        assert drift == [
+            {
+                "user_id": user_id,
+                "expected_balance": Decimal("300.00"),
+                "stored_balance": Decimal("1.00"),
+                "days_off": 0,
+            }
+        ]
+
+        await LedgerService.rebuild(session, [user_id])
+        assert await LedgerService.find_drift(session, [user_id]) == []
+        assert await LedgerService.current_balance(session, user_id) == Decimal("300.00")
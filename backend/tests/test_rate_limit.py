@@ -0,0 +1,88 @@
+import inspect
+import time
+
+import pytest
+from httpx import AsyncClient
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.middleware import client_address, create_limiter, enforce_rate_limit, rate_limit_key
+from app.main import app
+
+
+async def signup_token(client: AsyncClient, name: str) -> str:
+    email = f"ratelimit_{name}_{int(time.time() * 1000)}@example.com"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": "password123"},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+@pytest.fixture
+def swap_limiter():
+    original = app.state.limiter
+
+    def swap(**kwargs):
+        app.state.limiter = create_limiter(**kwargs)
+        return app.state.limiter
+
+    yield swap
+    app.state.limiter = original
+
+
+def make_request(headers: dict, client=("10.0.0.1", 1234)) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+            "client": client,
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_api_budget_is_per_user(client: AsyncClient, swap_limiter):
+    first = {"Authorization": f"Bearer {await signup_token(client, 'a')}"}
+    second = {"Authorization": f"Bearer {await signup_token(client, 'b')}"}
+    swap_limiter(storage="memory", default_limit="3/minute")
+
+    statuses = [(await client.get("/api/v1/categories/", headers=first)).status_code for _ in range(4)]
+    assert statuses == [200, 200, 200, 429]
+    # Another user behind the same address still has their own budget.
+    assert (await client.get("/api/v1/categories/", headers=second)).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_falls_back_to_memory(client: AsyncClient, swap_limiter):
+    headers = {"Authorization": f"Bearer {await signup_token(client, 'c')}"}
+    swap_limiter(storage="redis", redis_url="redis://127.0.0.1:1/0", default_limit="2/minute")
+
+    statuses = [(await client.get("/api/v1/categories/", headers=headers)).status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+
+
+def test_rate_limit_key(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_TRUSTED_PROXY_HOPS", 0)
+    assert rate_limit_key(make_request({})) == "ip:10.0.0.1"
+    assert rate_limit_key(make_request({"Authorization": "Bearer not-a-jwt"})) == "ip:10.0.0.1"
+    # Without trusted proxies the header is ignored: clients can write anything.
+    assert client_address(make_request({"X-Forwarded-For": "1.2.3.4"})) == "10.0.0.1"
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_TRUSTED_PROXY_HOPS", 1)
+    assert client_address(make_request({"X-Forwarded-For": "6.6.6.6, 203.0.113.7"})) == "203.0.113.7"
+    assert client_address(make_request({})) == "10.0.0.1"
+
+
+def test_limiter_entry_point_is_compatible():
+    # enforce_rate_limit relies on slowapi's private _check_request_limit.
+    assert list(inspect.signature(create_limiter()._check_request_limit).parameters) == [
+        "request",
+        "endpoint_func",
+        "in_middleware",
+    ]
+    # Blocking storage calls: FastAPI must run the dependency in the thread pool.
+    assert not inspect.iscoroutinefunction(enforce_rate_limit)
@@ -0,0 +1,154 @@
+from datetime import datetime
+from pathlib import Path
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, engine_options, get_db, get_read_db
+from app.main import app
+from app.models.timeline import TimelineEvent
+from app.models.transaction import Transaction
+from app.models.user import User
+
+REPLICA_DB_PATH = Path(__file__).resolve().parent / "test_money_manage_replica.db"
+REPLICA_DATABASE_URL = f"sqlite+aiosqlite:///{REPLICA_DB_PATH.as_posix()}"
+
+
+@pytest.fixture
+async def replica_sessionmaker():
+    replica_engine = create_async_engine(REPLICA_DATABASE_URL, **engine_options(REPLICA_DATABASE_URL))
+    async with replica_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    ReplicaSessionLocal = sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_read_db():
+        async with ReplicaSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    yield ReplicaSessionLocal
+    app.dependency_overrides.pop(get_read_db, None)
+    async with replica_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await replica_engine.dispose()
+    REPLICA_DB_PATH.unlink(missing_ok=True)
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"replica_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+def test_engine_options_per_driver():
+    sqlite_options = engine_options(REPLICA_DATABASE_URL)
+    assert "pool_size" not in sqlite_options
+
+    pg_options = engine_options("postgresql+asyncpg://u:p@replica/wealth_sync")
+    assert pg_options["pool_recycle"] > 0
+    assert "statement_cache_size" in pg_options["connect_args"]
+
+
+@pytest.mark.asyncio
+async def test_list_and_timeline_read_from_replica(client: AsyncClient, replica_sessionmaker):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    create_response = await client.post(
+        "/api/v1/transactions/",
+        json={
+            "amount": 45,
+            "type": "EXPENSE",
+            "description": "Coffee",
+            "occurred_at": datetime.utcnow().isoformat(),
+        },
+        headers=headers,
+    )
+    assert create_response.status_code == 201
+    created = create_response.json()
+
+    # Written to the primary only; the replica has not caught up yet.
+    list_response = await client.get("/api/v1/transactions/", headers=headers)
+    assert list_response.status_code == 200
+    assert list_response.json() == []
+
+    async with replica_sessionmaker() as replica:
+        await replica.execute(
+            insert(User).values(id=created["user_id"], email="replica@example.com", password_hash="x")
+        )
+        await replica.execute(
+            insert(Transaction).values(
+                id=created["id"],
+                user_id=created["user_id"],
+                amount=created["amount"],
+                type=created["type"],
+                description=created["description"],
+                occurred_at=datetime.fromisoformat(created["occurred_at"]),
+            )
+        )
+        # The derived timeline rows replicate along with the transaction.
+        async for primary in app.dependency_overrides[get_db]():
+            events = (
+                await primary.execute(select(TimelineEvent).where(TimelineEvent.user_id == created["user_id"]))
+            ).scalars().all()
+        await replica.execute(
+            insert(TimelineEvent),
+            [{column.key: getattr(event, column.key) for column in TimelineEvent.__table__.columns} for event in events],
+        )
+        await replica.commit()
+
+    list_response = await client.get("/api/v1/transactions/", headers=headers)
+    assert [row["id"] for row in list_response.json()] == [created["id"]]
+
+    timeline_response = await client.get("/api/v1/autopilot/timeline", headers=headers)
+    assert timeline_response.status_code == 200
+    transaction_titles = [
+        event["title"] for event in timeline_response.json()["events"] if event["type"] == "TRANSACTION"
+    ]
+    assert transaction_titles == ["Coffee"]
+
+
+@pytest.mark.asyncio
+async def test_cache_is_keyed_by_the_replica_version(client: AsyncClient, replica_sessionmaker):
+    headers = {"Authorization": f"Bearer {await signup_token(client)}"}
+    async for primary in app.dependency_overrides[get_db]():
+        user = (await primary.execute(select(User).where(User.email.like("replica_%")).order_by(User.created_at.desc()))).scalars().first()
+
+    # The replica has not seen the user yet: computed, but not cached.
+    response = await client.get("/api/v1/dashboard/summary", headers=headers)
+    assert response.status_code == 200
+    assert "X-Cache" not in response.headers
+
+    async with replica_sessionmaker() as replica:
+        await replica.execute(
+            insert(User).values(id=user.id, email=user.email, password_hash="x", data_version=user.data_version)
+        )
+        await replica.commit()
+
+    # A write reaches the primary only; the replica lags one version behind.
+    response = await client.post(
+        "/api/v1/transactions/",
+        json={"amount": 250, "type": "EXPENSE", "description": "Groceries"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    lagging = await client.get("/api/v1/dashboard/summary", headers=headers)
+    assert lagging.headers["X-Cache"] == "MISS"
+
+    # Once the replica catches up, the stale body is not served for the new version.
+    async with replica_sessionmaker() as replica:
+        await replica.execute(
+            update(User).where(User.id == user.id).values(data_version=User.data_version + 1)
+        )
+        await replica.commit()
+    caught_up = await client.get("/api/v1/dashboard/summary", headers=headers)
+    assert caught_up.headers["X-Cache"] == "MISS"
@@ -0,0 +1,94 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.services.recurrence import (
+    RecurrenceRule,
+    add_interval,
+    clear_expansion_cache,
+    expansion_cache_info,
+    monthly_multiplier,
+    normalize_frequency,
+)
+
+
+def test_monthly_rule_clamps_day_31_and_recovers():
+    rule = RecurrenceRule.from_frequency("monthly", date(2026, 1, 31))
+
+    assert rule.between(date(2026, 1, 1), date(2026, 4, 30)) == (
+        date(2026, 1, 31),
+        date(2026, 2, 28),
+        date(2026, 3, 31),
+        date(2026, 4, 30),
+    )
+
+
+def test_day_based_rules_skip_to_window_start():
+    weekly = RecurrenceRule.from_frequency("weekly", date(2026, 1, 5))
+    biweekly = RecurrenceRule.from_frequency("biweekly", date(2026, 1, 5))
+
+    assert weekly.between(date(2026, 3, 1), date(2026, 3, 20)) == (
+        date(2026, 3, 2),
+        date(2026, 3, 9),
+        date(2026, 3, 16),
+    )
+    assert biweekly.between(date(2026, 3, 1), date(2026, 3, 31)) == (
+        date(2026, 3, 2),
+        date(2026, 3, 16),
+        date(2026, 3, 30),
+    )
+
+
+def test_quarterly_and_yearly_rules():
+    quarterly = RecurrenceRule.from_frequency("quarterly", date(2025, 11, 30))
+    yearly = RecurrenceRule.from_frequency("annual", date(2024, 2, 29))
+
+    assert quarterly.between(date(2026, 1, 1), date(2026, 12, 31)) == (
+        date(2026, 2, 28),
+        date(2026, 5, 30),
+        date(2026, 8, 30),
+        date(2026, 11, 30),
+    )
+    assert yearly.next_occurrence(date(2025, 1, 1)) == date(2025, 2, 28)
+    assert yearly.next_occurrence(date(2028, 1, 1)) == date(2028, 2, 29)
+
+
+def test_window_before_anchor_and_empty_window():
+    rule = RecurrenceRule.from_frequency("monthly", date(2026, 6, 10))
+
+    assert rule.between(date(2026, 1, 1), date(2026, 5, 31)) == ()
+    assert rule.between(date(2026, 7, 1), date(2026, 6, 1)) == ()
+    assert rule.next_occurrence(date(2026, 1, 1)) == date(2026, 6, 10)
+
+
+def test_expansions_are_memoized_per_rule_and_window():
+    clear_expansion_cache()
+    rule = RecurrenceRule.from_frequency("weekly", date(2026, 1, 1))
+
+    first = rule.between(date(2026, 1, 1), date(2026, 12, 31))
+    second = RecurrenceRule.from_frequency("weekly", datetime(2026, 1, 1, 9, 30)).between(
+        datetime(2026, 1, 1, 18, 0), date(2026, 12, 31)
+    )
+
+    assert first is second
+    info = expansion_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_frequency_helpers():
+    assert normalize_frequency(" Fortnightly ") == "biweekly"
+    assert normalize_frequency("every-full-moon") == "monthly"
+    assert monthly_multiplier("quarterly") == Decimal("1") / Decimal("3")
+    assert add_interval(datetime(2026, 1, 31, 8, 0), "monthly") == datetime(2026, 2, 28, 8, 0)
+    assert add_interval(datetime(2026, 1, 31, 8, 0), "weekly") == datetime(2026, 2, 7, 8, 0)
+
+
+def test_chained_add_interval_keeps_pinned_day():
+    due = datetime(2026, 1, 31, 8, 0)
+    chain = []
+    for _ in range(3):
+        due = add_interval(due, "monthly", day_of_month=31)
+        chain.append(due)
+
+    assert chain == [datetime(2026, 2, 28, 8, 0), datetime(2026, 3, 31, 8, 0), datetime(2026, 4, 30, 8, 0)]
+    assert add_interval(datetime(2026, 2, 28), "quarterly", day_of_month=31) == datetime(2026, 5, 31)
@@ -0,0 +1,86 @@
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.cache import MemoryResponseCache
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"cache_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used_and_expired():
+    cache = MemoryResponseCache(max_entries=2)
+    await cache.set("a", b"1", ttl_seconds=60)
+    await cache.set("b", b"2", ttl_seconds=60)
+    assert await cache.get("a") == b"1"
+    await cache.set("c", b"3", ttl_seconds=60)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1"
+    await cache.set("d", b"4", ttl_seconds=0)
+    assert await cache.get("d") is None
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_are_invalidated_by_writes(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = await client.get("/api/v1/dashboard/summary", headers=headers)
+    second = await client.get("/api/v1/dashboard/summary", headers=headers)
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert first.json() == second.json()
+
+    # Different query parameters are cached separately.
+    monthly = await client.get("/api/v1/dashboard/summary", params={"chart_range": "month"}, headers=headers)
+    assert monthly.headers["X-Cache"] == "MISS"
+
+    response = await client.post(
+        "/api/v1/transactions/",
+        json={"amount": 250, "type": "EXPENSE", "description": "Groceries"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    transaction_id = response.json()["id"]
+
+    after_write = await client.get("/api/v1/dashboard/summary", headers=headers)
+    assert after_write.headers["X-Cache"] == "MISS"
+    assert float(after_write.json()["monthly_expenses"]) == 250
+
+    triage = await client.get("/api/v1/dashboard/triage", headers=headers)
+    assert triage.headers["X-Cache"] == "MISS"
+    assert (await client.get("/api/v1/dashboard/triage", headers=headers)).headers["X-Cache"] == "HIT"
+
+    # Set-based bulk writes bump the version too.
+    response = await client.post("/api/v1/transactions/bulk-delete", json={"ids": [transaction_id]}, headers=headers)
+    assert response.status_code == 200
+    after_bulk = await client.get("/api/v1/dashboard/summary", headers=headers)
+    assert after_bulk.headers["X-Cache"] == "MISS"
+    assert float(after_bulk.json()["monthly_expenses"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_is_per_user(client: AsyncClient):
+    first_headers = {"Authorization": f"Bearer {await signup_token(client)}"}
+    second_headers = {"Authorization": f"Bearer {await signup_token(client)}"}
+
+    await client.post(
+        "/api/v1/transactions/",
+        json={"amount": 99, "type": "EXPENSE", "description": "Lunch"},
+        headers=first_headers,
+    )
+    assert (await client.get("/api/v1/budgets/summary", headers=first_headers)).headers["X-Cache"] == "MISS"
+    other = await client.get("/api/v1/budgets/summary", headers=second_headers)
+    assert other.headers["X-Cache"] == "MISS"
+    assert float(other.json()["total_spent"]) == 0
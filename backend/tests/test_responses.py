@@ -0,0 +1,47 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.core.responses import ORJSONResponse, validated_json_response
+from app.models.transaction import Transaction
+from app.schemas.transaction import TransactionResponse
+
+
+def test_orjson_response_encodes_decimals_as_numbers():
+    response = ORJSONResponse(
+        {
+            "amount": Decimal("1234.50"),
+            "events": [{"date": date(2026, 3, 1), "at": datetime(2026, 3, 1, 9, 30)}],
+            "tags": {"rent"},
+            7: "non-string key",
+        }
+    )
+
+    assert response.media_type == "application/json"
+    assert orjson.loads(response.body) == {
+        "amount": 1234.5,
+        "events": [{"date": "2026-03-01", "at": "2026-03-01T09:30:00"}],
+        "tags": ["rent"],
+        "7": "non-string key",
+    }
+
+
+def test_validated_json_response_keeps_model_wire_format():
+    transaction = Transaction(
+        id="txn-1",
+        user_id="user-1",
+        amount=Decimal("45.00"),
+        type="EXPENSE",
+        description="Coffee",
+        occurred_at=datetime(2026, 3, 1, 8, 0),
+    )
+
+    response = validated_json_response(TypeAdapter(List[TransactionResponse]), [transaction])
+
+    payload = orjson.loads(response.body)
+    assert payload[0]["amount"] == "45.00"
+    assert payload[0]["occurred_at"] == "2026-03-01T08:00:00"
+    assert payload[0]["category"] is None
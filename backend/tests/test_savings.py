@@ -0,0 +1,134 @@
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert
+
+from app.core.database import get_db
+from app.main import app
+from app.models.savings import SavingsLog
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"savings_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_contributions_are_not_lost(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    goal = (
+        await client.post("/api/v1/goals/", json={"name": "Laptop", "target_amount": 250}, headers=headers)
+    ).json()
+
+    contributions = 300
+    responses = await asyncio.gather(
+        *(
+            client.post(
+                f"/api/v1/goals/{goal['id']}/contribute",
+                json={"amount": "1.25", "note": f"#{index}"},
+                headers=headers,
+            )
+            for index in range(contributions)
+        )
+    )
+    assert [response.status_code for response in responses] == [200] * contributions
+    # Only the contributions that reached the target see it completed.
+    completed = [response.json()["is_completed"] for response in responses]
+    assert completed.count(True) == contributions - 199
+
+    goals = (await client.get("/api/v1/goals/", headers=headers)).json()
+    assert Decimal(str(goals[0]["current_amount"])) == Decimal("375.00")
+    assert goals[0]["is_completed"] is True
+
+    progress = (await client.get(f"/api/v1/goals/{goal['id']}/progress", headers=headers)).json()
+    assert progress["contribution_count"] == contributions
+    assert Decimal(str(progress["total_contributed"])) == Decimal("375.00")
+
+
+@pytest.mark.asyncio
+async def test_contribute_to_missing_goal(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.post("/api/v1/goals/missing/contribute", json={"amount": 10}, headers=headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_goal_progress_and_paginated_logs(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    goal = (
+        await client.post(
+            "/api/v1/goals/",
+            json={"name": "House", "target_amount": 12000, "current_amount": 3000, "monthly_contribution": 500},
+            headers=headers,
+        )
+    ).json()
+
+    progress = (await client.get(f"/api/v1/goals/{goal['id']}/progress", headers=headers)).json()
+    assert progress["contribution_count"] == 0
+    assert progress["estimate_basis"] == "planned"  # 9000 left at 500 a month
+
+    # Three months of history: 1000 two months ago, 2 x 500 last month, 1000 now.
+    now = datetime.utcnow()
+    this_month = now.replace(day=1)
+    last_month = (this_month - timedelta(days=1)).replace(day=1)
+    two_months_ago = (last_month - timedelta(days=1)).replace(day=1)
+    async for session in app.dependency_overrides[get_db]():
+        await session.execute(
+            insert(SavingsLog),
+            [
+                {"goal_id": goal["id"], "amount": Decimal("1000"), "created_at": two_months_ago + timedelta(days=2)},
+                {"goal_id": goal["id"], "amount": Decimal("500"), "created_at": last_month + timedelta(days=3)},
+                {"goal_id": goal["id"], "amount": Decimal("500"), "created_at": last_month + timedelta(days=4)},
+            ],
+        )
+        await session.commit()
+    response = await client.post(f"/api/v1/goals/{goal['id']}/contribute", json={"amount": 1000}, headers=headers)
+    assert response.status_code == 200
+
+    response = await client.get(f"/api/v1/goals/{goal['id']}/progress", params={"months": 3}, headers=headers)
+    assert response.status_code == 200
+    progress = response.json()
+    assert progress["contribution_count"] == 4
+    assert Decimal(str(progress["total_contributed"])) == Decimal("3000")
+    assert Decimal(str(progress["average_contribution"])) == Decimal("750")
+    assert Decimal(str(progress["average_monthly_contribution"])) == Decimal("1000")
+    assert Decimal(str(progress["remaining"])) == Decimal("8000")
+    assert progress["progress_percent"] == pytest.approx(33.33)
+    assert [(month["count"], Decimal(str(month["total"]))) for month in progress["monthly"]] == [
+        (1, Decimal("1000")),
+        (2, Decimal("1000")),
+        (1, Decimal("1000")),
+    ]
+    assert progress["monthly"][-1]["month"] == now.strftime("%Y-%m")
+    # 8000 left at 1000 a month: about eight months out.
+    assert progress["estimate_basis"] == "history"
+    estimated = datetime.fromisoformat(progress["estimated_completion_date"]).date()
+    assert 240 <= (estimated - now.date()).days <= 245
+
+    first_page = (await client.get(f"/api/v1/goals/{goal['id']}/logs", params={"limit": 3}, headers=headers)).json()
+    second_page = (
+        await client.get(f"/api/v1/goals/{goal['id']}/logs", params={"skip": 3, "limit": 3}, headers=headers)
+    ).json()
+    assert len(first_page) == 3 and len(second_page) == 1
+    assert Decimal(str(second_page[0]["amount"])) == Decimal("1000")
+    assert second_page[0]["created_at"].startswith(two_months_ago.strftime("%Y-%m"))
+
+    other = await signup_token(client)
+    response = await client.get(
+        f"/api/v1/goals/{goal['id']}/progress", headers={"Authorization": f"Bearer {other}"}
+    )
+    assert response.status_code == 404
@@ -0,0 +1,119 @@
+import asyncio
+from datetime import datetime, timedelta
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert, select
+
+from app.core.database import get_db
+from app.main import app
+from app.models.subscription import SubscriptionUsageEvent
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"subscriptions_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_usage_is_not_lost(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    sub = (await client.post("/api/v1/subscriptions/", json={"name": "Gym", "amount": 900}, headers=headers)).json()
+
+    uses = 200
+    responses = await asyncio.gather(
+        *(client.post(f"/api/v1/subscriptions/{sub['id']}/log-usage", headers=headers) for _ in range(uses))
+    )
+    assert [response.status_code for response in responses] == [200] * uses
+    assert sorted(response.json()["usage_count"] for response in responses)[-1] == uses
+
+    batch = await client.post(
+        "/api/v1/subscriptions/usage",
+        json={"events": [{"subscription_id": sub["id"], "quantity": 3}, {"subscription_id": "missing"}]},
+        headers=headers,
+    )
+    assert batch.status_code == 200
+    assert batch.json()["recorded"] == 1
+    assert batch.json()["subscriptions"][0]["usage_count"] == uses + 3
+
+    analytics = (await client.get("/api/v1/subscriptions/analytics", headers=headers)).json()
+    assert analytics["items"][0]["windows"]["30d"]["uses"] == uses + 3
+
+    missing = await client.post("/api/v1/subscriptions/missing/log-usage", headers=headers)
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_usage_analytics_and_stale_triage(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    music = (await client.post("/api/v1/subscriptions/", json={"name": "Music", "amount": 300}, headers=headers)).json()
+    video = (await client.post("/api/v1/subscriptions/", json={"name": "Video", "amount": 600}, headers=headers)).json()
+    user_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+
+    # Video: heavily used 31-60 days ago, once since; music: used weekly lately.
+    now = datetime.utcnow()
+    rows = [
+        {"subscription_id": video["id"], "user_id": user_id, "used_at": now - timedelta(days=40 + day), "quantity": 1}
+        for day in range(10)
+    ]
+    rows.append({"subscription_id": video["id"], "user_id": user_id, "used_at": now - timedelta(days=5), "quantity": 1})
+    rows += [
+        {"subscription_id": music["id"], "user_id": user_id, "used_at": now - timedelta(days=7 * week + 1), "quantity": 1}
+        for week in range(4)
+    ]
+    async for session in app.dependency_overrides[get_db]():
+        await session.execute(insert(SubscriptionUsageEvent), rows)
+        await session.commit()
+
+    response = await client.get("/api/v1/subscriptions/analytics", headers=headers)
+    assert response.status_code == 200
+    analytics = response.json()
+    items = {item["name"]: item for item in analytics["items"]}
+    assert analytics["total_monthly_cost"] == 900.0
+    assert items["Music"]["windows"]["30d"] == {"uses": 4, "cost": 300.0, "cost_per_use": 75.0}
+    assert items["Music"]["trend"] == "rising"
+    assert items["Video"]["windows"]["30d"] == {"uses": 1, "cost": 600.0, "cost_per_use": 600.0}
+    assert items["Video"]["windows"]["90d"] == {"uses": 11, "cost": 1800.0, "cost_per_use": 163.64}
+    assert items["Video"]["trend"] == "falling"
+    assert items["Video"]["trend_previous_uses"] == 10
+
+    # Only one use in the last 30 days, despite eleven in total.
+    triage = (await client.get("/api/v1/dashboard/triage", headers=headers)).json()
+    stale = [action for action in triage["actions"] if action["area"] == "subscriptions"]
+    assert [action["title"] for action in stale] == ["Low-usage subscription: Video"]
+
+
+@pytest.mark.asyncio
+async def test_usage_batch_converts_offsets_and_rejects_future(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    gym = (await client.post("/api/v1/subscriptions/", json={"name": "Gym", "amount": 900}, headers=headers)).json()
+
+    response = await client.post(
+        "/api/v1/subscriptions/usage",
+        json={"events": [{"subscription_id": gym["id"], "used_at": "2026-03-01T09:00:00+05:30"}]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    async for session in app.dependency_overrides[get_db]():
+        used_at = await session.scalar(
+            select(SubscriptionUsageEvent.used_at).where(SubscriptionUsageEvent.subscription_id == gym["id"])
+        )
+    assert used_at == datetime(2026, 3, 1, 3, 30)
+
+    future = (datetime.utcnow() + timedelta(hours=1)).isoformat()
+    response = await client.post(
+        "/api/v1/subscriptions/usage",
+        json={"events": [{"subscription_id": gym["id"], "used_at": future}]},
+        headers=headers,
+    )
+    assert response.status_code == 422
@@ -0,0 +1,172 @@
+from datetime import datetime, timedelta
+import json
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core.database import get_db
+from app.main import app
+from app.models.autopilot_payment import AutopilotPayment
+from app.models.bill import Bill
+from app.models.budget import BudgetCategory
+from app.models.income import IncomeSource
+from app.models.savings import SavingsGoal
+from app.models.subscription import Subscription
+from app.models.transaction import Transaction
+from app.services.autopilot import AutopilotService
+from app.services.ledger import LedgerService
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"timeline_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+async def reference_timeline(user_id: str, days_past: int, days_future: int) -> dict:
+    """The timeline rebuilt from scratch by the pure builder."""
+    now = datetime.utcnow()
+    start_date, end_date = now - timedelta(days=days_past), now + timedelta(days=days_future)
+    async for session in app.dependency_overrides[get_db]():
+
+        async def rows(model, *criteria):
+            return (await session.execute(select(model).filter(model.user_id == user_id, *criteria))).scalars().all()
+
+        return AutopilotService.build_timeline(
+            now=now,
+            start_date=start_date,
+            end_date=end_date,
+            categories=await rows(BudgetCategory),
+            payment_orders=await rows(
+                AutopilotPayment,
+                AutopilotPayment.due_on >= start_date.date(),
+                AutopilotPayment.due_on <= end_date.date(),
+            ),
+            transactions=await rows(Transaction, Transaction.occurred_at >= start_date, Transaction.occurred_at <= now),
+            current_balance=await LedgerService.current_balance(session, user_id),
+            bills=await rows(Bill),
+            subscriptions=await rows(Subscription, Subscription.is_active == True),
+            goals=await rows(SavingsGoal, SavingsGoal.is_completed == False),
+            income_sources=await rows(IncomeSource, IncomeSource.active == True),
+        )
+
+
+def canonical(events: list) -> list:
+    return sorted(json.dumps(event, sort_keys=True) for event in events)
+
+
+@pytest.mark.asyncio
+async def test_timeline_index_follows_writes(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+    now = datetime.utcnow()
+
+    await client.post("/api/v1/income/", json={"amount": 50000, "frequency": "monthly", "payday": "1"}, headers=headers)
+    category_id = (await client.post("/api/v1/categories/", json={"name": "Food"}, headers=headers)).json()["id"]
+    bill = (
+        await client.post(
+            "/api/v1/bills/",
+            json={"name": "Rent", "amount_estimated": 15000, "due_day": now.day, "autopay_enabled": True},
+            headers=headers,
+        )
+    ).json()
+    await client.post("/api/v1/subscriptions/", json={"name": "Music", "amount": 199}, headers=headers)
+    await client.post("/api/v1/goals/", json={"name": "Trip", "target_amount": 60000, "monthly_contribution": 5000}, headers=headers)
+    transaction_ids = []
+    for days_ago, amount, kind in [(0, 450, "EXPENSE"), (2, 1200, "EXPENSE"), (3, 80, "EXPENSE"), (20, 50000, "INCOME")]:
+        response = await client.post(
+            "/api/v1/transactions/",
+            json={
+                "amount": amount,
+                "type": kind,
+                "description": f"{kind.title()} {days_ago}",
+                "occurred_at": (now - timedelta(days=days_ago)).isoformat(),
+            },
+            headers=headers,
+        )
+        transaction_ids.append(response.json()["id"])
+
+    # Reads after each kind of write: ORM edits and deletes, Core bulk updates,
+    # a bill change and a paid payment order.
+    writes = [
+        await client.put(f"/api/v1/transactions/{transaction_ids[0]}", json={"description": "Groceries"}, headers=headers),
+        await client.delete(f"/api/v1/transactions/{transaction_ids[2]}", headers=headers),
+        await client.patch(
+            "/api/v1/transactions/bulk",
+            json={"ids": transaction_ids[:2], "category_id": category_id},
+            headers=headers,
+        ),
+        await client.put(f"/api/v1/bills/{bill['id']}", json={"amount_estimated": 16000}, headers=headers),
+    ]
+    assert [response.status_code for response in writes] == [200, 200, 200, 200]
+    prepared = (await client.post("/api/v1/autopilot/payments/prepare", params={"days_ahead": 1}, headers=headers)).json()
+    order = next(item for item in prepared["items"] if item["source_id"] == bill["id"])
+    approved = await client.post(
+        f"/api/v1/autopilot/payments/{order['id']}/approve", json={"execute_now": True}, headers=headers
+    )
+    assert approved.json()["item"]["status"] == "succeeded"
+
+    for days_past, days_future in [(7, 30), (30, 365)]:
+        response = await client.get(
+            "/api/v1/autopilot/timeline",
+            params={"days_past": days_past, "days_future": days_future},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        timeline = response.json()
+        expected = await reference_timeline(user_id, days_past, days_future)
+        assert canonical(timeline["events"]) == canonical(expected["events"])
+        assert timeline["summary"] == expected["summary"]
+        assert timeline["next_cursor"] is None
+
+    rent = [event for event in timeline["events"] if event["type"] == "BILL_DUE"]
+    assert rent[0]["amount"] == -16000.0
+    assert rent[0]["is_completed"] is True
+    titles = {event["title"]: event for event in timeline["events"] if event["type"] == "TRANSACTION"}
+    assert "Expense 3" not in titles
+    assert titles["Groceries"]["details"]["category"] == "Food"
+
+
+@pytest.mark.asyncio
+async def test_timeline_cursor_pagination(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    now = datetime.utcnow()
+
+    await client.post("/api/v1/income/", json={"amount": 40000, "frequency": "monthly", "payday": "5"}, headers=headers)
+    await client.post("/api/v1/subscriptions/", json={"name": "Video", "amount": 499}, headers=headers)
+    await client.post("/api/v1/goals/", json={"name": "Car", "target_amount": 90000, "monthly_contribution": 3000}, headers=headers)
+    for index in range(5):
+        await client.post(
+            "/api/v1/transactions/",
+            json={"amount": 100 + index, "type": "EXPENSE", "occurred_at": (now - timedelta(hours=index)).isoformat()},
+            headers=headers,
+        )
+
+    params = {"days_past": 7, "days_future": 120}
+    full = (await client.get("/api/v1/autopilot/timeline", params=params, headers=headers)).json()
+
+    pages, cursor = [], None
+    while True:
+        page_params = {**params, "limit": 3, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/api/v1/autopilot/timeline", params=page_params, headers=headers)).json()
+        assert len(page["events"]) <= 3
+        assert page["summary"] == full["summary"]
+        pages.extend(page["events"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == full["events"]
+    assert {event["type"] for event in pages} >= {"TRANSACTION", "SUBSCRIPTION", "SALARY", "GOAL_CONTRIBUTION"}
+
+    bad = await client.get("/api/v1/autopilot/timeline", params={"cursor": "not-a-cursor", "limit": 3}, headers=headers)
+    assert bad.status_code == 400
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.database import get_db
+from app.main import app
+from app.models.transaction import Transaction
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"tx_bulk_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+async def create_expense(client: AsyncClient, headers: dict, description: str) -> str:
+    response = await client.post(
+        "/api/v1/transactions/",
+        json={"amount": 100, "type": "EXPENSE", "description": description},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_recategorize_and_delete_are_scoped_to_user(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    other_headers = {"Authorization": f"Bearer {await signup_token(client)}"}
+
+    ids = [await create_expense(client, headers, f"Expense {index}") for index in range(3)]
+    foreign_id = await create_expense(client, other_headers, "Not mine")
+    category_id = (await client.post("/api/v1/categories/", json={"name": "Food"}, headers=headers)).json()["id"]
+
+    response = await client.patch(
+        "/api/v1/transactions/bulk",
+        json={"ids": ids + [foreign_id], "category_id": category_id},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["matched"] == 3
+    assert response.json()["updated"] == 3
+
+    listed = (await client.get("/api/v1/transactions/", headers=headers)).json()
+    assert {item["category_id"] for item in listed} == {category_id}
+    foreign = (await client.get("/api/v1/transactions/", headers=other_headers)).json()
+    assert foreign[0]["category_id"] is None
+
+    response = await client.patch(
+        "/api/v1/transactions/bulk",
+        json={"ids": ids, "category_id": str(uuid4())},
+        headers=headers,
+    )
+    assert response.status_code == 404
+
+    response = await client.post(
+        "/api/v1/transactions/bulk-delete",
+        json={"ids": ids[:2] + [foreign_id]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] == 2
+    assert [item["id"] for item in (await client.get("/api/v1/transactions/", headers=headers)).json()] == [ids[2]]
+    assert len((await client.get("/api/v1/transactions/", headers=other_headers)).json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_complete_updates_bills_and_subscriptions(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+
+    bill_id = (
+        await client.post(
+            "/api/v1/bills/",
+            json={"name": "Rent", "amount_estimated": 600, "due_day": 10},
+            headers=headers,
+        )
+    ).json()["id"]
+    subscription_id = (
+        await client.post(
+            "/api/v1/subscriptions/",
+            json={"name": "Music", "amount": 199, "billing_cycle": "yearly"},
+            headers=headers,
+        )
+    ).json()["id"]
+
+    pending_ids = [str(uuid4()), str(uuid4())]
+    async for session in app.dependency_overrides[get_db]():
+        session.add_all(
+            [
+                Transaction(id=pending_ids[0], user_id=user_id, amount=600, type="EXPENSE", status="pending", bill_id=bill_id),
+                Transaction(id=pending_ids[1], user_id=user_id, amount=199, type="EXPENSE", status="pending", subscription_id=subscription_id),
+            ]
+        )
+        await session.commit()
+    completed_id = await create_expense(client, headers, "Already paid")
+
+    response = await client.patch(
+        "/api/v1/transactions/bulk",
+        json={"ids": pending_ids + [completed_id], "status": "completed"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json() == {"matched": 3, "updated": 2, "bills_updated": 1, "subscriptions_updated": 1}
+
+    pending = (await client.get("/api/v1/transactions/", params={"status": "pending"}, headers=headers)).json()
+    assert pending == []
+    bill = next(item for item in (await client.get("/api/v1/bills/", headers=headers)).json() if item["id"] == bill_id)
+    assert bill["last_paid_at"] is not None
+    subscription = (await client.get("/api/v1/subscriptions/", headers=headers)).json()[0]
+    next_billing = datetime.fromisoformat(subscription["next_billing_date"])
+    assert next_billing - datetime.utcnow() > timedelta(days=360)
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+from httpx import AsyncClient
+
+
+async def signup_token(client: AsyncClient) -> str:
+    email = f"search_{int(time.time() * 1000)}@example.com"
+    password = "password123"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+async def create_transactions(client: AsyncClient, headers: dict, descriptions: list[str]) -> None:
+    for description in descriptions:
+        response = await client.post(
+            "/api/v1/transactions/",
+            json={"amount": 100, "type": "EXPENSE", "description": description},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+
+async def search(client: AsyncClient, headers: dict, term: str, mode: str) -> list[str]:
+    response = await client.get(
+        "/api/v1/transactions/",
+        params={"search": term, "search_mode": mode},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    return [item["description"] for item in response.json()]
+
+
+@pytest.mark.asyncio
+async def test_transaction_search_modes(client: AsyncClient):
+    token = await signup_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    await create_transactions(
+        client,
+        headers,
+        ["Groceries at FreshMart", "Coffee with team", "Monthly grocery run", "Uber to airport"],
+    )
+
+    assert set(await search(client, headers, "gro", "contains")) == {"Groceries at FreshMart", "Monthly grocery run"}
+    assert set(await search(client, headers, "gro", "prefix")) == {"Groceries at FreshMart", "Monthly grocery run"}
+    assert await search(client, headers, "fresh gro", "prefix") == ["Groceries at FreshMart"]
+    # "port" is inside "airport" but does not start a word.
+    assert await search(client, headers, "port", "prefix") == []
+    assert (await search(client, headers, "airport", "contains")) == ["Uber to airport"]
+
+    fuzzy = await search(client, headers, "grocerys", "fuzzy")
+    # The closer spelling ranks first; unrelated rows share no trigrams.
+    assert fuzzy == ["Monthly grocery run", "Groceries at FreshMart"]
+
+    # Updates and deletes keep the search index in sync.
+    transactions = (await client.get("/api/v1/transactions/", headers=headers)).json()
+    coffee = next(item for item in transactions if item["description"] == "Coffee with team")
+    response = await client.put(
+        f"/api/v1/transactions/{coffee['id']}",
+        json={"description": "Espresso with team"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert await search(client, headers, "espresso", "prefix") == ["Espresso with team"]
+    assert await search(client, headers, "coffee", "fuzzy") == []
+
+    response = await client.get(
+        "/api/v1/transactions/",
+        params={"search": "x", "search_mode": "regex"},
+        headers=headers,
+    )
+    assert response.status_code == 422
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.models import Transaction, User
+from benchmarks.workload import WorkloadSpec, generate_user_rows, seed
+
+
+def test_generator_is_deterministic_per_seed():
+    now = datetime(2026, 3, 1)
+    spec = WorkloadSpec(users=2, transactions_per_user=50, seed=7)
+
+    first = generate_user_rows(spec, 1, "hash", now)
+    second = generate_user_rows(spec, 1, "hash", now)
+    other_seed = generate_user_rows(WorkloadSpec(users=2, transactions_per_user=50, seed=8), 1, "hash", now)
+
+    assert first == second
+    assert first[User][0]["id"] != other_seed[User][0]["id"]
+    assert len(first[Transaction]) == 50
+
+
+@pytest.mark.asyncio
+async def test_seed_bulk_inserts_all_tables(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'workload.db').as_posix()}")
+    try:
+        counts = await seed(engine, WorkloadSpec(users=3, transactions_per_user=40, months=2), create_schema=True)
+
+        async with engine.connect() as conn:
+            users = (await conn.execute(select(func.count()).select_from(User))).scalar()
+            transactions = (await conn.execute(select(func.count()).select_from(Transaction))).scalar()
+    finally:
+        await engine.dispose()
+
+    assert users == counts["users"] == 3
+    assert transactions == counts["transactions"] == 120
+    assert counts["bills"] > 0 and counts["autopilot_payments"] > 0
+
+
+def test_service_benchmark_cases_run_on_small_dataset():
+    from benchmarks.bench_services import CASES, build_dataset
+
+    data = build_dataset(200)
+
+    assert len(data.transactions) == 200
+    for name, case in CASES.items():
+        assert case(data)() is not None, name
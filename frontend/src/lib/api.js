@@ -12,8 +12,56 @@ const api = axios.create({
   timeout: 15000, // 15 seconds
 });
 
+const TOKEN_KEY = 'token';
+const REFRESH_TOKEN_KEY = 'refresh_token';
+
+export function storeTokens({ access_token, refresh_token }) {
+  localStorage.setItem(TOKEN_KEY, access_token);
+  if (refresh_token) {
+    localStorage.setItem(REFRESH_TOKEN_KEY, refresh_token);
+  }
+}
+
+export function clearTokens() {
+  localStorage.removeItem(TOKEN_KEY);
+  localStorage.removeItem(REFRESH_TOKEN_KEY);
+}
+
+export function getAccessToken() {
+  return localStorage.getItem(TOKEN_KEY);
+}
+
+export function getRefreshToken() {
+  return localStorage.getItem(REFRESH_TOKEN_KEY);
+}
+
+// Access tokens are short-lived. On a 401 the refresh token is spent once
+// (shared by every request that failed meanwhile) and the request retried.
+let refreshing = null;
+
+function refreshAccessToken() {
+  if (!refreshing) {
+    const refreshToken = getRefreshToken();
+    refreshing = (
+      refreshToken
+        ? axios.post(`${API_BASE_URL}/auth/refresh`, { refresh_token: refreshToken }, { withCredentials: true, timeout: 15000 })
+        : Promise.reject(new Error('No refresh token'))
+    )
+      .then((res) => {
+        storeTokens(res.data);
+        return res.data.access_token;
+      })
+      .finally(() => {
+        refreshing = null;
+      });
+  }
+  return refreshing;
+}
+
+const NO_REFRESH_URLS = ['/auth/login', '/auth/signup', '/auth/refresh', '/auth/logout'];
+
 api.interceptors.request.use((config) => {
-  const token = localStorage.getItem('token');
+  const token = getAccessToken();
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
@@ -22,10 +70,26 @@ api.interceptors.request.use((config) => {
 
 api.interceptors.response.use(
   (response) => response,
-  (error) => {
+  async (error) => {
     const status = error?.response?.status;
+    const original = error?.config;
+    if (
+      status === 401 &&
+      original &&
+      !original._retried &&
+      !NO_REFRESH_URLS.some((url) => original.url?.startsWith(url))
+    ) {
+      original._retried = true;
+      try {
+        const token = await refreshAccessToken();
+        original.headers.Authorization = `Bearer ${token}`;
+        return api(original);
+      } catch {
+        // Fall through: the session is over.
+      }
+    }
     if (status === 401) {
-      localStorage.removeItem('token');
+      clearTokens();
       window.dispatchEvent(new CustomEvent('auth:unauthorized'));
     }
     return Promise.reject(error);
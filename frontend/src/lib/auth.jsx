@@ -1,7 +1,7 @@
 /* eslint-disable react-refresh/only-export-components */
 import React, { createContext, useCallback, useContext, useEffect, useMemo, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import api from './api.js';
+import api, { clearTokens, getAccessToken, storeTokens } from './api.js';
 
 const AuthContext = createContext(null);
 
@@ -12,7 +12,7 @@ export function AuthProvider({ children }) {
 
   useEffect(() => {
     const onUnauthorized = () => {
-      localStorage.removeItem('token');
+      clearTokens();
       setUser(null);
       // Don't force navigate here. RequireAuth will handle protected routes.
       // This prevents redirecting users from public pages (like Landing) if their stale token fails.
@@ -38,7 +38,7 @@ export function AuthProvider({ children }) {
         const res = await api.get('/auth/me');
         if (!cancelled) setUser(res.data);
       } catch {
-        localStorage.removeItem('token');
+        clearTokens();
         if (!cancelled) setUser(null);
       } finally {
         if (!cancelled) setIsLoading(false);
@@ -51,15 +51,21 @@ export function AuthProvider({ children }) {
     };
   }, []);
 
-  const login = useCallback(async (token, redirectTo = '/dashboard') => {
-    localStorage.setItem('token', token);
+  const login = useCallback(async (tokens, redirectTo = '/dashboard') => {
+    storeTokens(tokens);
     const res = await api.get('/auth/me');
     setUser(res.data);
     navigate(redirectTo, { replace: true });
   }, [navigate]);
 
   const logout = useCallback(() => {
-    localStorage.removeItem('token');
+    const token = getAccessToken();
+    if (token) {
+      // Best effort: ends the session server-side; the local logout does not wait for it.
+      // The header is set here because the request interceptor runs after clearTokens().
+      api.post('/auth/logout', null, { headers: { Authorization: `Bearer ${token}` } }).catch(() => {});
+    }
+    clearTokens();
     setUser(null);
     navigate('/login', { replace: true });
   }, [navigate]);
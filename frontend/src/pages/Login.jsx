@@ -37,7 +37,7 @@ export default function Login() {
         },
       });
 
-      await login(response.data.access_token, redirectTo);
+      await login(response.data, redirectTo);
     } catch (err) {
       const status = err?.response?.status;
       const detail = err?.response?.data?.detail;
@@ -34,7 +34,7 @@ export default function Signup() {
 
     try {
       const res = await api.post('/auth/signup', { email, password });
-      await login(res.data.access_token, '/dashboard');
+      await login(res.data, '/dashboard');
     } catch (err) {
       const detail = err?.response?.data?.detail;
       setError(detail || 'Signup failed. Please try again.');
@@ -7,7 +7,7 @@ import { Switch } from '../../components/ui/Switch.jsx'; // Switch is visual onl
 import { User, Shield, Bell } from 'lucide-react';
 import { userService } from '../../services/user.js';
 import { useAuth } from '../../lib/auth.jsx';
-import { API_ORIGIN } from '../../lib/api.js';
+import { API_ORIGIN, storeTokens } from '../../lib/api.js';
 
 export default function Settings() {
   const { refreshUser } = useAuth();
@@ -84,10 +84,12 @@ export default function Settings() {
           return;
       }
       try {
-          await userService.changePassword({ 
+          const result = await userService.changePassword({ 
               old_password: passwordData.old_password, 
               new_password: passwordData.new_password 
           });
+          // Changing the password ends every session; this one continues with the new tokens.
+          if (result?.access_token) storeTokens(result);
           setMessage({ type: 'success', text: 'Password changed successfully.' });
           setPasswordData({ old_password: '', new_password: '', confirm_password: '' });
       } catch (err) {